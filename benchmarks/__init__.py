@@ -0,0 +1,8 @@
+"""Benchmarks for mxm-config.
+
+Run the suite from the repository root:
+
+```bash
+python -m benchmarks.run --help
+```
+"""
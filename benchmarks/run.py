@@ -0,0 +1,388 @@
+"""Benchmark the public mxm-config API against synthetic stores.
+
+For every benchmark the suite reports per-call latency (min, median, p95,
+mean), throughput and the peak memory allocated by one call (measured with
+`tracemalloc` in a separate, untimed call).
+
+Benchmarks
+----------
+- `load_config[cold]`   : every call starts with empty in-process caches.
+- `load_config[warm]`   : parsed layers are cached; merge and resolve run.
+- `load_config[cached]` : `cache=True` result memoization hit.
+- `load_config[frozen]` : warm load with `backend="frozen"`.
+- `load_config[provenance]` : warm load recording per-leaf provenance. Its
+  latency and peak KiB against `load_config[warm]` are the cost of the record.
+- `load_configs`        : batch load of `--batch` identities, cold caches.
+- `attach_config`       : attach to a config published in shared memory.
+- `make_view`           : read-only view of a top-level subtree.
+- `select`              : dotted lookup of the deepest first leaf.
+- `make_subconfig`      : build a config from plain resolved data.
+- `to_config_data`      : convert a resolved config to plain data.
+
+Usage
+-----
+```bash
+python -m benchmarks.run
+python -m benchmarks.run --depth 4 --breadth 5 --repeat 50
+python -m benchmarks.run --sweep breadth=2,4,8 --json results.json
+```
+
+A sweep runs the suite once per value and prints each benchmark's median
+relative to the first value next to the relative store size, which makes
+superlinear scaling easy to spot.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, cast
+
+from benchmarks.synthetic_store import StoreSpec, generate_store, identity_for
+from mxm.config import (
+    Provenance,
+    attach_config,
+    load_config,
+    load_configs,
+    make_subconfig,
+    make_view,
+    select,
+    share_config,
+    to_config_data,
+)
+from mxm.config.loader import clear_cache
+from mxm.config.shared import segment_name, unlink_shared_config
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    """Latency and memory statistics of one benchmark."""
+
+    name: str
+    repeat: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    mean_ms: float
+    ops_per_sec: float
+    peak_kib: float
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    repeat: int,
+    warmup: int,
+    setup: Callable[[], None] | None = None,
+) -> BenchResult:
+    """Time `func` `repeat` times and measure its peak allocation once.
+
+    Parameters
+    ----------
+    name
+        Benchmark name used in reports.
+    func
+        Zero-argument callable to benchmark.
+    repeat
+        Number of timed calls.
+    warmup
+        Number of untimed calls before timing.
+    setup
+        Optional untimed callable run before every call (for example to clear
+        caches for cold measurements).
+
+    Returns
+    -------
+    BenchResult
+        Timing statistics in milliseconds and peak allocated KiB.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    samples: list[float] = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter_ns()
+            func()
+            samples.append((time.perf_counter_ns() - start) / 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return BenchResult(
+        name=name,
+        repeat=repeat,
+        min_ms=samples[0],
+        median_ms=statistics.median(samples),
+        p95_ms=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        mean_ms=mean,
+        ops_per_sec=1000.0 / mean if mean else float("inf"),
+        peak_kib=peak / 1024,
+    )
+
+
+def run_suite(
+    spec: StoreSpec,
+    *,
+    repeat: int,
+    warmup: int,
+    batch: int,
+) -> list[BenchResult]:
+    """Generate a store for `spec` and run every benchmark against it."""
+    with tempfile.TemporaryDirectory(prefix="mxm-config-bench-") as tmp:
+        store_root = Path(tmp)
+        generate_store(store_root, spec)
+        identity = identity_for(spec)
+        identities = [identity_for(spec, index) for index in range(batch)]
+
+        def _load(**kwargs: Any) -> Callable[[], object]:
+            return lambda: load_config(
+                identity=identity, store_root=store_root, **kwargs
+            )
+
+        clear_cache()
+        cfg = load_config(identity=identity, store_root=store_root)
+        data = to_config_data(cfg)
+        view_path = next(iter(data))
+        leaf_path = _first_leaf_path(data)
+        shared_name = cast(str, segment_name(share_config(cfg)))
+
+        results = [
+            measure(
+                "load_config[cold]",
+                _load(),
+                repeat=repeat,
+                warmup=warmup,
+                setup=clear_cache,
+            ),
+            measure("load_config[warm]", _load(), repeat=repeat, warmup=warmup),
+            measure(
+                "load_config[cached]",
+                _load(cache=True),
+                repeat=repeat,
+                warmup=max(warmup, 1),
+            ),
+            measure(
+                "load_config[frozen]",
+                _load(backend="frozen"),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "load_config[provenance]",
+                _load(provenance=Provenance()),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "load_configs",
+                lambda: load_configs(identities, store_root=store_root),
+                repeat=repeat,
+                warmup=warmup,
+                setup=clear_cache,
+            ),
+            measure(
+                "attach_config",
+                lambda: attach_config(shared_name),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "make_view",
+                lambda: make_view(cfg, view_path),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "select",
+                lambda: select(cfg, leaf_path),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "make_subconfig",
+                lambda: make_subconfig(data),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+            measure(
+                "to_config_data",
+                lambda: to_config_data(cfg),
+                repeat=repeat,
+                warmup=warmup,
+            ),
+        ]
+        unlink_shared_config(shared_name)
+        clear_cache()
+        return results
+
+
+def _first_leaf_path(data: Mapping[str, Any]) -> str:
+    """Return the dotted path of the leaf reached by following first keys."""
+    segments: list[str] = []
+    node: object = data
+    while isinstance(node, Mapping) and node:
+        key, node = next(iter(cast(Mapping[str, object], node).items()))
+        segments.append(key)
+    return ".".join(segments)
+
+
+def format_table(results: Sequence[BenchResult]) -> str:
+    """Render results as a fixed-width text table."""
+    header = (
+        f"{'benchmark':<25}{'min ms':>10}{'median ms':>11}{'p95 ms':>10}"
+        f"{'ops/s':>11}{'peak KiB':>11}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<25}{result.min_ms:>10.3f}{result.median_ms:>11.3f}"
+            f"{result.p95_ms:>10.3f}{result.ops_per_sec:>11.1f}"
+            f"{result.peak_kib:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_scaling(
+    parameter: str,
+    runs: Sequence[tuple[StoreSpec, list[BenchResult]]],
+) -> str:
+    """Render median latency relative to the first run of a sweep."""
+    base_spec, base_results = runs[0]
+    values = [getattr(spec, parameter) for spec, _ in runs]
+    header = f"{'benchmark':<25}" + "".join(
+        f"{f'{parameter}={value}':>14}" for value in values
+    )
+    size_row = f"{'(leaves)':<25}" + "".join(
+        f"{spec.leaves / base_spec.leaves:>13.1f}x" for spec, _ in runs
+    )
+    lines = [header, "-" * len(header), size_row]
+    for index, base in enumerate(base_results):
+        row = f"{base.name:<25}"
+        for _, results in runs:
+            ratio = results[index].median_ms / base.median_ms if base.median_ms else 0
+            row += f"{ratio:>13.1f}x"
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def _parse_sweep(value: str) -> tuple[str, list[int | float]]:
+    parameter, _, raw_values = value.partition("=")
+    fields = StoreSpec.__dataclass_fields__
+    if parameter not in fields or parameter in ("app", "seed") or not raw_values:
+        raise argparse.ArgumentTypeError(
+            f"Expected PARAM=V1,V2,... with PARAM one of: "
+            f"{', '.join(name for name in fields if name not in ('app', 'seed'))}"
+        )
+    convert = float if parameter.endswith(("density", "fraction")) else int
+    return parameter, [convert(item) for item in raw_values.split(",")]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    defaults = StoreSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark mxm-config against synthetic configuration stores.",
+    )
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--breadth", type=int, default=defaults.breadth)
+    parser.add_argument("--selectors", type=int, default=defaults.selectors)
+    parser.add_argument("--list-size", type=int, default=defaults.list_size)
+    parser.add_argument(
+        "--interpolation-density",
+        type=float,
+        default=defaults.interpolation_density,
+    )
+    parser.add_argument(
+        "--overlay-fraction", type=float, default=defaults.overlay_fraction
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=10, help="Timed calls.")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls.")
+    parser.add_argument(
+        "--batch", type=int, default=8, help="Identities for load_configs."
+    )
+    parser.add_argument(
+        "--sweep",
+        type=_parse_sweep,
+        metavar="PARAM=V1,V2,...",
+        help="Run the suite once per value of one spec parameter.",
+    )
+    parser.add_argument(
+        "--json", type=Path, metavar="PATH", help="Also write results as JSON."
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    spec = StoreSpec(
+        depth=args.depth,
+        breadth=args.breadth,
+        selectors=args.selectors,
+        list_size=args.list_size,
+        interpolation_density=args.interpolation_density,
+        overlay_fraction=args.overlay_fraction,
+        seed=args.seed,
+    )
+
+    specs = [spec]
+    if args.sweep is not None:
+        parameter, values = args.sweep
+        specs = [replace(spec, **{parameter: value}) for value in values]
+
+    runs: list[tuple[StoreSpec, list[BenchResult]]] = []
+    for run_spec in specs:
+        results = run_suite(
+            run_spec, repeat=args.repeat, warmup=args.warmup, batch=args.batch
+        )
+        runs.append((run_spec, results))
+        print(f"\n{run_spec.describe()} leaves={run_spec.leaves}")
+        print(format_table(results))
+
+    if args.sweep is not None and len(runs) > 1:
+        print(f"\nMedian latency relative to {args.sweep[0]}={args.sweep[1][0]}")
+        print(format_scaling(args.sweep[0], runs))
+
+    if args.json is not None:
+        payload = [
+            {
+                "spec": run_spec.describe(),
+                "results": [asdict(result) for result in results],
+            }
+            for run_spec, results in runs
+        ]
+        args.json.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
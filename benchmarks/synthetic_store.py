@@ -0,0 +1,183 @@
+"""Synthetic configuration store generator for benchmarks.
+
+Builds a store with the standard layout
+
+```text
+<root>/apps/<app>/
+├── default.yaml
+├── environment.yaml
+├── machine.yaml
+├── substrate.yaml
+└── role.yaml
+```
+
+whose size and shape are controlled by a `StoreSpec`:
+
+- `default.yaml` is a complete tree of `depth` levels with `breadth` keys per
+  mapping. Leaves are ints, floats, strings and lists of `list_size` ints.
+- Every dimension file holds `selectors` blocks (`s0`, `s1`, ...). Each block
+  overrides a random `overlay_fraction` of the default leaves.
+- A fraction `interpolation_density` of the leaves are `${...}`
+  interpolations. They live under odd-numbered top-level keys and only
+  reference leaves under even-numbered ones, so they never form cycles.
+
+Generation is deterministic for a given spec.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from mxm.config.loader import DIMENSIONS
+from mxm.types import RuntimeIdentity
+
+type Tree = dict[str, Any]
+type LeafPath = tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class StoreSpec:
+    """Shape of a synthetic configuration store."""
+
+    app: str = "bench-app"
+    depth: int = 3
+    """Nesting levels of mappings in `default.yaml`."""
+    breadth: int = 6
+    """Keys per mapping."""
+    selectors: int = 4
+    """Selector blocks per dimension file."""
+    list_size: int = 4
+    """Items per list leaf."""
+    interpolation_density: float = 0.1
+    """Fraction of eligible leaves that are interpolations."""
+    overlay_fraction: float = 0.25
+    """Fraction of default leaves overridden by each selector block."""
+    seed: int = 0
+
+    def describe(self) -> dict[str, Any]:
+        """Return the spec as a plain dict for reports."""
+        return asdict(self)
+
+    @property
+    def leaves(self) -> int:
+        """Number of leaves in `default.yaml`."""
+        return int(self.breadth**self.depth)
+
+
+def generate_store(root: Path, spec: StoreSpec) -> Path:
+    """Write a synthetic store for `spec` under `root`.
+
+    Parameters
+    ----------
+    root
+        Store root directory. Created if needed; existing layer files of
+        `spec.app` are overwritten.
+    spec
+        Store shape.
+
+    Returns
+    -------
+    Path
+        The generated application directory `<root>/apps/<spec.app>`.
+
+    Raises
+    ------
+    ValueError
+        If `depth`, `breadth` or `selectors` is less than 1.
+    """
+    if spec.depth < 1 or spec.breadth < 1 or spec.selectors < 1:
+        raise ValueError("depth, breadth and selectors must be at least 1.")
+
+    rng = random.Random(spec.seed)
+    paths = _leaf_paths(spec)
+    targets = [path for path in paths if _is_target(path)]
+
+    default: Tree = {}
+    for path in paths:
+        _assign(default, path, _leaf_value(rng, spec, path, targets))
+
+    app_root = root / "apps" / spec.app
+    app_root.mkdir(parents=True, exist_ok=True)
+    _dump(app_root / "default.yaml", default)
+
+    overlay_count = max(1, round(len(paths) * spec.overlay_fraction))
+    for dimension in DIMENSIONS:
+        blocks: Tree = {}
+        for index in range(spec.selectors):
+            block: Tree = {}
+            for path in sorted(rng.sample(paths, min(overlay_count, len(paths)))):
+                _assign(block, path, _leaf_value(rng, spec, path, targets))
+            blocks[selector_name(index)] = block
+        _dump(app_root / f"{dimension}.yaml", blocks)
+
+    return app_root
+
+
+def selector_name(index: int) -> str:
+    """Return the selector generated for block `index`."""
+    return f"s{index}"
+
+
+def identity_for(spec: StoreSpec, index: int = 0) -> RuntimeIdentity:
+    """Return an identity selecting existing blocks of a generated store.
+
+    Different `index` values select different block combinations.
+    """
+    count = spec.selectors
+    return RuntimeIdentity(
+        app=spec.app,
+        environment=selector_name(index % count),
+        machine=selector_name((index // count) % count),
+        substrate=selector_name((index // count**2) % count),
+        role=selector_name((index // count**3) % count),
+    )
+
+
+def _leaf_paths(spec: StoreSpec) -> list[LeafPath]:
+    paths: list[LeafPath] = [()]
+    for _ in range(spec.depth):
+        paths = [
+            (*path, f"k{index}") for path in paths for index in range(spec.breadth)
+        ]
+    return paths
+
+
+def _is_target(path: LeafPath) -> bool:
+    """Return True if interpolations may reference `path`."""
+    return int(path[0][1:]) % 2 == 0
+
+
+def _leaf_value(
+    rng: random.Random,
+    spec: StoreSpec,
+    path: LeafPath,
+    targets: list[LeafPath],
+) -> Any:
+    if targets and not _is_target(path) and rng.random() < spec.interpolation_density:
+        return "${" + ".".join(rng.choice(targets)) + "}"
+
+    kind = rng.randrange(4)
+    if kind == 0:
+        return rng.randrange(1_000_000)
+    if kind == 1:
+        return round(rng.uniform(-1000.0, 1000.0), 6)
+    if kind == 2:
+        return f"value-{rng.randrange(1_000_000):06d}"
+    return [rng.randrange(1000) for _ in range(spec.list_size)]
+
+
+def _assign(tree: Tree, path: LeafPath, value: Any) -> None:
+    node = tree
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    node[path[-1]] = value
+
+
+def _dump(path: Path, data: Tree) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        yaml.safe_dump(data, handle, sort_keys=False, default_flow_style=None)
@@ -28,9 +28,29 @@ Exports
 -------
 - `MXMConfig`      : Protocol describing the resolved config object shape.
 - `load_config`    : Resolve configuration for a `RuntimeIdentity`.
+- `load_configs`   : Resolve configuration for many identities in one pass.
+- `ConfigBatch`    : Result of `load_configs` with per-identity errors.
+- `aload_config`   : Asyncio variant of `load_config`.
+- `aload_configs`  : Asyncio variant of `load_configs`.
+- `FrozenConfig`   : Compact immutable config returned by `backend="frozen"`.
+- `LazyConfig`     : Config resolving values on access, from `resolution="lazy"`.
+- `SnapshotCache`  : Persistent on-disk cache of resolved configurations.
+- `SharedConfig`   : Read-only config decoded lazily from shared memory.
+- `share_config`   : Publish a resolved config into shared memory.
+- `attach_config`  : Attach to a config published with `share_config`.
+- `load_shared_config` : Load a config once per host and share it.
+- `LoadReport`     : Per-stage timing record filled in by `load_config`.
+- `Provenance`     : Layer that supplied every leaf of a loaded config.
+- `watch_config`   : Load a config and hot-reload it when layer files change.
+- `fetch_config`   : Resolve through the local `mxm-config serve` daemon.
+- `ConfigHandle`   : Handle holding the current config of a watched identity.
 - `make_subconfig` : Construct a config object from a plain mapping.
 - `make_view`      : Return a focused read-only subtree of a resolved config.
+- `select`         : Look up a value or subtree by dotted path.
 - `to_config_data` : Convert an MXMConfig object into plain JSON-shaped configuration data.
+- `fingerprint`    : Stable content hash of a resolved config, cached per subtree.
+- `diff_configs`   : Yield the added, removed and changed paths between two configs.
+- `ConfigChange`   : One difference yielded by `diff_configs`.
 - `__version__`    : Package version.
 
 Quick start
@@ -58,28 +78,125 @@ Quick start
 
 Notes
 -----
-- `load_config` returns an OmegaConf `DictConfig` object typed as `MXMConfig`.
-  Consumers should type against `MXMConfig` rather than importing OmegaConf
-  directly.
+- `load_config` returns an OmegaConf `DictConfig` object typed as `MXMConfig`,
+  or a `FrozenConfig` with `backend="frozen"`. Consumers should type against
+  `MXMConfig` rather than importing OmegaConf directly.
 - Configuration selection is driven by `RuntimeIdentity`; discovery of that
   identity belongs to `mxm-runtime`.
 - Configuration data lives in an external `mxm-config-store` repository.
 - Explicit overrides may be passed to `load_config`; persistent local override
   files are intentionally not part of the configuration-store model.
+- Exports are resolved lazily. `import mxm.config` only loads the `MXMConfig`
+  protocol; OmegaConf is imported when a loader or helper first needs it.
 """
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from mxm.config._version import __version__
-from mxm.config.helpers import make_subconfig, make_view, to_config_data
-from mxm.config.loader import load_config
 from mxm.config.types import MXMConfig
 
+if TYPE_CHECKING:
+    from mxm.config.daemon import fetch_config
+    from mxm.config.diff import ConfigChange, diff_configs
+    from mxm.config.frozen import FrozenConfig
+    from mxm.config.helpers import (
+        fingerprint,
+        make_subconfig,
+        make_view,
+        select,
+        to_config_data,
+    )
+    from mxm.config.lazy import LazyConfig
+    from mxm.config.loader import (
+        ConfigBatch,
+        aload_config,
+        aload_configs,
+        load_config,
+        load_configs,
+    )
+    from mxm.config.provenance import Provenance
+    from mxm.config.report import LoadReport
+    from mxm.config.shared import (
+        SharedConfig,
+        attach_config,
+        load_shared_config,
+        share_config,
+    )
+    from mxm.config.snapshot import SnapshotCache
+    from mxm.config.watch import ConfigHandle, watch_config
+
+# Exports resolved on first attribute access, so that `import mxm.config` (for
+# example to type against `MXMConfig`) does not import OmegaConf or mxm.types.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ConfigBatch": "mxm.config.loader",
+    "ConfigChange": "mxm.config.diff",
+    "ConfigHandle": "mxm.config.watch",
+    "FrozenConfig": "mxm.config.frozen",
+    "LazyConfig": "mxm.config.lazy",
+    "LoadReport": "mxm.config.report",
+    "Provenance": "mxm.config.provenance",
+    "SharedConfig": "mxm.config.shared",
+    "SnapshotCache": "mxm.config.snapshot",
+    "aload_config": "mxm.config.loader",
+    "aload_configs": "mxm.config.loader",
+    "attach_config": "mxm.config.shared",
+    "diff_configs": "mxm.config.diff",
+    "fetch_config": "mxm.config.daemon",
+    "fingerprint": "mxm.config.helpers",
+    "load_config": "mxm.config.loader",
+    "load_configs": "mxm.config.loader",
+    "load_shared_config": "mxm.config.shared",
+    "make_subconfig": "mxm.config.helpers",
+    "make_view": "mxm.config.helpers",
+    "select": "mxm.config.helpers",
+    "share_config": "mxm.config.shared",
+    "to_config_data": "mxm.config.helpers",
+    "watch_config": "mxm.config.watch",
+}
+
 __all__ = [
+    "ConfigBatch",
+    "ConfigChange",
+    "ConfigHandle",
+    "FrozenConfig",
+    "LazyConfig",
+    "LoadReport",
     "MXMConfig",
+    "Provenance",
+    "SharedConfig",
+    "SnapshotCache",
     "__version__",
+    "aload_config",
+    "aload_configs",
+    "attach_config",
+    "diff_configs",
+    "fetch_config",
+    "fingerprint",
     "load_config",
+    "load_configs",
+    "load_shared_config",
     "make_subconfig",
     "make_view",
+    "select",
+    "share_config",
     "to_config_data",
+    "watch_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
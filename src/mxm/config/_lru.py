@@ -0,0 +1,82 @@
+"""Bounded least-recently-used cache used by the configuration loader.
+
+This module is internal. It provides a small thread-safe LRU mapping with
+hit/miss counters so that the loader's caches share one eviction policy and
+one introspection shape (`CacheInfo`, modelled on `functools.lru_cache`).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache[K, V]:
+    """Thread-safe mapping with least-recently-used eviction.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of entries kept. Must be at least 1.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("LRUCache maxsize must be at least 1.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for `key`, or `None` on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or refresh `key`, evicting the least recently used entry."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def count_hits(self, count: int) -> None:
+        """Count `count` hits served from data derived from cached values."""
+        with self._lock:
+            self._hits += count
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return current cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
@@ -0,0 +1,102 @@
+"""Deep merge of plain YAML-derived data with `OmegaConf.merge` semantics.
+
+`OmegaConf.merge` wraps every value of every layer in a node object and
+validates it on each merge. The loader only merges mappings parsed from YAML
+plus a plain overrides mapping, so it merges the raw data instead and wraps
+the final result into a `DictConfig` once.
+
+Semantics, matching `OmegaConf.merge` of untyped configs:
+
+- mappings merge recursively; keys keep the order of the lower layer and new
+  keys are appended,
+- any other value, including lists and `None`, replaces the lower value,
+- a `"???"` (missing) value does not replace an existing value.
+
+Merges that OmegaConf handles specially are delegated to `OmegaConf.merge`
+of all layers, so results and errors are identical. These are a mapping, a
+list or `"???"` over an interpolation (which OmegaConf resolves first and
+then merges into) and a mapping over a list or vice versa (which OmegaConf
+rejects).
+
+Inputs are never mutated. Unchanged subtrees are shared with the inputs, so
+results must be treated as read-only as well.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+MISSING = "???"
+"""OmegaConf's marker for a mandatory value that has not been set."""
+
+
+class _DelegateMerge(Exception):
+    """Raised when a merge must be delegated to `OmegaConf.merge`."""
+
+
+def merge_data(layers: Sequence[Mapping[Any, Any]]) -> dict[Any, Any]:
+    """Deep merge plain mappings, later layers taking precedence.
+
+    Parameters
+    ----------
+    layers
+        Plain nested mappings in precedence order, lowest first. At least one
+        layer is required.
+
+    Returns
+    -------
+    dict
+        Merged mapping. It shares unchanged subtrees with `layers`.
+
+    Raises
+    ------
+    omegaconf.errors.OmegaConfBaseException
+        If OmegaConf itself would reject the merge, with the same message.
+    """
+    merged = dict(layers[0])
+    try:
+        for layer in layers[1:]:
+            merged = _merge_mapping(merged, layer)
+    except _DelegateMerge:
+        return _omegaconf_merge(layers)
+    return merged
+
+
+def _merge_mapping(dest: Mapping[Any, Any], src: Mapping[Any, Any]) -> dict[Any, Any]:
+    """Return `src` merged over `dest` without mutating either."""
+    merged = dict(dest)
+    for key, value in src.items():
+        if key not in merged:
+            merged[key] = value
+            continue
+
+        current = merged[key]
+        missing = isinstance(value, str) and value == MISSING
+        if isinstance(current, str) and "${" in current:
+            # OmegaConf resolves the interpolation first when a container or
+            # "???" is merged over it; the result depends on its target.
+            if missing or isinstance(value, Mapping | list):
+                raise _DelegateMerge
+        elif isinstance(value, Mapping) and isinstance(current, Mapping):
+            merged[key] = _merge_mapping(
+                cast(Mapping[Any, Any], current), cast(Mapping[Any, Any], value)
+            )
+            continue
+        elif (
+            isinstance(value, Mapping | list)
+            and isinstance(current, Mapping | list)
+            and isinstance(value, Mapping) != isinstance(current, Mapping)
+        ):
+            raise _DelegateMerge
+        if not missing:
+            merged[key] = value
+    return merged
+
+
+def _omegaconf_merge(layers: Sequence[Mapping[Any, Any]]) -> dict[Any, Any]:
+    """Merge `layers` with `OmegaConf.merge` and return plain data."""
+    from omegaconf import OmegaConf
+
+    merged = OmegaConf.merge(*(OmegaConf.create(dict(layer)) for layer in layers))
+    return cast(dict[Any, Any], OmegaConf.to_container(merged, resolve=False))
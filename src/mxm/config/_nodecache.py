@@ -0,0 +1,59 @@
+"""Identity-keyed side tables for config nodes used by the helpers.
+
+OmegaConf containers hash and compare by content, which is both slow and
+wrong for caching per object. `NodeCache` keys entries by `id()` instead and
+holds only a weak reference to each node, so an entry disappears when its
+node is garbage collected and a recycled `id()` never returns a stale value.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+
+class NodeCache[V]:
+    """Mapping from live objects, by identity, to cached values."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[Any], V]] = {}
+
+    def get(self, node: object) -> V | None:
+        """Return the value cached for `node`, or `None`."""
+        entry = self._entries.get(id(node))
+        if entry is not None and entry[0]() is node:
+            return entry[1]
+        return None
+
+    def put(self, node: object, value: V) -> None:
+        """Cache `value` for `node` until `node` is collected."""
+        key = id(node)
+        entries = self._entries
+
+        def _evict(ref: weakref.ref[Any]) -> None:
+            current = entries.get(key)
+            if current is not None and current[0] is ref:
+                del entries[key]
+
+        entries[key] = (weakref.ref(node, _evict), value)
+
+    def discard(self, node: object) -> None:
+        """Drop the value cached for `node`, if any."""
+        entry = self._entries.get(id(node))
+        if entry is not None and entry[0]() is node:
+            self._entries.pop(id(node), None)
+
+    def values(self) -> list[V]:
+        """Return the values of all live entries."""
+        return [
+            value for ref, value in list(self._entries.values()) if ref() is not None
+        ]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,170 @@
+"""Dotted-path index for read-only OmegaConf configs.
+
+`OmegaConf.select` parses the dotted path and walks the tree on every call.
+For a read-only config the tree cannot change, so `PathIndex` records the
+dotted path of every container node once, on first use, and memoizes leaf
+values the first time they are looked up. Later lookups are a single dict
+access.
+
+Container nodes are held by weak reference, so an index never keeps its
+config alive. Only plain container paths are indexed: string keys of mappings and integer
+positions of sequences, written as `a.b.0.c`. Anything the index does not
+know (bracket syntax, relative paths, paths through interpolations, missing
+keys) is reported as a miss and callers fall back to `OmegaConf.select`, so
+results are the same as without the index.
+"""
+
+from __future__ import annotations
+
+import sys
+import weakref
+from typing import TYPE_CHECKING, Any, Final, cast
+
+if TYPE_CHECKING:
+    from omegaconf import DictConfig, ListConfig
+
+
+class _NotFound:
+    """Type of the `NOT_FOUND` sentinel."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+
+NOT_FOUND: Final = _NotFound()
+"""Returned by `PathIndex.lookup` for paths the index cannot answer."""
+
+
+class PathIndex:
+    """Path index of one read-only OmegaConf config.
+
+    Parameters
+    ----------
+    root
+        Read-only config to index. Paths are relative to it.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, root: DictConfig) -> None:
+        self._entries: dict[str, Any] = {"": weakref.ref(root)}
+        _index_containers(root, "", self._entries)
+
+    def lookup(self, path: str) -> Any:
+        """Return the node or value at `path`, or `NOT_FOUND`.
+
+        Interpolations are resolved on the first lookup of a leaf and the
+        value is memoized.
+        """
+        try:
+            entry = self._entries[path]
+        except KeyError:
+            entry = self._add(path)
+        if isinstance(entry, weakref.ref):
+            return cast("weakref.ref[Any]", entry)()
+        return entry
+
+    def _add(self, path: str) -> Any:
+        """Look up `path` below its indexed parent and memoize the entry."""
+        parent_path, _, key = path.rpartition(".")
+        parent = self._entries.get(parent_path)
+        if not isinstance(parent, weakref.ref):
+            return NOT_FOUND
+        value = _child(parent(), key)
+        if value is NOT_FOUND:
+            return NOT_FOUND
+        entry = self._entries[path] = _entry(value)
+        return entry
+
+    @property
+    def entries(self) -> int:
+        """Number of indexed paths, including memoized leaves."""
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the index itself.
+
+        Counts the table, its path strings and weak references; indexed nodes
+        and values belong to the config and are not counted.
+        """
+        entries = self._entries
+        return (
+            sys.getsizeof(entries)
+            + sum(sys.getsizeof(path) for path in entries)
+            + sum(
+                sys.getsizeof(cast(object, entry))
+                for entry in entries.values()
+                if isinstance(entry, weakref.ref)
+            )
+        )
+
+
+def _entry(value: Any) -> Any:
+    """Return the index entry for `value`: a weak reference for containers."""
+    from omegaconf import DictConfig, ListConfig
+
+    if isinstance(value, DictConfig | ListConfig):
+        return weakref.ref(value)
+    return value
+
+
+def _index_containers(
+    node: DictConfig | ListConfig,
+    prefix: str,
+    entries: dict[str, Any],
+) -> None:
+    """Record the dotted path of every container below `node`."""
+    from omegaconf import DictConfig, ListConfig
+
+    children: list[tuple[str | int, object]]
+    if isinstance(node, DictConfig):
+        children = [
+            (key, node._get_node(key)) for key in node.keys() if isinstance(key, str)
+        ]
+    else:
+        children = [
+            (
+                position,
+                node._get_node(position),
+            )  # pyright: ignore[reportUnknownMemberType]
+            for position in range(len(node))
+        ]
+
+    for key, child in children:
+        if (
+            isinstance(child, DictConfig | ListConfig)
+            and not child._is_none()
+            and not child._is_missing()
+            and not child._is_interpolation()
+        ):
+            path = f"{prefix}.{key}" if prefix else str(key)
+            entries[path] = weakref.ref(child)
+            _index_containers(child, path, entries)
+
+
+def _child(parent: Any, key: str) -> Any:
+    """Return `parent[key]` for an indexed container, or `NOT_FOUND`."""
+    from omegaconf import DictConfig, ListConfig, Node
+
+    if isinstance(parent, ListConfig):
+        if not key.isdigit() or int(key) >= len(parent):
+            return NOT_FOUND
+        position = int(key)
+        item = parent._get_node(position)  # pyright: ignore[reportUnknownMemberType]
+        if not isinstance(item, Node) or item._is_missing():
+            return NOT_FOUND
+        return parent[position]
+
+    if isinstance(parent, DictConfig):
+        try:
+            node = parent._get_node(key)
+        except Exception:
+            return NOT_FOUND
+        if node is None or node._is_missing():
+            return NOT_FOUND
+        return parent[key]
+
+    return NOT_FOUND
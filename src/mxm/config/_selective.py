@@ -0,0 +1,183 @@
+"""Top-level key index for selective parsing of dimension files.
+
+Dimension files (`environment.yaml`, `machine.yaml`, ...) map selectors to
+blocks, and a load only ever needs one block per file. This module scans a
+file's YAML event stream once, without building nodes, and records the line
+span of every top-level key. The loader then parses only the selected key's
+lines with its full YAML loader, so scalar and mapping semantics are
+unchanged.
+
+The scan is conservative. Files that cannot be split safely by lines return
+no index, and callers fall back to a full parse. This covers anchors or
+aliases, flow-style roots, non-string or duplicate top-level keys, multiple
+documents, unusual line breaks, and syntax errors; the full parse reports a
+syntax error exactly as before.
+
+Errors that only show when values are constructed, such as duplicate keys
+inside a block or unknown tags, are reported when their block is parsed.
+Unlike a full parse, a load therefore does not fail on such errors in blocks
+it does not select.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+_UNSAFE_LINE_BREAKS = ("\r", "\x85", "\u2028", "\u2029")
+"""Line breaks YAML honours but `str.split("\\n")` does not."""
+
+_NUMERIC_PREFIXES = frozenset("-+0123456789.")
+"""First characters for which OmegaConf's YAML loader may resolve a non-string."""
+
+_STR_TAG = "tag:yaml.org,2002:str"
+
+
+@dataclass(frozen=True, slots=True)
+class TopLevelIndex:
+    """Line spans of the top-level keys of a YAML mapping document."""
+
+    keys: tuple[str, ...]
+    """Top-level keys in document order."""
+    spans: dict[str, tuple[int, int]]
+    """Half-open `[start, end)` line range of each key and its value."""
+    lines: tuple[str, ...]
+    """Document lines without line terminators."""
+
+    def block_source(self, key: str) -> str:
+        """Return YAML source containing only `key` and its value."""
+        start, end = self.spans[key]
+        return "\n".join(self.lines[start:end]) + "\n"
+
+
+def index_top_level(text: str) -> TopLevelIndex | None:
+    """Index the top-level keys of a YAML mapping document.
+
+    Parameters
+    ----------
+    text
+        YAML source.
+
+    Returns
+    -------
+    TopLevelIndex | None
+        Index of top-level key line spans, or `None` if the document cannot be
+        split into independently parseable blocks.
+    """
+    import yaml
+
+    if any(marker in text for marker in _UNSAFE_LINE_BREAKS):
+        return None
+
+    try:
+        starts = _scan_top_level_keys(_parse_events(text))
+    except (yaml.YAMLError, StopIteration):
+        return None
+    if starts is None:
+        return None
+
+    lines = tuple(text.split("\n"))
+    spans: dict[str, tuple[int, int]] = {}
+    for position, (key, start) in enumerate(starts):
+        end = starts[position + 1][1] if position + 1 < len(starts) else len(lines)
+        if end <= start:
+            return None
+        spans[key] = (start, end)
+
+    return TopLevelIndex(
+        keys=tuple(key for key, _ in starts),
+        spans=spans,
+        lines=lines,
+    )
+
+
+def _parse_events(text: str) -> Iterator[Any]:
+    """Yield the YAML parse events of `text`, using libyaml when available."""
+    import yaml
+
+    loader_cls: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    loader = loader_cls(text)
+    try:
+        while loader.check_event():
+            yield loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def _scan_top_level_keys(events: Iterator[Any]) -> list[tuple[str, int]] | None:
+    """Return `(key, line)` for each top-level key, or `None` if unsplittable."""
+    import yaml
+
+    if not isinstance(next(events), yaml.StreamStartEvent):
+        return None
+    if not isinstance(next(events), yaml.DocumentStartEvent):
+        return None
+    root = next(events)
+    if not isinstance(root, yaml.MappingStartEvent):
+        return None
+    if root.flow_style or root.anchor is not None:
+        return None
+
+    resolver = yaml.resolver.Resolver()
+    starts: list[tuple[str, int]] = []
+    seen: set[str] = set()
+    while not isinstance(event := next(events), yaml.MappingEndEvent):
+        key = _string_key(event, resolver)
+        if key is None or key in seen:
+            return None
+        seen.add(key)
+        line: int = event.start_mark.line
+        starts.append((key, line))
+        if not _skip_node(next(events), events):
+            return None
+
+    if not isinstance(next(events), yaml.DocumentEndEvent):
+        return None
+    if not isinstance(next(events), yaml.StreamEndEvent):
+        return None
+    return starts
+
+
+def _string_key(event: Any, resolver: Any) -> str | None:
+    """Return the key of a top-level key event if it is a plain string."""
+    import yaml
+
+    if not isinstance(event, yaml.ScalarEvent):
+        return None
+    if event.anchor is not None or event.tag not in (None, "!"):
+        return None
+
+    value: str = event.value
+    if event.style in ("'", '"'):
+        return value
+    if not value or value[0] in _NUMERIC_PREFIXES:
+        return None
+    if resolver.resolve(yaml.ScalarNode, value, (True, False)) != _STR_TAG:
+        return None
+    return value
+
+
+def _skip_node(first: Any, events: Iterator[Any]) -> bool:
+    """Consume the events of one node; return False if it uses anchors."""
+    import yaml
+
+    if isinstance(first, yaml.AliasEvent) or first.anchor is not None:
+        return False
+    if isinstance(first, yaml.ScalarEvent):
+        return True
+
+    depth = 1
+    while depth:
+        event = next(events)
+        if isinstance(event, yaml.AliasEvent):
+            return False
+        if isinstance(event, yaml.MappingStartEvent | yaml.SequenceStartEvent):
+            if event.anchor is not None:
+                return False
+            depth += 1
+        elif isinstance(event, yaml.MappingEndEvent | yaml.SequenceEndEvent):
+            depth -= 1
+        elif isinstance(event, yaml.ScalarEvent) and event.anchor is not None:
+            return False
+    return True
@@ -0,0 +1,147 @@
+"""Merkle digests of configuration trees.
+
+Shared by `fingerprint` and `diff_configs`, which compare subtrees by digest,
+and by the loader, which keys results on the digest of the overrides. Every
+mapping and sequence is hashed from a tagged encoding of its entries and the
+digests of its child containers; digests are cached on the node holding the
+container, so a subtree is hashed once however often it is reached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from pathlib import PurePath
+from typing import Any, cast
+
+from ._nodecache import NodeCache
+from .frozen import FrozenConfig
+from .lazy import LazyConfig
+from .shared import SharedConfig
+
+MappingConfig = FrozenConfig | LazyConfig | SharedConfig
+"""Config types backed by plain mappings rather than OmegaConf nodes."""
+
+FINGERPRINTS: NodeCache[bytes] = NodeCache()
+"""Merkle digests of read-only config nodes, computed by `digest`."""
+
+FINGERPRINT_SIZE = 20
+"""Digest size in bytes of `fingerprint` hashes."""
+
+_SCALAR_TYPES = (str, int, float, type(None))
+_CONTAINER_TYPES = (Mapping, list, tuple)
+
+
+def digest(value: Mapping[Any, Any] | Sequence[Any], node: object) -> bytes:
+    """Return the Merkle digest of the container `value`.
+
+    `node` is the cacheable object holding `value`: the config itself for
+    mapping-backed configs, the matching OmegaConf container for data
+    converted from a read-only `DictConfig`, or `None`. Digests of `node` and
+    of the nodes of all child containers are cached.
+    """
+    if node is not None:
+        cached = FINGERPRINTS.get(node)
+        if cached is not None:
+            return cached
+
+    hasher = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+    if isinstance(value, Mapping):
+        hasher.update(b"M")
+        # Keys may mix types (YAML allows `{80: http, name: web}`), so they
+        # are ordered by their encoding rather than compared directly.
+        for key in sorted(value, key=scalar_key):
+            _hash_scalar(hasher, key)
+            _hash_value(hasher, value[key], node, key)
+    else:
+        hasher.update(b"L")
+        for position, item in enumerate(value):
+            _hash_value(hasher, item, node, position)
+
+    result = hasher.digest()
+    if node is not None:
+        FINGERPRINTS.put(node, result)
+    return result
+
+
+def _hash_value(
+    hasher: hashlib.blake2b, value: object, parent: object, key: str | int
+) -> None:
+    """Feed a tagged encoding of the entry `key` of the container `parent`."""
+    if isinstance(value, _SCALAR_TYPES) or not isinstance(value, _CONTAINER_TYPES):
+        _hash_scalar(hasher, value)
+        return
+
+    container = cast(Mapping[Any, Any] | Sequence[Any], value)
+    node = value if isinstance(value, MappingConfig) else child_node(parent, key)
+    hasher.update(b"C" + digest(container, node))
+
+
+def _hash_scalar(hasher: hashlib.blake2b, value: object) -> None:
+    """Feed a tagged, length-prefixed encoding of a scalar."""
+    tag, encoded = scalar_key(value)
+    if encoded is None:
+        hasher.update(tag)
+    else:
+        hasher.update(tag + len(encoded).to_bytes(4, "little") + encoded)
+
+
+def scalar_key(value: object) -> tuple[bytes, bytes | None]:
+    """Return the type tag and encoded payload of a scalar.
+
+    `None` and booleans are encoded by their tag alone. Paths (from the
+    loader's `pathlib` tags) and bytes (from `!!binary`) have their own tags;
+    any other value is encoded as its qualified type name and `repr`. Sorting
+    by this key orders strings like `sorted` does and never compares values
+    of different types.
+    """
+    if value is None:
+        return b"N", None
+    if isinstance(value, bool):
+        return (b"T" if value else b"F"), None
+    if isinstance(value, str):
+        return b"S", value.encode("utf-8")
+    if isinstance(value, int):
+        return b"I", str(value).encode("ascii")
+    if isinstance(value, float):
+        return b"D", repr(value).encode("ascii")
+    if isinstance(value, PurePath):
+        return b"P", f"{type(value).__name__}:{value}".encode()
+    if isinstance(value, bytes):
+        return b"B", value
+    kind = type(value)
+    return b"R", f"{kind.__module__}.{kind.__qualname__}:{value!r}".encode()
+
+
+def same_scalar(a: object, b: object) -> bool:
+    """Return True if the scalars `a` and `b` are the same config value.
+
+    Plain scalars compare by their encoding: `1 == 1.0 == True` in Python but
+    they are different config values, and NaN equals itself. Other values,
+    such as paths, compare by type and equality.
+    """
+    if isinstance(a, _SCALAR_TYPES) and isinstance(b, _SCALAR_TYPES):
+        return scalar_key(a) == scalar_key(b)
+    return type(a) is type(b) and bool(a == b)
+
+
+def child_node(node: object, key: str | int) -> object:
+    """Return the cacheable OmegaConf container at `key` of `node`, if any.
+
+    Only applies to OmegaConf parents; children of mapping-backed configs are
+    their own nodes. Interpolated, `None` and missing containers are skipped,
+    matching the containers `make_view` can return.
+    """
+    from omegaconf import DictConfig, ListConfig
+
+    if not isinstance(node, DictConfig | ListConfig):
+        return None
+    child: object = cast(Any, node)._get_node(key)
+    if (
+        isinstance(child, DictConfig | ListConfig)
+        and not child._is_none()
+        and not child._is_missing()
+        and not child._is_interpolation()
+    ):
+        return child
+    return None
@@ -0,0 +1,336 @@
+"""Load benchmarks against a real configuration store.
+
+`benchmarks/` measures the API against synthetic stores. `mxm-config bench`
+instead loads identities of an actual store, so that regressions and slow
+layer files show up with production data. For each mode it loads every
+identity `repeat` times with a `LoadReport` and summarises:
+
+- latency: min, median, p99 and mean of `LoadReport.total_seconds`,
+- the mean time per load of every loader stage,
+- node counts of the resolved configs,
+- the peak resident set size of the process.
+
+Modes
+-----
+- `cold` : in-process caches are cleared before every load, so every layer
+           file is read and parsed again.
+- `warm` : one untimed load per identity primes the app-layer cache, so
+           timed loads reuse the parsed layers and hit the merged-prefix trie
+           for every dimension but the last; every load merges the role
+           block and resolves.
+
+Identities that fail to load are counted and reported with their first error
+instead of aborting the run.
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import math
+import platform
+import statistics
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from mxm.config._version import __version__
+from mxm.config.loader import (
+    DIMENSIONS,
+    _app_config_root,
+    _get_app_layers,
+    _layer_fingerprints,
+    clear_cache,
+    load_config,
+)
+from mxm.config.report import STAGES, LoadReport
+
+if TYPE_CHECKING:
+    from mxm.types import RuntimeIdentity
+
+type BenchMode = Literal["cold", "warm"]
+
+BENCH_MODES: tuple[BenchMode, ...] = ("cold", "warm")
+"""Supported benchmark modes."""
+
+ANY_SELECTOR = "-"
+"""Selector used for dimensions whose layer file does not exist."""
+
+
+@dataclass(frozen=True, slots=True)
+class ModeStats:
+    """Summary of all loads of one benchmark mode."""
+
+    mode: BenchMode
+    loads: int
+    """Number of timed loads that succeeded."""
+    min_ms: float | None
+    """Latency statistics; `None` if no load succeeded."""
+    median_ms: float | None
+    p99_ms: float | None
+    mean_ms: float | None
+    stages_ms: dict[str, float]
+    """Mean milliseconds per load spent in each stage, in `STAGES` order."""
+    nodes_min: int
+    nodes_max: int
+    errors: int = 0
+    """Number of identities that failed to load."""
+    first_error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    """Result of a `run_bench` call."""
+
+    store_root: str
+    identities: int
+    repeat: int
+    modes: list[ModeStats]
+    peak_rss_kib: float | None
+    """Peak resident set size of the process, or `None` if unavailable."""
+    version: str = __version__
+    python: str = field(default_factory=platform.python_version)
+    timestamp: str = field(
+        default_factory=lambda: datetime.datetime.now(datetime.UTC).isoformat()
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as JSON-serialisable plain data."""
+        return asdict(self)
+
+    def format(self) -> str:
+        """Return a human-readable table of the result."""
+        rss = "n/a" if self.peak_rss_kib is None else f"{self.peak_rss_kib:.0f} KiB"
+        header = (
+            f"{'mode':<6}{'loads':>7}{'min ms':>10}{'median ms':>11}{'p99 ms':>10}"
+            f"{'mean ms':>10}{'nodes':>14}{'errors':>8}"
+        )
+        lines = [
+            f"identities={self.identities} repeat={self.repeat} peak_rss={rss}",
+            header,
+            "-" * len(header),
+        ]
+        for stats in self.modes:
+            nodes = (
+                f"{stats.nodes_min}"
+                if stats.nodes_min == stats.nodes_max
+                else f"{stats.nodes_min}-{stats.nodes_max}"
+            )
+            lines.append(
+                f"{stats.mode:<6}{stats.loads:>7}{_ms(stats.min_ms):>10}"
+                f"{_ms(stats.median_ms):>11}{_ms(stats.p99_ms):>10}"
+                f"{_ms(stats.mean_ms):>10}{nodes:>14}{stats.errors:>8}"
+            )
+
+        lines.append("")
+        lines.append(
+            "mean ms per load " + "".join(f"{stats.mode:>10}" for stats in self.modes)
+        )
+        for stage in STAGES:
+            if any(stage in stats.stages_ms for stats in self.modes):
+                lines.append(
+                    f"  {stage:<15}"
+                    + "".join(
+                        f"{stats.stages_ms.get(stage, 0.0):>10.3f}"
+                        for stats in self.modes
+                    )
+                )
+        for stats in self.modes:
+            if stats.first_error is not None:
+                lines.append(f"{stats.mode} error: {stats.first_error}")
+        return "\n".join(lines)
+
+
+def discover_identities(
+    *,
+    app: str,
+    store_root: Path,
+    selectors: Sequence[str | None] = (None,) * len(DIMENSIONS),
+) -> list[RuntimeIdentity]:
+    """Return identities for every combination of dimension file keys.
+
+    Parameters
+    ----------
+    app
+        Application whose layer files are inspected.
+    store_root
+        Root directory of the configuration store.
+    selectors
+        Fixed selector per dimension in `DIMENSIONS` order, or `None` to use
+        every top-level key of that dimension's layer file. Dimensions whose
+        file does not exist use the fixed selector or `ANY_SELECTOR`.
+
+    Returns
+    -------
+    list[RuntimeIdentity]
+        Identities in the cartesian product order of the selectors.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the application configuration root or `default.yaml` is missing.
+    """
+    from mxm.types import RuntimeIdentity
+
+    template = RuntimeIdentity(app, *(ANY_SELECTOR,) * len(DIMENSIONS))
+    app_root = _app_config_root(identity=template, store_root=store_root)
+    app_layers = _get_app_layers(
+        app_root=app_root, fingerprints=_layer_fingerprints(app_root)
+    )
+
+    choices: list[Sequence[str]] = []
+    for dimension_file, selector in zip(app_layers.dimensions, selectors, strict=True):
+        if selector is not None:
+            choices.append([selector])
+        elif dimension_file is None:
+            choices.append([ANY_SELECTOR])
+        else:
+            choices.append(dimension_file.selectors)
+
+    return [
+        RuntimeIdentity(app, *combination)
+        for combination in itertools.product(*choices)
+    ]
+
+
+def run_bench(
+    identities: Iterable[RuntimeIdentity],
+    *,
+    store_root: Path,
+    repeat: int = 10,
+    modes: Sequence[BenchMode] = BENCH_MODES,
+) -> BenchResult:
+    """Load every identity `repeat` times per mode and summarise the loads.
+
+    Parameters
+    ----------
+    identities
+        Runtime identities to load.
+    store_root
+        Root directory of the configuration store.
+    repeat
+        Timed loads per identity and mode.
+    modes
+        Benchmark modes to run, in order.
+
+    Returns
+    -------
+    BenchResult
+        Statistics per mode and the peak RSS of the process.
+
+    Raises
+    ------
+    ValueError
+        If `repeat` is less than 1 or a mode is unknown.
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}.")
+    for mode in modes:
+        if mode not in BENCH_MODES:
+            raise ValueError(
+                f"Unknown bench mode {mode!r}; expected one of {BENCH_MODES}."
+            )
+
+    unique = list(dict.fromkeys(identities))
+    results = [
+        _run_mode(mode, unique, store_root=store_root, repeat=repeat) for mode in modes
+    ]
+    clear_cache()
+    return BenchResult(
+        store_root=str(store_root),
+        identities=len(unique),
+        repeat=repeat,
+        modes=results,
+        peak_rss_kib=_peak_rss_kib(),
+    )
+
+
+def _run_mode(
+    mode: BenchMode,
+    identities: Sequence[RuntimeIdentity],
+    *,
+    store_root: Path,
+    repeat: int,
+) -> ModeStats:
+    """Time all loads of one mode."""
+    samples: list[float] = []
+    stages: dict[str, float] = {}
+    nodes: list[int] = []
+    errors: list[str] = []
+    report = LoadReport()
+
+    clear_cache()
+    for identity in identities:
+        try:
+            if mode == "warm":
+                load_config(identity=identity, store_root=store_root)
+            for _ in range(repeat):
+                if mode == "cold":
+                    clear_cache()
+                load_config(identity=identity, store_root=store_root, report=report)
+                samples.append(report.total_seconds * 1e3)
+                for stage, seconds in report.stages.items():
+                    stages[stage] = stages.get(stage, 0.0) + seconds * 1e3
+                nodes.append(report.nodes)
+        except Exception as exc:
+            errors.append(f"{identity}: {type(exc).__name__}: {exc}")
+
+    return _summarise(mode, samples, stages, nodes, errors)
+
+
+def _summarise(
+    mode: BenchMode,
+    samples: list[float],
+    stages: dict[str, float],
+    nodes: list[int],
+    errors: list[str],
+) -> ModeStats:
+    """Return the statistics of one mode's samples."""
+    samples.sort()
+    loads = len(samples)
+    if not loads:
+        return ModeStats(
+            mode=mode,
+            loads=0,
+            min_ms=None,
+            median_ms=None,
+            p99_ms=None,
+            mean_ms=None,
+            stages_ms={},
+            nodes_min=0,
+            nodes_max=0,
+            errors=len(errors),
+            first_error=errors[0] if errors else None,
+        )
+    return ModeStats(
+        mode=mode,
+        loads=loads,
+        min_ms=samples[0],
+        median_ms=statistics.median(samples),
+        p99_ms=samples[max(0, math.ceil(loads * 0.99) - 1)],
+        mean_ms=statistics.fmean(samples),
+        stages_ms={stage: stages[stage] / loads for stage in STAGES if stage in stages},
+        nodes_min=min(nodes, default=0),
+        nodes_max=max(nodes, default=0),
+        errors=len(errors),
+        first_error=errors[0] if errors else None,
+    )
+
+
+def _ms(value: float | None) -> str:
+    """Format a latency statistic for the table."""
+    return "n/a" if value is None else f"{value:.3f}"
+
+
+def _peak_rss_kib() -> float | None:
+    """Return the peak resident set size of this process in KiB."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
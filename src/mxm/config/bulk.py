@@ -0,0 +1,226 @@
+"""Resolve many runtime identities in parallel, streaming JSON lines.
+
+Deployment checks resolve every identity of an application matrix. Doing that
+with one `mxm-config show-config` process per identity pays interpreter
+start-up and layer parsing hundreds of times. `resolve_many` instead resolves
+all identities from one process tree:
+
+- identities are sorted so that those sharing leading selectors end up in the
+  same chunk, which `load_configs` then merges against shared prefixes,
+- where processes are forked, the parent parses every needed layer file and
+  selector block once before starting the pool, so workers inherit the
+  parsed layers instead of parsing them again,
+- each worker encodes its results as JSON lines, and chunks are yielded in
+  completion order as soon as they finish.
+
+Records
+-------
+One JSON object per identity::
+
+    {"identity": {...}, "ok": true, "config": {...}}
+    {"identity": {...}, "ok": false, "error": {"type": "KeyError", "message": ...}}
+
+Paths in a config are written as strings. A config that cannot be written as
+JSON, for example because it holds NaN, gets an error record like a config
+that fails to load.
+
+The `mxm-config resolve-many` command writes these records to stdout.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from mxm.config.helpers import to_config_data
+from mxm.config.loader import (
+    DEFAULT_CONFIG_STORE_ROOT,
+    DIMENSIONS,
+    _app_config_root,
+    _get_app_layers,
+    _layer_fingerprints,
+    _selectors,
+    load_configs,
+)
+
+if TYPE_CHECKING:
+    from mxm.types import RuntimeIdentity
+
+IDENTITY_FIELDS = ("app", *DIMENSIONS)
+"""`RuntimeIdentity` fields, in record and precedence order."""
+
+DEFAULT_CHUNK_SIZE = 8
+"""Default number of identities resolved per worker task."""
+
+
+class ResolveRecord(NamedTuple):
+    """Outcome of resolving one identity."""
+
+    ok: bool
+    """True if the identity resolved, False if `line` holds an error."""
+    line: str
+    """JSON record, without a trailing newline."""
+
+
+def resolve_many(
+    identities: Iterable[RuntimeIdentity],
+    *,
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ResolveRecord]:
+    """Resolve identities in worker processes and yield one record per identity.
+
+    Parameters
+    ----------
+    identities
+        Runtime identities to resolve. Duplicates are resolved once.
+    store_root
+        Root directory of the configuration store. Defaults to
+        `~/mxm-config-store`.
+    workers
+        Number of worker processes. Defaults to the number of CPUs available
+        to this process. With `1`, identities are resolved in this process.
+    chunk_size
+        Number of identities resolved per worker task.
+
+    Yields
+    ------
+    ResolveRecord
+        One record per identity, in completion order.
+
+    Raises
+    ------
+    ValueError
+        If `workers` or `chunk_size` is less than 1.
+    """
+    chunks, workers = _plan(identities, workers=workers, chunk_size=chunk_size)
+    yield from _map_chunks(
+        _resolve_chunk, chunks, store_root=store_root, workers=workers
+    )
+
+
+def _plan(
+    identities: Iterable[RuntimeIdentity],
+    *,
+    workers: int | None,
+    chunk_size: int,
+) -> tuple[list[list[RuntimeIdentity]], int]:
+    """Return the chunks of the unique identities and the worker count to use.
+
+    Raises
+    ------
+    ValueError
+        If `workers` or `chunk_size` is less than 1.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}.")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+    unique = sorted(
+        dict.fromkeys(identities),
+        key=lambda identity: (str(identity.app), _selectors(identity)),
+    )
+    chunks = [
+        unique[start : start + chunk_size]
+        for start in range(0, len(unique), chunk_size)
+    ]
+    return chunks, min(workers or os.process_cpu_count() or 1, len(chunks))
+
+
+def _map_chunks[T](
+    task: Callable[[Sequence[RuntimeIdentity], Path], list[T]],
+    chunks: Sequence[Sequence[RuntimeIdentity]],
+    *,
+    store_root: Path,
+    workers: int,
+) -> Iterator[T]:
+    """Run `task` on every chunk and yield its results in completion order.
+
+    With more than one worker the chunks run in a process pool; where
+    processes are forked, the layers they need are parsed here first.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield from task(chunk, store_root)
+        return
+
+    context = multiprocessing.get_context()
+    if context.get_start_method() == "fork":
+        _preload(itertools.chain.from_iterable(chunks), store_root)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(task, chunk, store_root) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _resolve_chunk(
+    identities: Sequence[RuntimeIdentity], store_root: Path
+) -> list[ResolveRecord]:
+    """Resolve one chunk of identities into JSON records."""
+    batch = load_configs(identities, store_root=store_root)
+    records: list[ResolveRecord] = []
+    for identity in identities:
+        record: dict[str, Any] = {
+            "identity": {name: getattr(identity, name) for name in IDENTITY_FIELDS}
+        }
+        error = batch.errors.get(identity)
+        if error is None:
+            try:
+                config = to_config_data(batch[identity])
+                line = _encode({**record, "ok": True, "config": config})
+            except Exception as exc:
+                error = exc
+            else:
+                records.append(ResolveRecord(ok=True, line=line))
+                continue
+        record["ok"] = False
+        record["error"] = {"type": type(error).__name__, "message": _message(error)}
+        records.append(ResolveRecord(ok=False, line=_encode(record)))
+    return records
+
+
+def _encode(record: dict[str, Any]) -> str:
+    """Return `record` as one JSON line; paths are written as strings.
+
+    Raises
+    ------
+    ValueError
+        If the record holds NaN or an infinite float, which JSON cannot
+        represent.
+    """
+    return json.dumps(record, separators=(",", ":"), default=str, allow_nan=False)
+
+
+def _preload(identities: Iterable[RuntimeIdentity], store_root: Path) -> None:
+    """Parse every layer file and selector block the identities need.
+
+    Errors are ignored here; they are reported per identity by the workers.
+    """
+    for identity in identities:
+        try:
+            app_root = _app_config_root(identity=identity, store_root=store_root)
+            app_layers = _get_app_layers(
+                app_root=app_root, fingerprints=_layer_fingerprints(app_root)
+            )
+        except Exception:
+            continue
+        for dimension_file, selector in zip(
+            app_layers.dimensions, _selectors(identity), strict=True
+        ):
+            if dimension_file is not None:
+                dimension_file.prefetch(selector)
+
+
+def _message(error: Exception) -> str:
+    """Return the message of `error` without `KeyError`'s quoting."""
+    if isinstance(error, KeyError) and len(error.args) == 1:
+        return str(error.args[0])
+    return str(error)
@@ -0,0 +1,173 @@
+"""Check that every identity of a configuration store resolves.
+
+`mxm-config check` is meant to run before a store change is merged. For every
+`apps/<app>/` directory it enumerates the combinations of the dimension files'
+top-level keys (see `mxm.config.bench.discover_identities`) and resolves each
+identity with `load_configs` in a process pool, the way `resolve_many` does:
+identities sharing leading selectors are checked together, and with the `fork`
+start method every layer file is parsed once in the parent and inherited by
+the workers.
+
+Every failure is collected instead of stopping at the first one: invalid YAML,
+missing `default.yaml`, missing selectors, non-mapping blocks and broken
+interpolations. An application whose dimension files yield no identity at all
+(for example an empty `role.yaml`) is reported as a failure too.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mxm.config.bench import discover_identities
+from mxm.config.bulk import DEFAULT_CHUNK_SIZE, _map_chunks, _message, _plan
+from mxm.config.loader import DEFAULT_CONFIG_STORE_ROOT, _selectors, load_configs
+
+if TYPE_CHECKING:
+    from mxm.types import RuntimeIdentity
+
+
+@dataclass(frozen=True, slots=True)
+class CheckFailure:
+    """One application or identity that failed to resolve."""
+
+    app: str
+    selectors: tuple[str, ...] | None
+    """Selectors of the failing identity, or `None` if discovery failed."""
+    error_type: str
+    message: str
+
+    def format(self) -> str:
+        """Return the failure as one line."""
+        where = self.app
+        if self.selectors is not None:
+            where += "[" + "/".join(self.selectors) + "]"
+        return f"{where}: {self.error_type}: {self.message}"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Result of a `check_store` call."""
+
+    store_root: str
+    apps: int
+    identities: int
+    """Number of identities resolved."""
+    failures: list[CheckFailure]
+    seconds: float
+    """Wall-clock time of discovery and resolution."""
+    workers: int
+
+    @property
+    def ok(self) -> bool:
+        """True if nothing failed."""
+        return not self.failures
+
+    def format(self) -> str:
+        """Return the failures followed by a summary line."""
+        rate = self.identities / self.seconds if self.seconds > 0 else 0.0
+        lines = [f"FAIL {failure.format()}" for failure in self.failures]
+        lines.append(
+            f"checked {self.identities} identities of {self.apps} apps in "
+            f"{self.seconds:.2f} s ({self.workers} workers, {rate:.1f} identities/s): "
+            + ("ok" if self.ok else f"{len(self.failures)} failed")
+        )
+        return "\n".join(lines)
+
+
+def discover_apps(store_root: Path) -> list[str]:
+    """Return the names of all application directories of a store, sorted.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `<store_root>/apps` does not exist.
+    """
+    apps_root = store_root / "apps"
+    if not apps_root.is_dir():
+        raise FileNotFoundError(f"Config store has no apps directory: {apps_root}")
+    return sorted(path.name for path in apps_root.iterdir() if path.is_dir())
+
+
+def check_store(
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    *,
+    apps: Iterable[str] | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> CheckResult:
+    """Resolve every discoverable identity of a store and collect failures.
+
+    Parameters
+    ----------
+    store_root
+        Root directory of the configuration store. Defaults to
+        `~/mxm-config-store`.
+    apps
+        Applications to check. Defaults to every directory under `apps/`.
+    workers
+        Number of worker processes. Defaults to the number of CPUs available
+        to this process. With `1`, identities are resolved in this process.
+    chunk_size
+        Number of identities resolved per worker task.
+
+    Returns
+    -------
+    CheckResult
+        Failures sorted by application and selectors, and timing.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `apps` is not given and the store has no `apps` directory.
+    ValueError
+        If `workers` or `chunk_size` is less than 1.
+    """
+    started = time.perf_counter()
+    app_names = discover_apps(store_root) if apps is None else list(apps)
+
+    identities: list[RuntimeIdentity] = []
+    failures: list[CheckFailure] = []
+    for app in app_names:
+        try:
+            discovered = discover_identities(app=app, store_root=store_root)
+        except Exception as exc:
+            failures.append(CheckFailure(app, None, type(exc).__name__, _message(exc)))
+            continue
+        if not discovered:
+            message = "Dimension files define no selectors; no identity resolves."
+            failures.append(CheckFailure(app, None, "ValueError", message))
+        identities.extend(discovered)
+
+    chunks, pool_size = _plan(identities, workers=workers, chunk_size=chunk_size)
+    failures.extend(
+        _map_chunks(_check_chunk, chunks, store_root=store_root, workers=pool_size)
+    )
+    failures.sort(key=lambda failure: (failure.app, failure.selectors or ()))
+    return CheckResult(
+        store_root=str(store_root),
+        apps=len(app_names),
+        identities=len(identities),
+        failures=failures,
+        seconds=time.perf_counter() - started,
+        workers=max(pool_size, 1),
+    )
+
+
+def _check_chunk(
+    identities: Sequence[RuntimeIdentity], store_root: Path
+) -> list[CheckFailure]:
+    """Resolve one chunk of identities and return its failures."""
+    batch = load_configs(identities, store_root=store_root)
+    return [
+        CheckFailure(
+            str(identity.app),
+            _selectors(identity),
+            type(error).__name__,
+            _message(error),
+        )
+        for identity, error in batch.errors.items()
+    ]
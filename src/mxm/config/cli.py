@@ -8,14 +8,22 @@ context, or manage secrets.
 
 from __future__ import annotations
 
+import itertools
+import json
+import signal
+import sys
 from pathlib import Path
-from typing import Annotated
+from types import FrameType
+from typing import Annotated, Any, cast
 
 import typer
-from omegaconf import DictConfig, OmegaConf
 
 from mxm.config._version import __version__
+from mxm.config.bulk import DEFAULT_CHUNK_SIZE, IDENTITY_FIELDS, resolve_many
+from mxm.config.diff import ConfigChange, diff_configs
+from mxm.config.helpers import make_view, to_config_data
 from mxm.config.loader import DEFAULT_CONFIG_STORE_ROOT, load_config
+from mxm.config.provenance import Provenance
 from mxm.types import (
     RuntimeIdentity,
 )
@@ -26,6 +34,9 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+_OUTPUT_FORMATS = ("yaml", "json", "jsonl")
+_DIFF_FORMATS = ("text", "json", "jsonl")
+
 
 @app.callback(invoke_without_command=True)
 def _main(  # pyright: ignore[reportUnusedFunction]
@@ -92,10 +103,49 @@ def cmd_show_config(
     resolve: bool = typer.Option(
         True,
         "--resolve/--no-resolve",
-        help="Print resolved OmegaConf output.",
+        help="Print resolved OmegaConf output. JSON output is always resolved.",
+    ),
+    output_format: str = typer.Option(
+        "yaml",
+        "--format",
+        help="Output format: yaml, json (indented) or jsonl (one line).",
+        metavar="FORMAT",
+    ),
+    path: str | None = typer.Option(
+        None,
+        "--path",
+        help="Print only the mapping at this dotted path.",
+        metavar="PATH",
+    ),
+    show_provenance: bool = typer.Option(
+        False,
+        "--provenance",
+        help="Print the layer that supplied each leaf instead of the values.",
     ),
 ) -> None:
-    """Resolve and print configuration for an explicit RuntimeIdentity."""
+    """Resolve and print configuration for an explicit RuntimeIdentity.
+
+    JSON output converts the config to plain data once and encodes it with a
+    single `json.dumps` call, instead of rendering YAML node by node. The
+    output is built in memory; compact `jsonl` output uses the C encoder,
+    indented `json` output the pure-Python one. Paths are written as strings;
+    NaN and infinite floats, which JSON cannot represent, are an error.
+
+    With --provenance, one `leaf  layer` line is printed per leaf, or a JSON
+    object mapping leaf paths to layers for the JSON formats.
+    """
+    from omegaconf import DictConfig, OmegaConf
+
+    if output_format not in _OUTPUT_FORMATS:
+        _echo_err(
+            f"error: unknown format {output_format!r}; expected one of "
+            f"{', '.join(_OUTPUT_FORMATS)}"
+        )
+        raise typer.Exit(2)
+    if output_format != "yaml" and not resolve:
+        _echo_err("error: --no-resolve is only supported with --format yaml")
+        raise typer.Exit(2)
+
     identity = RuntimeIdentity(
         app=app_id,
         environment=environment,
@@ -104,15 +154,37 @@ def cmd_show_config(
         role=role,
     )
 
+    provenance = Provenance() if show_provenance else None
     try:
         cfg = load_config(
             identity=identity,
             store_root=store_root.expanduser(),
+            provenance=provenance,
         )
+        if path is not None:
+            cfg = make_view(cfg, path)
     except Exception as exc:
         _echo_err(f"error: {exc}")
         raise typer.Exit(1) from None
 
+    if provenance is not None:
+        _echo_provenance(provenance, path=path, output_format=output_format)
+        return
+
+    if output_format != "yaml":
+        layout: dict[str, Any] = (
+            {"indent": 2} if output_format == "json" else {"separators": (",", ":")}
+        )
+        try:
+            encoded = json.dumps(
+                to_config_data(cfg), default=str, allow_nan=False, **layout
+            )
+        except (TypeError, ValueError) as exc:
+            _echo_err(f"error: cannot encode the configuration as JSON: {exc}")
+            raise typer.Exit(1) from None
+        typer.echo(encoded)
+        return
+
     if not isinstance(cfg, DictConfig):
         _echo_err("error: resolved configuration is not an OmegaConf DictConfig")
         raise typer.Exit(2)
@@ -121,5 +193,464 @@ def cmd_show_config(
     typer.echo(output)
 
 
+def _echo_provenance(
+    provenance: Provenance, *, path: str | None, output_format: str
+) -> None:
+    """Print the provenance of the leaves below `path` in `output_format`."""
+    if output_format == "yaml":
+        typer.echo(provenance.format(path))
+    elif output_format == "json":
+        typer.echo(json.dumps(provenance.to_dict(path), indent=2))
+    else:
+        typer.echo(json.dumps(provenance.to_dict(path), separators=(",", ":")))
+
+
+@app.command("diff")
+def cmd_diff(
+    app_id: str = typer.Option(
+        ...,
+        "--app",
+        help="Application identifier.",
+        metavar="APP_ID",
+    ),
+    environment: str = typer.Option(
+        ...,
+        "--environment",
+        "--env",
+        help="Runtime environment selector.",
+        metavar="ENVIRONMENT",
+    ),
+    machine: str = typer.Option(
+        ...,
+        "--machine",
+        help="Machine identifier selector.",
+        metavar="MACHINE",
+    ),
+    substrate: str = typer.Option(
+        ...,
+        "--substrate",
+        help="Runtime substrate selector.",
+        metavar="SUBSTRATE",
+    ),
+    role: str = typer.Option(
+        ...,
+        "--role",
+        help="Runtime role selector.",
+        metavar="ROLE",
+    ),
+    to_environment: str | None = typer.Option(
+        None,
+        "--to-environment",
+        "--to-env",
+        help="Environment of the second identity. Default: --environment.",
+        metavar="ENVIRONMENT",
+    ),
+    to_machine: str | None = typer.Option(
+        None,
+        "--to-machine",
+        help="Machine of the second identity. Default: --machine.",
+        metavar="MACHINE",
+    ),
+    to_substrate: str | None = typer.Option(
+        None,
+        "--to-substrate",
+        help="Substrate of the second identity. Default: --substrate.",
+        metavar="SUBSTRATE",
+    ),
+    to_role: str | None = typer.Option(
+        None,
+        "--to-role",
+        help="Role of the second identity. Default: --role.",
+        metavar="ROLE",
+    ),
+    store_root: Annotated[
+        Path,
+        typer.Option(
+            "--store-root",
+            help="Configuration store root.",
+            metavar="PATH",
+        ),
+    ] = DEFAULT_CONFIG_STORE_ROOT,
+    path: str | None = typer.Option(
+        None,
+        "--path",
+        help="Only compare the mapping at this dotted path.",
+        metavar="PATH",
+    ),
+    output_format: str = typer.Option(
+        "text",
+        "--format",
+        help="Output format: text, json or jsonl (one change per line).",
+        metavar="FORMAT",
+    ),
+) -> None:
+    """Print the differences between the resolved configs of two identities.
+
+    The second identity equals the first except for the selectors given with
+    the --to-* options. Text output prints `- path: value` for removed,
+    `+ path: value` for added and `~ path: old -> new` for changed paths.
+    Like diff(1), exits with status 1 if the configs differ and 2 on errors.
+    """
+    if output_format not in _DIFF_FORMATS:
+        _echo_err(
+            f"error: unknown format {output_format!r}; expected one of "
+            f"{', '.join(_DIFF_FORMATS)}"
+        )
+        raise typer.Exit(2)
+
+    first = RuntimeIdentity(
+        app=app_id,
+        environment=environment,
+        machine=machine,
+        substrate=substrate,
+        role=role,
+    )
+    second = RuntimeIdentity(
+        app=app_id,
+        environment=to_environment or environment,
+        machine=to_machine or machine,
+        substrate=to_substrate or substrate,
+        role=to_role or role,
+    )
+    try:
+        configs = [
+            load_config(identity=identity, store_root=store_root.expanduser())
+            for identity in (first, second)
+        ]
+        if path is not None:
+            configs = [make_view(cfg, path) for cfg in configs]
+        changes = [
+            change._replace(path=f"{path}.{change.path}") if path else change
+            for change in diff_configs(*configs)
+        ]
+    except Exception as exc:
+        _echo_err(f"error: {exc}")
+        raise typer.Exit(2) from None
+
+    if output_format == "json":
+        records = [change.to_dict() for change in changes]
+        typer.echo(json.dumps(records, indent=2, default=str))
+    else:
+        for change in changes:
+            typer.echo(_format_change(change, output_format))
+    if changes:
+        raise typer.Exit(1)
+
+
+def _format_change(change: ConfigChange, output_format: str) -> str:
+    """Return one change as a text or JSON line."""
+    if output_format == "jsonl":
+        return json.dumps(change.to_dict(), separators=(",", ":"), default=str)
+    if change.kind == "added":
+        return f"+ {change.path}: {_encode(change.new)}"
+    if change.kind == "removed":
+        return f"- {change.path}: {_encode(change.old)}"
+    return f"~ {change.path}: {_encode(change.old)} -> {_encode(change.new)}"
+
+
+def _encode(value: Any) -> str:
+    """Return `value` as JSON, encoding paths and other non-JSON values as strings."""
+    return json.dumps(value, default=str)
+
+
+@app.command("resolve-many")
+def cmd_resolve_many(
+    identities_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--identities",
+            help="JSON-lines file with one identity object per line ('-' for "
+            "stdin).",
+            metavar="PATH",
+        ),
+    ] = None,
+    app_ids: Annotated[
+        list[str] | None,
+        typer.Option("--app", help="Application identifiers.", metavar="APP_ID"),
+    ] = None,
+    environments: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--environment",
+            "--env",
+            help="Runtime environment selectors.",
+            metavar="ENVIRONMENT",
+        ),
+    ] = None,
+    machines: Annotated[
+        list[str] | None,
+        typer.Option("--machine", help="Machine selectors.", metavar="MACHINE"),
+    ] = None,
+    substrates: Annotated[
+        list[str] | None,
+        typer.Option("--substrate", help="Substrate selectors.", metavar="SUBSTRATE"),
+    ] = None,
+    roles: Annotated[
+        list[str] | None,
+        typer.Option("--role", help="Role selectors.", metavar="ROLE"),
+    ] = None,
+    store_root: Annotated[
+        Path,
+        typer.Option(
+            "--store-root",
+            help="Configuration store root.",
+            metavar="PATH",
+        ),
+    ] = DEFAULT_CONFIG_STORE_ROOT,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Worker processes. Defaults to CPUs."),
+    ] = None,
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", min=1, help="Identities per worker task."),
+    ] = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Resolve many identities in parallel, printing one JSON line each.
+
+    Identities come from --identities or from the cartesian product of the
+    selector options; each selector option may be repeated or hold a
+    comma-separated list. Records are printed as soon as they are resolved.
+    Exits with status 1 if any identity fails to resolve.
+    """
+    selectors = [app_ids, environments, machines, substrates, roles]
+    try:
+        if identities_file is not None:
+            if any(selectors):
+                raise ValueError(
+                    "--identities cannot be combined with selector options"
+                )
+            identities = _read_identities(identities_file)
+        else:
+            identities = _identity_matrix(selectors)
+    except (OSError, ValueError) as exc:
+        _echo_err(f"error: {exc}")
+        raise typer.Exit(2) from None
+
+    failed = False
+    for record in resolve_many(
+        identities,
+        store_root=store_root.expanduser(),
+        workers=workers,
+        chunk_size=chunk_size,
+    ):
+        failed |= not record.ok
+        typer.echo(record.line)
+
+    if failed:
+        raise typer.Exit(1)
+
+
+def _read_identities(path: Path) -> list[RuntimeIdentity]:
+    """Read one identity object per non-blank line of `path` (`-` for stdin)."""
+    if str(path) == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = path.expanduser().read_text(encoding="utf-8").splitlines()
+
+    identities: list[RuntimeIdentity] = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+            identities.append(
+                RuntimeIdentity(**{name: str(fields[name]) for name in IDENTITY_FIELDS})
+            )
+        except (TypeError, ValueError, KeyError) as exc:
+            raise ValueError(
+                f"{path}:{number}: expected an identity object with fields "
+                f"{', '.join(IDENTITY_FIELDS)} ({type(exc).__name__}: {exc})"
+            ) from None
+    return identities
+
+
+def _identity_matrix(selectors: list[list[str] | None]) -> list[RuntimeIdentity]:
+    """Return the cartesian product of repeated or comma-separated selectors."""
+    values: list[list[str]] = []
+    for name, options in zip(IDENTITY_FIELDS, selectors, strict=True):
+        split = [value for option in options or [] for value in option.split(",")]
+        if not split:
+            raise ValueError(f"missing --{name} (or pass --identities)")
+        values.append(split)
+    return [RuntimeIdentity(*combination) for combination in itertools.product(*values)]
+
+
+@app.command("bench")
+def cmd_bench(
+    app_id: str = typer.Option(
+        ...,
+        "--app",
+        help="Application identifier.",
+        metavar="APP_ID",
+    ),
+    environment: str | None = typer.Option(
+        None,
+        "--environment",
+        "--env",
+        help="Runtime environment selector. Default: every key of environment.yaml.",
+        metavar="ENVIRONMENT",
+    ),
+    machine: str | None = typer.Option(
+        None,
+        "--machine",
+        help="Machine selector. Default: every key of machine.yaml.",
+        metavar="MACHINE",
+    ),
+    substrate: str | None = typer.Option(
+        None,
+        "--substrate",
+        help="Substrate selector. Default: every key of substrate.yaml.",
+        metavar="SUBSTRATE",
+    ),
+    role: str | None = typer.Option(
+        None,
+        "--role",
+        help="Role selector. Default: every key of role.yaml.",
+        metavar="ROLE",
+    ),
+    store_root: Annotated[
+        Path,
+        typer.Option(
+            "--store-root",
+            help="Configuration store root.",
+            metavar="PATH",
+        ),
+    ] = DEFAULT_CONFIG_STORE_ROOT,
+    repeat: int = typer.Option(
+        10, "--repeat", "-n", min=1, help="Timed loads per identity and mode."
+    ),
+    mode: str = typer.Option(
+        "both",
+        "--mode",
+        help="Benchmark mode: cold, warm or both.",
+        metavar="MODE",
+    ),
+    json_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--json",
+            help="Also write the result as JSON to PATH ('-' for stdout only).",
+            metavar="PATH",
+        ),
+    ] = None,
+) -> None:
+    """Benchmark loading identities of a configuration store.
+
+    Selectors that are not given are discovered from the dimension files, so
+    by default every identity of the application is loaded.
+    """
+    from mxm.config.bench import BENCH_MODES, BenchMode, discover_identities, run_bench
+
+    modes: tuple[BenchMode, ...] = (
+        BENCH_MODES if mode == "both" else cast(tuple[BenchMode], (mode,))
+    )
+    store_root = store_root.expanduser()
+    try:
+        identities = discover_identities(
+            app=app_id,
+            store_root=store_root,
+            selectors=(environment, machine, substrate, role),
+        )
+        result = run_bench(
+            identities, store_root=store_root, repeat=repeat, modes=modes
+        )
+    except (OSError, ValueError) as exc:
+        _echo_err(f"error: {exc}")
+        raise typer.Exit(1) from None
+
+    encoded = json.dumps(result.to_dict(), indent=2)
+    if json_path is not None and str(json_path) == "-":
+        typer.echo(encoded)
+        return
+    typer.echo(result.format())
+    if json_path is not None:
+        json_path.expanduser().write_text(encoded + "\n", encoding="utf-8")
+
+
+@app.command("check")
+def cmd_check(
+    app_ids: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--app",
+            help="Application to check; may be repeated. Default: every app.",
+            metavar="APP_ID",
+        ),
+    ] = None,
+    store_root: Annotated[
+        Path,
+        typer.Option(
+            "--store-root",
+            help="Configuration store root.",
+            metavar="PATH",
+        ),
+    ] = DEFAULT_CONFIG_STORE_ROOT,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Worker processes. Defaults to CPUs."),
+    ] = None,
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", min=1, help="Identities per worker task."),
+    ] = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Check that every identity of a configuration store resolves.
+
+    Identities are all combinations of the dimension files' top-level keys of
+    every application. Failures are listed before a timing summary, and the
+    command exits with status 1 if any identity fails to resolve.
+    """
+    from mxm.config.check import check_store
+
+    try:
+        result = check_store(
+            store_root.expanduser(),
+            apps=app_ids or None,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+    except OSError as exc:
+        _echo_err(f"error: {exc}")
+        raise typer.Exit(2) from None
+
+    typer.echo(result.format())
+    if not result.ok:
+        raise typer.Exit(1)
+
+
+@app.command("serve")
+def cmd_serve(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="Unix socket to listen on. Defaults to "
+            "$XDG_RUNTIME_DIR/mxm-config.sock.",
+            metavar="PATH",
+        ),
+    ] = None,
+) -> None:
+    """Serve resolved configurations to local processes over a Unix socket."""
+    from mxm.config.daemon import ConfigServer
+
+    def _stop(signum: int, frame: FrameType | None) -> None:
+        raise KeyboardInterrupt
+
+    try:
+        server = ConfigServer(socket_path)
+    except OSError as exc:
+        _echo_err(f"error: {exc}")
+        raise typer.Exit(1) from None
+
+    signal.signal(signal.SIGTERM, _stop)
+    with server:
+        _echo_err(f"serving on {server.socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,475 @@
+"""Local daemon serving resolved configurations over a Unix domain socket.
+
+Short-lived processes on one host each pay for stat'ing, parsing, merging and
+resolving the same layer files. `mxm-config serve` runs a `ConfigServer` that
+keeps resolved configs in memory and answers resolve requests over a Unix
+domain socket; `fetch_config` asks the daemon and falls back to a local
+`load_config` when no daemon is running.
+
+Invalidation
+------------
+The daemon resolves through `load_config(..., cache=True)`, whose result cache
+is keyed by the stat fingerprints of the layer files. Every request therefore
+costs a handful of `stat` calls, and an edited layer file is picked up on the
+next request. The JSON encoding of each resolved config is computed once and
+reused until the config is replaced.
+
+Protocol
+--------
+Newline-delimited JSON in both directions; a connection may carry several
+requests. A request::
+
+    {"v": 1, "identity": {"app": ..., "environment": ..., "machine": ...,
+     "substrate": ..., "role": ...}, "store_root": "/abs/path",
+     "overrides": {...} or null}
+
+is answered with `{"ok": true, "config": {...}}` or
+`{"ok": false, "error": "<type>: <message>"}`.
+
+Security
+--------
+- The socket is bound with mode `0600`, so only the user running the daemon
+  can connect. Without `XDG_RUNTIME_DIR` it lives in a per-user `0700`
+  directory under the temporary directory, which the daemon refuses to use
+  if another user owns it.
+- `fetch_config` only trusts a daemon running as the same user. The peer uid
+  is read with `SO_PEERCRED` where available; elsewhere the socket file must
+  be owned by the user and not accessible to anyone else.
+
+Notes
+-----
+- When the daemon reports an error, `fetch_config` repeats the load locally so
+  that the caller sees the original exception type and message.
+- JSON turns non-string mapping keys into strings. The daemon therefore does
+  not serve configs with such keys (for example `ports: {80: http}`); it
+  answers with an error and `fetch_config` loads them locally. Overrides with
+  such keys are never sent; `fetch_config` loads them locally as well.
+- The daemon would resolve a resolver interpolation such as `${oc.env:...}`
+  in its own environment rather than the caller's. It does not serve configs
+  whose layer files or overrides contain one, so `fetch_config` loads them
+  locally.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
+from mxm.config._nodecache import NodeCache
+from mxm.config.frozen import FrozenConfig
+
+if TYPE_CHECKING:
+    from mxm.config.types import MXMConfig
+    from mxm.types import RuntimeIdentity
+
+PROTOCOL_VERSION = 1
+"""Version of the request and response format."""
+
+DEFAULT_TIMEOUT = 1.0
+"""Default seconds `fetch_config` waits for the daemon before loading locally."""
+
+_IDENTITY_FIELDS = ("app", "environment", "machine", "substrate", "role")
+
+_PEERCRED = struct.Struct("iII")
+"""Layout of Linux's `struct ucred`: pid, uid and gid of the socket peer."""
+
+
+def default_socket_path() -> Path:
+    """Return the default daemon socket path.
+
+    Returns
+    -------
+    Path
+        `$XDG_RUNTIME_DIR/mxm-config.sock` if `XDG_RUNTIME_DIR` is set,
+        otherwise `mxm-config.sock` in the per-user directory
+        `mxm-config-<uid>` of the temporary directory.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "mxm-config.sock"
+    return _fallback_dir() / "mxm-config.sock"
+
+
+class ConfigServer:
+    """Unix socket server answering resolve requests from memory.
+
+    Parameters
+    ----------
+    socket_path
+        Path of the socket to listen on. Defaults to `default_socket_path()`.
+        A stale socket left behind by a daemon that did not shut down cleanly
+        is replaced.
+
+    Raises
+    ------
+    FileExistsError
+        If another daemon is already listening on `socket_path`.
+    PermissionError
+        If `socket_path` is in the per-user fallback directory and that
+        directory is not a `0700` directory owned by the current user.
+
+    Notes
+    -----
+    - `serve_forever` blocks; call `shutdown` from another thread (or a
+      signal handler) to stop it, then `close` to remove the socket. The
+      context manager calls `close`.
+    """
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        path = (socket_path or default_socket_path()).expanduser()
+        if path.parent == _fallback_dir():
+            _make_private_dir(path.parent)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_stale_socket(path)
+
+        self.socket_path = path
+        self._payloads: NodeCache[bytes] = NodeCache()
+        self._lock = threading.Lock()
+        self._requests = 0
+        # Bind with mode 0600 from the start instead of chmod'ing afterwards,
+        # which would leave the socket open to other users in between.
+        umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(path), _Handler)
+        finally:
+            os.umask(umask)
+        self._server.config_server = self
+
+    @property
+    def requests(self) -> int:
+        """Number of requests answered so far."""
+        return self._requests
+
+    def serve_forever(self) -> None:
+        """Answer requests until `shutdown` is called."""
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop `serve_forever`, waiting for it to return."""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Close the listening socket and remove the socket file."""
+        self._server.server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> ConfigServer:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ConfigServer({str(self.socket_path)!r})"
+
+    def respond(self, line: bytes) -> bytes:
+        """Return the encoded response line to one encoded request line."""
+        from mxm.config.loader import load_config
+
+        with self._lock:
+            self._requests += 1
+        try:
+            identity, store_root, overrides = _parse_request(line)
+            cfg = load_config(
+                identity=identity,
+                store_root=store_root,
+                overrides=overrides,
+                cache=True,
+            )
+            return self._payload(
+                cfg, identity=identity, store_root=store_root, overrides=overrides
+            )
+        except Exception as exc:
+            error = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            return json.dumps(error).encode("utf-8") + b"\n"
+
+    def _payload(
+        self,
+        cfg: MXMConfig,
+        *,
+        identity: RuntimeIdentity,
+        store_root: Path,
+        overrides: Mapping[str, Any] | None,
+    ) -> bytes:
+        """Return the response for `cfg`, the config of a request, encoding it once."""
+        from mxm.config.helpers import to_config_data
+        from mxm.config.loader import LAYER_FILES, _app_config_root
+        from mxm.config.snapshot import uses_resolvers
+
+        payload = self._payloads.get(cfg)
+        if payload is None:
+            app_root = _app_config_root(identity=identity, store_root=store_root)
+            data = to_config_data(cfg)
+            error: str | None = None
+            if _has_non_str_keys(data):
+                error = "TypeError: Config has mapping keys JSON cannot represent."
+            elif uses_resolvers(
+                layer_paths=[app_root / name for name in LAYER_FILES],
+                overrides=overrides,
+            ):
+                error = (
+                    "ValueError: Config uses resolver interpolations, which "
+                    "depend on the environment of the resolving process."
+                )
+            if error is not None:
+                payload = (
+                    json.dumps({"ok": False, "error": error}).encode("utf-8") + b"\n"
+                )
+            else:
+                encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+                payload = b'{"ok":true,"config":' + encoded + b"}\n"
+            self._payloads.put(cfg, payload)
+        return payload
+
+
+def serve(socket_path: Path | None = None) -> None:
+    """Run a `ConfigServer` until interrupted.
+
+    Parameters
+    ----------
+    socket_path
+        Path of the socket to listen on. Defaults to `default_socket_path()`.
+    """
+    with ConfigServer(socket_path) as server:
+        server.serve_forever()
+
+
+def fetch_config(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path | None = None,
+    overrides: Mapping[str, Any] | None = None,
+    socket_path: Path | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> MXMConfig:
+    """Resolve configuration through the local daemon, or locally without one.
+
+    Parameters
+    ----------
+    identity
+        Runtime identity selecting the application and identity-specific layers.
+    store_root
+        Root directory of the configuration store. Defaults to
+        `~/mxm-config-store`.
+    overrides
+        Optional explicit override mapping applied after all store layers.
+    socket_path
+        Daemon socket. Defaults to `default_socket_path()`.
+    timeout
+        Seconds to wait for the daemon before loading locally.
+
+    Returns
+    -------
+    MXMConfig
+        A `FrozenConfig`, whether it was served by the daemon or loaded with
+        `load_config(..., backend="frozen")`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the application configuration root or `default.yaml` is missing.
+    KeyError
+        If a dimension file does not contain the selected identity value.
+
+    Notes
+    -----
+    - Any daemon failure (not running, timeout, a daemon running as another
+      user, an error response, overrides that cannot be sent as JSON) falls
+      back to the local load, so the result and exceptions are the same as
+      without a daemon.
+    - Overrides with non-string keys are loaded locally without asking the
+      daemon, since JSON would turn the keys into strings. Configs using
+      resolver interpolations such as `${oc.env:...}` are refused by the
+      daemon and loaded locally too, so they resolve in the caller's
+      environment.
+    """
+    from mxm.config.loader import DEFAULT_CONFIG_STORE_ROOT, load_config
+
+    store_root = DEFAULT_CONFIG_STORE_ROOT if store_root is None else store_root
+    if overrides is not None and _has_non_str_keys(overrides):
+        return load_config(
+            identity=identity,
+            store_root=store_root,
+            overrides=overrides,
+            backend="frozen",
+        )
+
+    request = {
+        "v": PROTOCOL_VERSION,
+        "identity": {name: getattr(identity, name) for name in _IDENTITY_FIELDS},
+        "store_root": str(store_root.expanduser().absolute()),
+        "overrides": None if overrides is None else dict(overrides),
+    }
+    try:
+        line = json.dumps(request).encode("utf-8") + b"\n"
+        response = json.loads(
+            _exchange(socket_path or default_socket_path(), line, timeout)
+        )
+    except (OSError, TypeError, ValueError):
+        response = None
+
+    if isinstance(response, dict):
+        fields = cast(dict[str, Any], response)
+        if fields.get("ok") is True:
+            return FrozenConfig(fields["config"])
+
+    return load_config(
+        identity=identity,
+        store_root=store_root,
+        overrides=overrides,
+        backend="frozen",
+    )
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix stream server with a reference to its `ConfigServer`."""
+
+    daemon_threads = True
+    config_server: ConfigServer
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer every request line received on one connection."""
+
+    def handle(self) -> None:
+        config_server = cast(_UnixServer, self.server).config_server
+        for line in self.rfile:
+            self.wfile.write(config_server.respond(line))
+            self.wfile.flush()
+
+
+def _parse_request(
+    line: bytes,
+) -> tuple[RuntimeIdentity, Path, Mapping[str, Any] | None]:
+    """Decode and validate one request line."""
+    from mxm.types import RuntimeIdentity
+
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object.")
+    fields = cast(dict[str, Any], request)
+    if fields.get("v") != PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported protocol version: {fields.get('v')!r}.")
+
+    identity = fields.get("identity")
+    store_root = fields.get("store_root")
+    overrides = fields.get("overrides")
+    if not isinstance(identity, dict) or not isinstance(store_root, str):
+        raise ValueError("Request needs an 'identity' object and a 'store_root'.")
+    if overrides is not None and not isinstance(overrides, dict):
+        raise ValueError("Request 'overrides' must be an object or null.")
+
+    values = cast(dict[str, Any], identity)
+    return (
+        RuntimeIdentity(**{name: str(values[name]) for name in _IDENTITY_FIELDS}),
+        Path(store_root),
+        cast(dict[str, Any] | None, overrides),
+    )
+
+
+def _exchange(socket_path: Path, line: bytes, timeout: float) -> bytes:
+    """Send one request line to the daemon and return its response line."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        _check_peer(sock, socket_path)
+        sock.sendall(line)
+        with sock.makefile("rb") as stream:
+            response = stream.readline()
+    if not response.endswith(b"\n"):
+        raise ConnectionError("Config daemon closed the connection.")
+    return response
+
+
+def _check_peer(sock: socket.socket, socket_path: Path) -> None:
+    """Raise `PermissionError` unless the daemon runs as the current user."""
+    uid = os.getuid()
+    if hasattr(socket, "SO_PEERCRED"):
+        credentials = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size
+        )
+        _, peer_uid, _ = _PEERCRED.unpack(credentials)
+        if peer_uid != uid:
+            raise PermissionError(
+                f"Config daemon on {socket_path} runs as uid {peer_uid}."
+            )
+        return
+
+    info = socket_path.lstat()
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        raise PermissionError(
+            f"{socket_path} is not a private socket owned by the current user."
+        )
+
+
+def _fallback_dir() -> Path:
+    """Return the per-user socket directory used without `XDG_RUNTIME_DIR`."""
+    return Path(tempfile.gettempdir()) / f"mxm-config-{os.getuid()}"
+
+
+def _make_private_dir(directory: Path) -> None:
+    """Create `directory` with mode `0700`, or check that it has that mode.
+
+    Raises
+    ------
+    PermissionError
+        If the directory exists but is a symlink, is owned by another user or
+        is accessible to other users.
+    """
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = directory.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"{directory} must be a directory owned by the current user "
+            "with mode 0700."
+        )
+
+
+def _has_non_str_keys(value: object) -> bool:
+    """Return True if a mapping in `value` has a key JSON would stringify."""
+    if isinstance(value, Mapping):
+        mapping = cast(Mapping[Any, Any], value)
+        return any(
+            not isinstance(key, str) or _has_non_str_keys(item)
+            for key, item in mapping.items()
+        )
+    if isinstance(value, list):
+        return any(_has_non_str_keys(item) for item in cast(list[Any], value))
+    return False
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file nobody listens on, or raise if a daemon does."""
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket.")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    raise FileExistsError(f"A config daemon is already listening on {path}.")
@@ -0,0 +1,176 @@
+"""Structural diff of two resolved configs.
+
+`diff_configs(a, b)` walks two configs side by side and yields one
+`ConfigChange` per added, removed or changed leaf path. Before descending
+into a pair of subtrees it compares their Merkle digests (see `fingerprint`),
+so identical subtrees are skipped without being walked. Digests are cached
+per node, so once both configs have been hashed a diff costs roughly the
+size of the differing nodes, not of the whole tree.
+
+Paths are dotted, like those of `select` and `make_view`. Lists are compared
+as whole values: a list either is unchanged or is reported as changed,
+mirroring the merge, where a list always replaces the lower value.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, Literal, NamedTuple, cast
+
+from mxm.config._tree import MappingConfig, child_node, digest, same_scalar
+from mxm.config.frozen import FrozenConfig
+from mxm.config.helpers import to_config_data
+from mxm.config.types import MXMConfig
+
+type ChangeKind = Literal["added", "removed", "changed"]
+
+
+class ConfigChange(NamedTuple):
+    """One difference between two configs."""
+
+    kind: ChangeKind
+    path: str
+    """Dotted path of the differing value."""
+    old: Any = None
+    """Value in the first config; `None` for added paths."""
+    new: Any = None
+    """Value in the second config; `None` for removed paths."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the change as a JSON-serialisable record."""
+        if self.kind == "added":
+            return {"kind": self.kind, "path": self.path, "value": self.new}
+        if self.kind == "removed":
+            return {"kind": self.kind, "path": self.path, "value": self.old}
+        return {"kind": self.kind, "path": self.path, "old": self.old, "new": self.new}
+
+
+def diff_configs(a: MXMConfig, b: MXMConfig) -> Iterator[ConfigChange]:
+    """Yield the differences between two configs.
+
+    Parameters
+    ----------
+    a
+        First config, for example the resolved config of `staging`.
+    b
+        Second config, for example the resolved config of `prod`. The configs
+        may use different backends.
+
+    Yields
+    ------
+    ConfigChange
+        Removed and changed paths in the key order of `a`, then added paths
+        in the key order of `b`. Values are plain data, as returned by
+        `to_config_data`.
+
+    Raises
+    ------
+    TypeError
+        If a config is not an OmegaConf DictConfig, FrozenConfig, LazyConfig
+        or SharedConfig.
+    """
+    a_data, a_node = _root(a)
+    b_data, b_node = _root(b)
+    yield from _diff_values(a_data, a_node, b_data, b_node, "")
+
+
+def _root(cfg: MXMConfig) -> tuple[Mapping[Any, Any], object]:
+    """Return the data of `cfg` and the node its digests are cached on."""
+    if isinstance(cfg, MappingConfig):
+        return cfg, cfg
+
+    from omegaconf import DictConfig, OmegaConf
+
+    if not isinstance(cfg, DictConfig):
+        raise TypeError(
+            "diff_configs expects an OmegaConf DictConfig, FrozenConfig, "
+            "LazyConfig or SharedConfig (MXMConfig)."
+        )
+    if OmegaConf.is_readonly(cfg):
+        return to_config_data(cfg, immutable=True), cfg
+    # A writable config may change between calls; diff a frozen copy whose
+    # nodes cache digests for the duration of this diff.
+    frozen = FrozenConfig(to_config_data(cfg))
+    return frozen, frozen
+
+
+def _diff_values(
+    a: object, a_node: object, b: object, b_node: object, path: str
+) -> Iterator[ConfigChange]:
+    """Yield the differences between two values at `path`."""
+    a_map = _as_mapping(a)
+    b_map = _as_mapping(b)
+    if a_map is not None and b_map is not None:
+        if digest(a_map, a_node) != digest(b_map, b_node):
+            yield from _diff_mappings(a_map, a_node, b_map, b_node, path)
+    elif not _same(a, a_node, b, b_node):
+        yield ConfigChange("changed", path, _plain(a), _plain(b))
+
+
+def _diff_mappings(
+    a: Mapping[Any, Any],
+    a_node: object,
+    b: Mapping[Any, Any],
+    b_node: object,
+    prefix: str,
+) -> Iterator[ConfigChange]:
+    """Yield the differences between two mappings with different digests."""
+    for key, a_value in a.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if key not in b:
+            yield ConfigChange("removed", path, old=_plain(a_value))
+            continue
+        b_value = b[key]
+        yield from _diff_values(
+            a_value,
+            _node(a_value, a_node, key),
+            b_value,
+            _node(b_value, b_node, key),
+            path,
+        )
+    for key, b_value in b.items():
+        if key not in a:
+            path = f"{prefix}.{key}" if prefix else str(key)
+            yield ConfigChange("added", path, new=_plain(b_value))
+
+
+def _as_mapping(value: object) -> Mapping[Any, Any] | None:
+    """Return `value` typed as a mapping, or `None` if it is not one."""
+    return cast(Mapping[Any, Any], value) if isinstance(value, Mapping) else None
+
+
+def _node(value: object, parent: object, key: str | int) -> object:
+    """Return the node the digest of `value`, entry `key` of `parent`, is cached on."""
+    if isinstance(value, MappingConfig):
+        return value
+    if isinstance(value, Mapping | list | tuple):
+        return child_node(parent, key)
+    return None
+
+
+def _same(a: object, a_node: object, b: object, b_node: object) -> bool:
+    """Return True if two values that are not both mappings are equal."""
+    if isinstance(a, Mapping) or isinstance(b, Mapping):
+        return False
+    a_list = isinstance(a, list | tuple)
+    b_list = isinstance(b, list | tuple)
+    if a_list or b_list:
+        return (
+            a_list
+            and b_list
+            and digest(cast(Any, a), a_node) == digest(cast(Any, b), b_node)
+        )
+    return same_scalar(a, b)
+
+
+def _plain(value: object) -> Any:
+    """Return `value` as plain `dict`/`list` data."""
+    if isinstance(value, MappingConfig):
+        return value.to_dict()
+    if isinstance(value, MappingProxyType):
+        items = cast(Mapping[Any, Any], value)
+        return {key: _plain(item) for key, item in items.items()}
+    if isinstance(value, list | tuple):
+        return [_plain(item) for item in cast(list[Any] | tuple[Any, ...], value)]
+    return value
@@ -0,0 +1,106 @@
+"""Compact immutable configuration objects backed by plain Python containers.
+
+`FrozenConfig` is an alternative `MXMConfig` implementation for hot paths. It
+holds already-resolved plain data: mappings become nested `FrozenConfig`
+objects and sequences become tuples. Lookups are single dict accesses, with
+no per-node wrappers, interpolation machinery or flag checks, and instances
+use a fraction of the memory of an equivalent OmegaConf `DictConfig`.
+
+Obtain one from the loader with `load_config(..., backend="frozen")`, or wrap
+plain data directly with `FrozenConfig(mapping)`.
+
+Notes
+-----
+- `FrozenConfig` is always read-only; attribute and item assignment raise.
+- Interpolations are not supported. Values are taken verbatim, so construct
+  instances from resolved data (as the loader does).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+if TYPE_CHECKING:
+    from mxm.types import JSONMap, JSONValue
+
+
+class FrozenConfig(Mapping[str, Any]):
+    """Immutable, slots-based configuration mapping.
+
+    Supports both access styles of `MXMConfig`:
+
+    - attribute access: `cfg.paths.data`
+    - item access:      `cfg["paths"]["data"]`
+
+    Parameters
+    ----------
+    data
+        Plain nested mapping. Nested mappings are wrapped as `FrozenConfig`
+        and lists/tuples are converted to tuples.
+    """
+
+    __slots__ = ("__weakref__", "_data")
+
+    _data: dict[str, Any]
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        object.__setattr__(
+            self,
+            "_data",
+            {key: _freeze(value) for key, value in data.items()},
+        )
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(f"Config has no key {key!r}") from None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise AttributeError("FrozenConfig is immutable.")
+
+    def __delattr__(self, key: str) -> NoReturn:
+        raise AttributeError("FrozenConfig is immutable.")
+
+    def __reduce__(self) -> tuple[type[FrozenConfig], tuple[JSONMap]]:
+        return (FrozenConfig, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"FrozenConfig({self._data!r})"
+
+    def to_dict(self) -> JSONMap:
+        """Return a fresh plain nested `dict`/`list` copy of the config."""
+        return cast("JSONMap", _thaw(self))
+
+
+def _freeze(value: Any) -> Any:
+    """Convert plain nested data into its frozen representation."""
+    if isinstance(value, FrozenConfig):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenConfig(cast(Mapping[str, Any], value))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in cast(list[Any], value))
+    return value
+
+
+def _thaw(value: Any) -> JSONValue:
+    """Convert frozen data back into plain nested `dict`/`list` data."""
+    if isinstance(value, FrozenConfig):
+        return {key: _thaw(item) for key, item in value._data.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in cast(tuple[Any, ...], value)]
+    return cast("JSONValue", value)
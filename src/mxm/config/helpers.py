@@ -9,8 +9,15 @@ Exports
     Construct a fresh config object from a plain Python mapping.
 - `make_view(cfg, path, *, readonly=True, resolve=False) -> MXMConfig`
     Return a focused, read-only view onto a subtree of an existing config.
-- `to_config_data(cfg) -> JSONMap`
+- `select(cfg, path, *, default=...) -> Any`
+    Look up a value or subtree by dotted path, indexed on read-only configs.
+- `path_index_info() -> PathIndexInfo`
+    Report the number and approximate memory of live path indexes.
+- `to_config_data(cfg, *, immutable=False) -> JSONMap`
     Convert an MXMConfig object into plain JSON-shaped configuration data.
+    Conversions of read-only OmegaConf configs are memoized per node.
+- `fingerprint(cfg) -> str`
+    Return a stable Merkle hash of the resolved data, cached per subtree.
 Guidance
 --------
 Use `make_subconfig` when you need to *construct* a new config (e.g. in tests
@@ -19,18 +26,27 @@ config to pass across a package boundary, preserving immutability and provenance
 
 Both helpers return objects that behave like your app config (dot *and* item
 access), backed by OmegaConf `DictConfig` under the hood and typed as `MXMConfig`.
+`make_view`, `select` and `to_config_data` also accept the compact
+`FrozenConfig` returned by `load_config(..., backend="frozen")`, the
+`LazyConfig` returned by `load_config(..., resolution="lazy")` and the
+`SharedConfig` returned by `load_shared_config`.
 """
 
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast, overload
 
-from omegaconf import DictConfig, OmegaConf
+from ._nodecache import NodeCache
+from ._paths import NOT_FOUND, PathIndex
+from ._tree import FINGERPRINTS, MappingConfig as _MappingConfig, digest
+from .types import MXMConfig
 
-from mxm.types import JSONMap
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
 
-from .types import MXMConfig
+    from mxm.types import JSONMap
 
 
 def make_subconfig(
@@ -63,6 +79,8 @@ def make_subconfig(
     - Use `resolve=True` if your subconfig contains `${...}` expressions
       that should be evaluated right away.
     """
+    from omegaconf import OmegaConf
+
     cfg: DictConfig = OmegaConf.create(dict(data))
     if resolve:
         OmegaConf.resolve(cfg)
@@ -83,41 +101,61 @@ def make_view(
 
     This does not deep copy; it returns a `DictConfig` node referencing the same
     underlying subtree. Optionally resolves interpolations and marks the view
-    read-only.
+    read-only. On read-only configs the path is looked up in a path index built
+    on first use (see `select`).
 
     Parameters
     ----------
     cfg
-        The global MXM configuration (OmegaConf `DictConfig` typed as `MXMConfig`).
+        The global MXM configuration (OmegaConf `DictConfig`, `FrozenConfig`,
+        `LazyConfig` or `SharedConfig` typed as `MXMConfig`).
     path
         Dot-separated path into the config (e.g. `"mxm_dataio"` or
         `"mxm_datakraken.sources.justetf.http"`).
     readonly
-        If True (default), mark the returned view as read-only.
+        If True (default), mark the returned view as read-only. Views of the
+        other config types are always read-only.
     resolve
-        If True, resolve interpolations before returning.
+        If True, resolve interpolations before returning. `FrozenConfig` and
+        `SharedConfig` data is already resolved; `LazyConfig` values resolve
+        on access.
 
     Returns
     -------
     MXMConfig
-        A `DictConfig` representing the selected subtree (typed as `MXMConfig`).
+        A config of the same kind as `cfg` representing the selected subtree
+        (typed as `MXMConfig`).
 
     Raises
     ------
     TypeError
-        If `cfg` is not a `DictConfig`.
+        If `cfg` is not a `DictConfig`, `FrozenConfig`, `LazyConfig` or
+        `SharedConfig`.
     KeyError
         If the `path` does not exist in `cfg`.
+    ValueError
+        If `readonly=False` is requested for a config other than a
+        `DictConfig`.
 
     Notes
     -----
     - Use `make_subconfig(mapping)` to construct a *new* config object.
     - Use `make_view(cfg, path)` to pass a *focused view* to a package boundary.
     """
+    if isinstance(cfg, _MappingConfig):
+        if not readonly:
+            raise ValueError(f"{type(cfg).__name__} views are always read-only.")
+        return _mapping_view(cfg, path)
+
+    from omegaconf import DictConfig, OmegaConf
+
     if not isinstance(cfg, DictConfig):
-        raise TypeError("make_view expects an OmegaConf DictConfig (MXMConfig).")
-    selected: object | None = OmegaConf.select(cfg, path)
-    if selected is None:
+        raise TypeError(
+            "make_view expects an OmegaConf DictConfig, FrozenConfig, LazyConfig "
+            "or SharedConfig (MXMConfig)."
+        )
+    selected: object = _select_node(cfg, path)
+    if selected is NOT_FOUND or selected is None:
         raise KeyError(f"Config path not found: '{path}'")
 
     if not isinstance(selected, DictConfig):
@@ -136,30 +174,282 @@ def make_view(
     return view
 
 
-def to_config_data(cfg: MXMConfig) -> JSONMap:
+class PathIndexInfo(NamedTuple):
+    """Memory accounting of the path indexes built by `select` and `make_view`."""
+
+    configs: int
+    """Number of configs with a live path index."""
+    entries: int
+    """Indexed paths summed over all indexes, including memoized leaves."""
+    nbytes: int
+    """Approximate bytes held by the indexes, excluding the configs."""
+
+
+_NO_DEFAULT: Any = object()
+
+
+def select(cfg: MXMConfig, path: str, *, default: Any = _NO_DEFAULT) -> Any:
+    """Return the value or subtree at a dotted path of a config.
+
+    On a read-only OmegaConf config (such as the result of `load_config`) the
+    first call builds a path index of all container nodes; later lookups of
+    any path are a dict access, and leaf values are memoized on first lookup.
+    Writable configs are looked up with `OmegaConf.select` on every call.
+
+    Parameters
+    ----------
+    cfg
+        Configuration object produced by mxm-config.
+    path
+        Dot-separated path (e.g. `"services.db.url"`). Numeric segments index
+        into sequences (`"hosts.0"`).
+    default
+        Value returned if the path does not exist. If omitted, a missing path
+        raises `KeyError`.
+
+    Returns
+    -------
+    Any
+        The leaf value, or the subtree as a config of the same kind as `cfg`.
+        Sequences are returned as OmegaConf `ListConfig` for OmegaConf configs
+        and as tuples otherwise.
+
+    Raises
+    ------
+    TypeError
+        If `cfg` is not a `DictConfig`, `FrozenConfig`, `LazyConfig` or
+        `SharedConfig`.
+    KeyError
+        If the path does not exist and no `default` is given.
+
+    Notes
+    -----
+    - A missing (`???`) value counts as a missing path.
+    - Memoized leaves of a config that was read-only with unresolved
+      interpolations keep their first resolved value.
+    """
+    if isinstance(cfg, _MappingConfig):
+        try:
+            return _walk_mapping(cfg, path)
+        except KeyError:
+            if default is _NO_DEFAULT:
+                raise
+            return default
+
+    from omegaconf import DictConfig
+
+    if not isinstance(cfg, DictConfig):
+        raise TypeError(
+            "select expects an OmegaConf DictConfig, FrozenConfig, LazyConfig or "
+            "SharedConfig (MXMConfig)."
+        )
+
+    value = _select_node(cfg, path)
+    if value is NOT_FOUND:
+        if default is _NO_DEFAULT:
+            raise KeyError(f"Config path not found: '{path}'")
+        return default
+    return value
+
+
+def path_index_info() -> PathIndexInfo:
+    """Return memory accounting of the live path indexes.
+
+    Returns
+    -------
+    PathIndexInfo
+        Named tuple of `configs`, `entries` and `nbytes`.
+    """
+    indexes = _PATH_INDEXES.values()
+    return PathIndexInfo(
+        configs=len(indexes),
+        entries=sum(index.entries for index in indexes),
+        nbytes=sum(index.nbytes for index in indexes),
+    )
+
+
+@overload
+def to_config_data(cfg: MXMConfig, *, immutable: Literal[False] = False) -> JSONMap: ...
+
+
+@overload
+def to_config_data(
+    cfg: MXMConfig, *, immutable: Literal[True]
+) -> Mapping[str, Any]: ...
+
+
+@overload
+def to_config_data(
+    cfg: MXMConfig, *, immutable: bool
+) -> JSONMap | Mapping[str, Any]: ...
+
+
+def to_config_data(
+    cfg: MXMConfig,
+    *,
+    immutable: bool = False,
+) -> JSONMap | Mapping[str, Any]:
     """Convert an MXMConfig view into plain JSON-shaped configuration data.
 
     This helper provides the boundary between OmegaConf-backed configuration
     objects and packages that consume plain configuration data.
 
+    The conversion of a read-only OmegaConf config (such as the result of
+    `load_config` or a read-only view of it) is computed once and memoized,
+    weakly keyed on the config node. The memoized data is dropped as soon as
+    the node is found writable again.
+
     Parameters
     ----------
     cfg
         Configuration object produced by mxm-config.
+    immutable
+        If True, return a read-only structure (`MappingProxyType` mappings
+        and tuples) that is shared between callers without copying. If False
+        (default), return a fresh mutable copy owned by the caller.
 
     Returns
     -------
     JSONMap
         Plain nested Python dictionaries, lists, and scalar values suitable
-        for consumption by downstream packages.
+        for consumption by downstream packages, or their read-only
+        counterparts if `immutable`.
 
     Raises
     ------
     TypeError
-        If cfg is not an OmegaConf DictConfig.
+        If cfg is not an OmegaConf DictConfig, FrozenConfig, LazyConfig or
+        SharedConfig.
+
+    Notes
+    -----
+    - Interpolations of a memoized config are resolved once, at the first
+      conversion. Making a config writable, changing it and making it
+      read-only again between two calls is not detected.
     """
+    if isinstance(cfg, _MappingConfig):
+        data = cfg.to_dict()
+        return _freeze_data(data) if immutable else data
+
+    from omegaconf import DictConfig, OmegaConf
+
     if not isinstance(cfg, DictConfig):
-        raise TypeError("to_config_data expects an OmegaConf DictConfig (MXMConfig).")
+        raise TypeError(
+            "to_config_data expects an OmegaConf DictConfig, FrozenConfig, "
+            "LazyConfig or SharedConfig (MXMConfig)."
+        )
+
+    if not OmegaConf.is_readonly(cfg):
+        _DATA_CACHE.discard(cfg)
+        data = _to_container(cfg)
+        return _freeze_data(data) if immutable else data
+
+    frozen = _cached_data(cfg)
+    return frozen if immutable else cast("JSONMap", _thaw_data(frozen))
+
+
+def fingerprint(cfg: MXMConfig) -> str:
+    """Return a stable content hash of a resolved config.
+
+    The hash is a Merkle tree over the resolved data: every mapping and
+    sequence is hashed from its entries and the digests of its child
+    containers. Mapping keys are hashed in sorted order (by type, then
+    value, so keys of mixed types are fine), and lists and tuples hash
+    alike, so equal data has equal fingerprints across backends, processes
+    and key orders.
+
+    Digests are cached per node for read-only OmegaConf configs (such as the
+    result of `load_config`), `FrozenConfig`, `LazyConfig` and `SharedConfig`.
+    Computing the fingerprint of a config also caches those of all its
+    subtrees, so later calls on the config or on any `make_view` of it are a
+    single lookup.
+
+    Parameters
+    ----------
+    cfg
+        Configuration object produced by mxm-config.
+
+    Returns
+    -------
+    str
+        Hex digest of 40 characters.
+
+    Raises
+    ------
+    TypeError
+        If cfg is not an OmegaConf DictConfig, FrozenConfig, LazyConfig or
+        SharedConfig.
+
+    Notes
+    -----
+    - Writable OmegaConf configs are hashed on every call and nothing is
+      cached for them.
+    - Paths and bytes are hashed by type and value. Other values, which
+      plain configuration data does not contain, are hashed by their type
+      and `repr`.
+    """
+    if isinstance(cfg, _MappingConfig):
+        return digest(cfg, cfg).hex()
+
+    from omegaconf import DictConfig, OmegaConf
+
+    if not isinstance(cfg, DictConfig):
+        raise TypeError(
+            "fingerprint expects an OmegaConf DictConfig, FrozenConfig, "
+            "LazyConfig or SharedConfig (MXMConfig)."
+        )
+
+    if not OmegaConf.is_readonly(cfg):
+        FINGERPRINTS.discard(cfg)
+        return digest(_to_container(cfg), None).hex()
+
+    cached = FINGERPRINTS.get(cfg)
+    if cached is None:
+        cached = digest(_cached_data(cfg), cfg)
+    return cached.hex()
+
+
+_DATA_CACHE: NodeCache[Mapping[str, Any]] = NodeCache()
+"""Memoized read-only `to_config_data` results of read-only nodes."""
+
+_PATH_INDEXES: NodeCache[PathIndex] = NodeCache()
+"""Dotted-path indexes of read-only nodes, built on first lookup."""
+
+
+def _cached_data(cfg: DictConfig) -> Mapping[str, Any]:
+    """Return the memoized read-only conversion of `cfg`, computing it once."""
+    data = _DATA_CACHE.get(cfg)
+    if data is None:
+        data = _freeze_data(_to_container(cfg))
+        _DATA_CACHE.put(cfg, data)
+    return data
+
+
+def _select_node(cfg: DictConfig, path: str) -> Any:
+    """Return the node or value at `path` of `cfg`, or `NOT_FOUND`.
+
+    Read-only configs are served from their path index; writable configs and
+    paths the index cannot answer go through `OmegaConf.select`.
+    """
+    from omegaconf import OmegaConf
+
+    if OmegaConf.is_readonly(cfg):
+        index = _PATH_INDEXES.get(cfg)
+        if index is None:
+            index = PathIndex(cfg)
+            _PATH_INDEXES.put(cfg, index)
+        value = index.lookup(path)
+        if value is not NOT_FOUND:
+            return value
+    else:
+        _PATH_INDEXES.discard(cfg)
+
+    return OmegaConf.select(cfg, path, default=NOT_FOUND)
+
+
+def _to_container(cfg: DictConfig) -> JSONMap:
+    """Convert `cfg` into fresh plain data, resolving interpolations."""
+    from omegaconf import OmegaConf
 
     data = OmegaConf.to_container(
         cfg,
@@ -170,4 +460,79 @@ def to_config_data(cfg: MXMConfig) -> JSONMap:
     if not isinstance(data, dict):
         raise TypeError("to_config_data expects a mapping configuration root.")
 
-    return cast(JSONMap, data)
+    return cast("JSONMap", data)
+
+
+def _freeze_data(data: JSONMap) -> Mapping[str, Any]:
+    """Convert freshly built plain data into its read-only form in place.
+
+    Nested dicts are wrapped in `MappingProxyType` and lists become tuples.
+    `data` itself must not be used afterwards.
+    """
+    for key, value in data.items():
+        data[key] = _freeze_value(value)
+    return MappingProxyType(data)
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _freeze_data(cast("JSONMap", value))
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in cast(list[Any], value))
+    return value
+
+
+def _thaw_data(value: Any) -> Any:
+    """Return a mutable deep copy of data produced by `_freeze_data`."""
+    if isinstance(value, MappingProxyType):
+        items = cast(Mapping[str, Any], value)
+        return {key: _thaw_data(item) for key, item in items.items()}
+    if isinstance(value, tuple):
+        return [_thaw_data(item) for item in cast(tuple[Any, ...], value)]
+    return value
+
+
+def _mapping_view(
+    cfg: _MappingConfig,
+    path: str,
+) -> _MappingConfig:
+    """Select the subtree at dotted `path` of a mapping-backed config.
+
+    Mirrors `make_view` semantics for OmegaConf configs: numeric path segments
+    index into sequences, missing paths raise `KeyError` and non-mapping
+    targets raise `TypeError`.
+    """
+    kind: type[_MappingConfig] = type(cfg)
+    node = _walk_mapping(cfg, path)
+    if not isinstance(node, kind):
+        raise TypeError(
+            f"make_view expects the path to resolve to a mapping ({kind.__name__}). "
+            f"Path '{path}' resolved to {type(node).__name__}. "
+            "Select the parent mapping as a view and access the leaf inside it."
+        )
+
+    return node
+
+
+def _walk_mapping(cfg: _MappingConfig, path: str) -> object:
+    """Return the value at dotted `path` of a mapping-backed config.
+
+    Raises
+    ------
+    KeyError
+        If the path does not exist.
+    """
+    kind: type[_MappingConfig] = type(cfg)
+    node: object = cfg
+    for segment in path.split("."):
+        if isinstance(node, kind) and segment in node:
+            node = node[segment]
+        elif isinstance(node, tuple) and segment.isdigit():
+            items = cast(tuple[object, ...], node)
+            if int(segment) >= len(items):
+                raise KeyError(f"Config path not found: '{path}'")
+            node = items[int(segment)]
+        else:
+            raise KeyError(f"Config path not found: '{path}'")
+
+    return node
@@ -0,0 +1,118 @@
+"""Configurations whose interpolations are resolved on first access.
+
+By default `load_config` resolves every `${...}` interpolation of the merged
+tree up front, although a process typically reads only a small part of it.
+`load_config(..., resolution="lazy")` instead returns a `LazyConfig`: a
+read-only wrapper around the merged, unresolved OmegaConf tree that resolves a
+value the first time it is accessed and memoizes it.
+
+Resolution itself is delegated to OmegaConf, so interpolation semantics, cycle
+detection and error types and messages are the same as with eager resolution.
+Errors surface on access of the affected value instead of at load time, and
+their message additionally names the key being accessed.
+
+Notes
+-----
+- `LazyConfig` is read-only; attribute and item assignment raise.
+- Nested mappings are returned as `LazyConfig` and sequences as tuples, the
+  same shapes as `FrozenConfig`. A sequence is resolved as a whole on first
+  access.
+- Custom resolvers run once per value, at first access rather than at load.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
+
+    from mxm.types import JSONMap
+
+
+class LazyConfig(Mapping[str, Any]):
+    """Read-only configuration mapping resolving values on first access.
+
+    Supports both access styles of `MXMConfig`:
+
+    - attribute access: `cfg.paths.data`
+    - item access:      `cfg["paths"]["data"]`
+
+    Parameters
+    ----------
+    node
+        Read-only OmegaConf `DictConfig` whose interpolations are not yet
+        resolved.
+    """
+
+    __slots__ = ("__weakref__", "_node", "_values")
+
+    _node: DictConfig
+    _values: dict[str, Any]
+
+    def __init__(self, node: DictConfig) -> None:
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(f"Config has no key {key!r}") from None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        value = _wrap(self._node[key])
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._node
+
+    def __iter__(self) -> Iterator[str]:
+        return cast(Iterator[str], iter(self._node))
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise AttributeError("LazyConfig is immutable.")
+
+    def __delattr__(self, key: str) -> NoReturn:
+        raise AttributeError("LazyConfig is immutable.")
+
+    def __reduce__(self) -> tuple[type[LazyConfig], tuple[DictConfig]]:
+        return (LazyConfig, (self._node,))
+
+    def __repr__(self) -> str:
+        return f"LazyConfig({self._node!r})"
+
+    def to_dict(self, *, resolve: bool = True) -> JSONMap:
+        """Return a fresh plain nested `dict`/`list` copy of the config.
+
+        Parameters
+        ----------
+        resolve
+            If True (default), resolve all interpolations. If False, they are
+            returned verbatim as `${...}` strings.
+        """
+        from omegaconf import OmegaConf
+
+        data = OmegaConf.to_container(self._node, resolve=resolve, enum_to_str=True)
+        return cast("JSONMap", data)
+
+
+def _wrap(value: Any) -> Any:
+    """Convert a resolved OmegaConf value into its lazy representation."""
+    from omegaconf import DictConfig, ListConfig
+
+    if isinstance(value, DictConfig):
+        return LazyConfig(value)
+    if isinstance(value, ListConfig):
+        return tuple(_wrap(item) for item in value)
+    return value
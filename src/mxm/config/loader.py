@@ -24,25 +24,144 @@ The default configuration store root is:
 ~/mxm-config-store
 ```
 
+Dimension files are parsed selectively: their top-level keys are indexed from
+the YAML event stream, and only the selected block is parsed.
+
+Layers are parsed into plain Python data and deep-merged with the semantics
+of `OmegaConf.merge` (see `mxm.config._merge`); only the final result is
+wrapped into an OmegaConf `DictConfig`.
+
+Parsed layer files are cached in-process. The cache is keyed by a stat
+fingerprint `(path, inode, size, mtime_ns)`, so an unchanged file is parsed
+once per process and an edited file is re-parsed on the next load. Use
+`clear_cache()` to drop cached layers and `cache_info()` to inspect hit and
+miss counters.
+
+`load_configs(...)` resolves many identities in one pass, reading each
+application's layer files once and collecting failures per identity.
+
+Merges are shared as well: identities with the same leading selectors reuse
+the cached merge of `default.yaml` with those leading blocks, so resolving many
+roles on one machine costs one prefix merge plus one small merge per role.
+
+`load_config(..., cache=True)` additionally memoizes the resolved, read-only
+result keyed by identity, layer fingerprints and overrides.
+
+`load_config(..., snapshots=SnapshotCache())` persists resolved results on
+disk, keyed by layer file contents, so short-lived processes can skip parsing
+entirely.
+
+`aload_config(...)` and `aload_configs(...)` are asyncio variants that read
+and parse layer files in worker threads and merge on the event loop.
+
+`load_config(..., backend="frozen")` returns a compact immutable
+`FrozenConfig` instead of an OmegaConf `DictConfig` for hot read paths.
+
+`load_config(..., resolution="lazy")` skips the eager `OmegaConf.resolve` and
+returns a `LazyConfig` that resolves and memoizes values on first access.
+
+`load_config(..., report=LoadReport())` records wall time per stage and per
+layer file, bytes read and node counts for diagnosing slow loads.
+
 `mxm-config` does not discover runtime identity and does not manage secrets.
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from pathlib import Path
-from typing import Any, cast
+import functools
+import io
+import re
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path, PosixPath, WindowsPath
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from mxm.config._lru import CacheInfo, LRUCache
+from mxm.config._merge import merge_data
+from mxm.config._selective import index_top_level
+from mxm.config._tree import digest
+from mxm.config.frozen import FrozenConfig
+from mxm.config.helpers import make_subconfig, to_config_data
+from mxm.config.lazy import LazyConfig
+from mxm.config.provenance import LAYERS, Provenance
+from mxm.config.report import LoadReport, LoadSource, count_nodes, stage_timer
+from mxm.config.types import MXMConfig
 
-from omegaconf import DictConfig, ListConfig, OmegaConf
+if TYPE_CHECKING:
+    # OmegaConf is imported on first use so that snapshot hits and the frozen
+    # backend do not pay its import cost.
+    from omegaconf import DictConfig
 
-from mxm.config.types import MXMConfig
-from mxm.types import RuntimeIdentity
+    from mxm.config.snapshot import SnapshotCache
+    from mxm.types import RuntimeIdentity
 
 DEFAULT_CONFIG_STORE_ROOT = Path.home() / "mxm-config-store"
 """Default local path to the authoritative MXM configuration store."""
 
-Layer = DictConfig | ListConfig
-"""OmegaConf layer type accepted by `OmegaConf.merge`."""
+type LayerData = dict[str, Any]
+"""Parsed layer file, selected block or merge of them, as plain Python data."""
+
+FileFingerprint = tuple[str, int, int, int]
+"""Stat fingerprint of a layer file: `(path, inode, size, mtime_ns)`."""
+
+LayerFingerprints = tuple[FileFingerprint | None, ...]
+"""Fingerprints of all layer files in `LAYER_FILES` order; `None` if absent."""
+
+AppKey = tuple[str, LayerFingerprints]
+"""Application snapshot key: app root and layer fingerprints."""
+
+ResultKey = tuple[str, str, tuple[str, ...], LayerFingerprints, str]
+"""Resolved config cache key: app root, backend and resolution mode, selectors,
+fingerprints, overrides digest."""
+
+Backend = Literal["omegaconf", "frozen"]
+"""Representation returned by the loader: OmegaConf `DictConfig` or `FrozenConfig`."""
+
+BACKENDS: tuple[Backend, ...] = ("omegaconf", "frozen")
+"""Supported loader backends."""
+
+Resolution = Literal["eager", "lazy"]
+"""When interpolations are resolved: during the load or on first access."""
+
+RESOLUTIONS: tuple[Resolution, ...] = ("eager", "lazy")
+"""Supported interpolation resolution modes."""
+
+DIMENSIONS = ("environment", "machine", "substrate", "role")
+"""Identity dimensions in precedence order, lowest first."""
+
+LAYER_FILES = ("default.yaml", *(f"{dimension}.yaml" for dimension in DIMENSIONS))
+"""Layer file names in precedence order, lowest first."""
+
+LAYER_CACHE_MAXSIZE = 256
+"""Maximum number of parsed layer files kept in the in-process cache."""
+
+APP_CACHE_MAXSIZE = 32
+"""Maximum number of application snapshots (parsed layers plus merged prefixes)."""
+
+RESULT_CACHE_MAXSIZE = 64
+"""Maximum number of resolved configs kept for `load_config(cache=True)`."""
+
+_LAYER_CACHE: LRUCache[FileFingerprint, LayerData | _DimensionFile] = LRUCache(
+    maxsize=LAYER_CACHE_MAXSIZE
+)
+_APP_CACHE: LRUCache[AppKey, _AppLayers] = LRUCache(maxsize=APP_CACHE_MAXSIZE)
+_RESULT_CACHE: LRUCache[ResultKey, MXMConfig] = LRUCache(maxsize=RESULT_CACHE_MAXSIZE)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+
+_YAML_FLOAT = re.compile(
+    r"""^(?:
+     [-+]?[0-9]+(?:_[0-9]+)*\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?:[eE][-+]?[0-9]+)
+    |\.[0-9]+(?:_[0-9]+)*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$""",
+    re.X,
+)
+"""OmegaConf's float pattern; unlike YAML 1.1 it accepts `1e3` and `1_000.5`."""
 
 
 def load_config(
@@ -50,6 +169,12 @@ def load_config(
     identity: RuntimeIdentity,
     store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
     overrides: Mapping[str, Any] | None = None,
+    cache: bool = False,
+    snapshots: SnapshotCache | None = None,
+    backend: Backend = "omegaconf",
+    resolution: Resolution = "eager",
+    report: LoadReport | None = None,
+    provenance: Provenance | None = None,
 ) -> MXMConfig:
     """Load and resolve configuration for a runtime identity.
 
@@ -62,12 +187,273 @@ def load_config(
         `~/mxm-config-store`.
     overrides
         Optional explicit override mapping applied after all store layers.
+    cache
+        If True, memoize the resolved configuration. Subsequent calls with the
+        same identity, unchanged layer files and equal overrides return the
+        same shared read-only object instead of merging and resolving again.
+    snapshots
+        Optional persistent snapshot cache. On a hit the resolved data is
+        restored from disk without parsing YAML; on a miss the resolved result
+        is written back for later processes.
+    backend
+        Representation of the returned config. `"omegaconf"` (default) returns
+        an OmegaConf `DictConfig`; `"frozen"` returns a compact immutable
+        `FrozenConfig` backed by plain dicts and tuples.
+    resolution
+        `"eager"` (default) resolves all interpolations during the load.
+        `"lazy"` returns a `LazyConfig` that resolves and memoizes each value
+        on first access, so the cost follows what the caller reads.
+        Interpolation errors then surface on access. Not supported with
+        `backend="frozen"` or `snapshots`, which need fully resolved data.
+    report
+        Optional `LoadReport` filled in with per-stage and per-file timings,
+        bytes read and node counts. It is reset first. Also filled in, up to
+        the failing stage, if the load raises.
+    provenance
+        Optional `Provenance` filled in with the layer that supplied each
+        leaf. It is cleared first. Loads recording provenance always merge
+        the layers: they neither read nor write the result cache and
+        snapshots.
+
+    Returns
+    -------
+    MXMConfig
+        A read-only configuration object typed against the lightweight
+        `MXMConfig` protocol.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the application configuration root or `default.yaml` is missing.
+    KeyError
+        If a dimension file exists but does not contain the selected identity
+        value.
+    ValueError
+        If `backend` or `resolution` is unknown, or `resolution="lazy"` is
+        combined with `backend="frozen"` or `snapshots`.
+
+    Notes
+    -----
+    - With `cache=True` the returned object is shared between callers. Do not
+      lift its read-only flag.
+    """
+    if provenance is not None:
+        # Validate the caller's arguments before bypassing the caches.
+        _check_resolution(resolution, backend=backend, snapshots=snapshots)
+        provenance.clear()
+        cache, snapshots = False, None
+
+    if report is None:
+        result, _ = _load_config(
+            identity=identity,
+            store_root=store_root,
+            overrides=overrides,
+            cache=cache,
+            snapshots=snapshots,
+            backend=backend,
+            resolution=resolution,
+            report=None,
+            provenance=provenance,
+        )
+        return result
+
+    report.clear()
+    start = time.perf_counter()
+    try:
+        result, report.source = _load_config(
+            identity=identity,
+            store_root=store_root,
+            overrides=overrides,
+            cache=cache,
+            snapshots=snapshots,
+            backend=backend,
+            resolution=resolution,
+            report=report,
+            provenance=provenance,
+        )
+    finally:
+        report.total_seconds = time.perf_counter() - start
+
+    report.nodes = count_nodes(
+        result.to_dict(resolve=False)
+        if isinstance(result, LazyConfig)
+        else to_config_data(result, immutable=True)
+    )
+    return result
+
+
+def _load_config(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path,
+    overrides: Mapping[str, Any] | None,
+    cache: bool,
+    snapshots: SnapshotCache | None,
+    backend: Backend,
+    resolution: Resolution,
+    report: LoadReport | None,
+    provenance: Provenance | None = None,
+) -> tuple[MXMConfig, LoadSource]:
+    """Implement `load_config`, recording stage timings into `report`.
+
+    Returns the config together with where it came from.
+    """
+    _check_backend(backend)
+    _check_resolution(resolution, backend=backend, snapshots=snapshots)
+    with stage_timer(report, "stat"):
+        app_root = _app_config_root(identity=identity, store_root=store_root)
+        fingerprints = _layer_fingerprints(app_root)
+
+    cache_key: ResultKey | None = None
+    if cache:
+        cache_key = _result_cache_key(
+            app_root=app_root,
+            identity=identity,
+            fingerprints=fingerprints,
+            overrides=overrides,
+            backend=backend,
+            resolution=resolution,
+        )
+        cached = _RESULT_CACHE.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            return cached, "result-cache"
+
+    snapshot_key: str | None = None
+    if snapshots is not None:
+        with stage_timer(report, "snapshot"):
+            snapshot_key = snapshots.key(
+                layer_paths=[app_root / name for name in LAYER_FILES],
+                selectors=_selectors(identity),
+                overrides=overrides,
+            )
+            data = snapshots.get(snapshot_key) if snapshot_key is not None else None
+        if data is not None:
+            with stage_timer(report, "convert"):
+                restored = (
+                    FrozenConfig(data) if backend == "frozen" else make_subconfig(data)
+                )
+            if cache_key is not None:
+                _RESULT_CACHE.put(cache_key, restored)
+            return restored, "snapshot"
+
+    app_layers = _get_app_layers(
+        app_root=app_root, fingerprints=fingerprints, report=report
+    )
+    merged = _merge_identity(
+        app_layers,
+        identity,
+        overrides=overrides,
+        resolve=resolution == "eager",
+        report=report,
+        provenance=provenance,
+    )
+
+    result = _as_result(merged, resolution)
+    if backend == "frozen" or snapshot_key is not None:
+        with stage_timer(report, "convert"):
+            data = to_config_data(result)
+        if snapshots is not None and snapshot_key is not None:
+            with stage_timer(report, "snapshot"):
+                snapshots.put(snapshot_key, data)
+        if backend == "frozen":
+            with stage_timer(report, "convert"):
+                result = FrozenConfig(data)
+
+    if cache_key is not None:
+        _RESULT_CACHE.put(cache_key, result)
+
+    return result, "merge"
+
+
+def load_configs(
+    identities: Iterable[RuntimeIdentity],
+    *,
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    overrides: Mapping[str, Any] | None = None,
+    backend: Backend = "omegaconf",
+    resolution: Resolution = "eager",
+) -> ConfigBatch:
+    """Load and resolve configuration for many runtime identities.
+
+    Each application's layer files are read once per batch; identity-specific
+    blocks are then selected from the in-memory trees. Failures are collected
+    per identity instead of aborting the batch.
+
+    Parameters
+    ----------
+    identities
+        Runtime identities to resolve. Duplicates are resolved once.
+    store_root
+        Root directory of the configuration store. Defaults to
+        `~/mxm-config-store`.
+    overrides
+        Optional explicit override mapping applied to every identity after all
+        store layers.
+    backend
+        Representation of the returned configs; see `load_config`.
+    resolution
+        Interpolation resolution mode; see `load_config`.
+
+    Returns
+    -------
+    ConfigBatch
+        Read-only mapping from identity to resolved config for every identity
+        that resolved successfully. Exceptions for the remaining identities
+        are available via `ConfigBatch.errors`.
+
+    Raises
+    ------
+    ValueError
+        If `backend` or `resolution` is unknown or they are incompatible.
+    """
+    _check_backend(backend)
+    _check_resolution(resolution, backend=backend)
+    unique = list(dict.fromkeys(identities))
+    apps: dict[str, _AppLayers | Exception] = {}
+    for identity in unique:
+        app = str(identity.app)
+        if app not in apps:
+            try:
+                app_root = _app_config_root(identity=identity, store_root=store_root)
+                apps[app] = _get_app_layers(
+                    app_root=app_root,
+                    fingerprints=_layer_fingerprints(app_root),
+                )
+            except Exception as exc:
+                apps[app] = exc
+
+    return _merge_batch(
+        unique, apps, overrides=overrides, backend=backend, resolution=resolution
+    )
+
+
+async def aload_config(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    overrides: Mapping[str, Any] | None = None,
+    cache: bool = False,
+    snapshots: SnapshotCache | None = None,
+    backend: Backend = "omegaconf",
+    resolution: Resolution = "eager",
+) -> MXMConfig:
+    """Asynchronously load and resolve configuration for a runtime identity.
+
+    Equivalent to `load_config` for use from an asyncio event loop. Stat, read
+    and parse of the layer files run concurrently in worker threads; merging
+    and resolution run on the calling loop once all layers are ready.
+    Precedence, caching and errors are the same as for `load_config`.
+
+    Parameters
+    ----------
+    identity, store_root, overrides, cache, snapshots, backend, resolution
+        See `load_config`.
 
     Returns
     -------
     MXMConfig
-        A read-only OmegaConf-backed configuration object typed against the
-        lightweight `MXMConfig` protocol.
+        A read-only configuration object typed against the lightweight
+        `MXMConfig` protocol.
 
     Raises
     ------
@@ -76,56 +462,658 @@ def load_config(
     KeyError
         If a dimension file exists but does not contain the selected identity
         value.
+    ValueError
+        If `backend` or `resolution` is unknown or they are incompatible.
+    """
+    import asyncio
+
+    _check_backend(backend)
+    _check_resolution(resolution, backend=backend, snapshots=snapshots)
+    app_root, fingerprints = await asyncio.to_thread(
+        _app_root_and_fingerprints, identity=identity, store_root=store_root
+    )
+
+    cache_key: ResultKey | None = None
+    if cache:
+        cache_key = _result_cache_key(
+            app_root=app_root,
+            identity=identity,
+            fingerprints=fingerprints,
+            overrides=overrides,
+            backend=backend,
+            resolution=resolution,
+        )
+        cached = _RESULT_CACHE.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            return cached
+
+    snapshot_key: str | None = None
+    if snapshots is not None:
+        snapshot_key = await asyncio.to_thread(
+            snapshots.key,
+            layer_paths=[app_root / name for name in LAYER_FILES],
+            selectors=_selectors(identity),
+            overrides=overrides,
+        )
+        data = (
+            await asyncio.to_thread(snapshots.get, snapshot_key)
+            if snapshot_key is not None
+            else None
+        )
+        if data is not None:
+            restored = (
+                FrozenConfig(data) if backend == "frozen" else make_subconfig(data)
+            )
+            if cache_key is not None:
+                _RESULT_CACHE.put(cache_key, restored)
+            return restored
+
+    app_layers = await _aget_app_layers(
+        app_root=app_root,
+        fingerprints=fingerprints,
+        selectors=[_selectors(identity)],
+    )
+    merged = _merge_identity(
+        app_layers, identity, overrides=overrides, resolve=resolution == "eager"
+    )
+
+    result = _as_result(merged, resolution)
+    if backend == "frozen" or snapshot_key is not None:
+        data = to_config_data(result)
+        if snapshots is not None and snapshot_key is not None:
+            await asyncio.to_thread(snapshots.put, snapshot_key, data)
+        if backend == "frozen":
+            result = FrozenConfig(data)
+
+    if cache_key is not None:
+        _RESULT_CACHE.put(cache_key, result)
+
+    return result
+
+
+async def aload_configs(
+    identities: Iterable[RuntimeIdentity],
+    *,
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    overrides: Mapping[str, Any] | None = None,
+    backend: Backend = "omegaconf",
+    resolution: Resolution = "eager",
+) -> ConfigBatch:
+    """Asynchronously load and resolve configuration for many identities.
+
+    Equivalent to `load_configs` for use from an asyncio event loop. The layer
+    files of all applications are read and parsed concurrently in worker
+    threads; merging and resolution run on the calling loop.
+
+    Parameters
+    ----------
+    identities, store_root, overrides, backend, resolution
+        See `load_configs`.
+
+    Returns
+    -------
+    ConfigBatch
+        Read-only mapping from identity to resolved config, with per-identity
+        failures in `ConfigBatch.errors`.
+
+    Raises
+    ------
+    ValueError
+        If `backend` or `resolution` is unknown or they are incompatible.
+    """
+    import asyncio
+
+    _check_backend(backend)
+    _check_resolution(resolution, backend=backend)
+    unique = list(dict.fromkeys(identities))
+    members: dict[str, list[RuntimeIdentity]] = {}
+    for identity in unique:
+        members.setdefault(str(identity.app), []).append(identity)
+
+    async def _read_app(app_identities: list[RuntimeIdentity]) -> _AppLayers:
+        app_root, fingerprints = await asyncio.to_thread(
+            _app_root_and_fingerprints,
+            identity=app_identities[0],
+            store_root=store_root,
+        )
+        return await _aget_app_layers(
+            app_root=app_root,
+            fingerprints=fingerprints,
+            selectors=[_selectors(identity) for identity in app_identities],
+        )
+
+    results = await asyncio.gather(
+        *(_read_app(app_identities) for app_identities in members.values()),
+        return_exceptions=True,
+    )
+    apps: dict[str, _AppLayers | Exception] = {}
+    for app, result in zip(members, results, strict=True):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        apps[app] = result
+
+    return _merge_batch(
+        unique, apps, overrides=overrides, backend=backend, resolution=resolution
+    )
+
+
+class ConfigBatch(Mapping["RuntimeIdentity", MXMConfig]):
+    """Result of `load_configs`: resolved configs plus per-identity errors.
+
+    Behaves as a read-only mapping from `RuntimeIdentity` to `MXMConfig` for
+    the identities that resolved successfully. Identities that failed are
+    absent from the mapping and listed in `errors`.
+    """
+
+    __slots__ = ("_configs", "_errors")
+
+    def __init__(
+        self,
+        configs: dict[RuntimeIdentity, MXMConfig],
+        errors: dict[RuntimeIdentity, Exception],
+    ) -> None:
+        self._configs = configs
+        self._errors = errors
+
+    @property
+    def errors(self) -> Mapping[RuntimeIdentity, Exception]:
+        """Exceptions raised while resolving each failed identity."""
+        return MappingProxyType(self._errors)
+
+    def __getitem__(self, identity: RuntimeIdentity) -> MXMConfig:
+        return self._configs[identity]
+
+    def __iter__(self) -> Iterator[RuntimeIdentity]:
+        return iter(self._configs)
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def __repr__(self) -> str:
+        return f"ConfigBatch(configs={len(self._configs)}, errors={len(self._errors)})"
+
+
+def clear_cache() -> None:
+    """Drop all cached layers, merged prefixes and resolved configs.
+
+    Cache statistics are reset as well.
+    """
+    _LAYER_CACHE.clear()
+    _APP_CACHE.clear()
+    _RESULT_CACHE.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the parsed layer cache.
+
+    A load that reuses the cached layers of its application counts one hit
+    per layer file, as if each file had been looked up in the layer cache.
+
+    Returns
+    -------
+    CacheInfo
+        Named tuple of `hits`, `misses`, `maxsize` and `currsize`.
+    """
+    return _LAYER_CACHE.info()
+
+
+def result_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the resolved config cache.
+
+    Returns
+    -------
+    CacheInfo
+        Named tuple of `hits`, `misses`, `maxsize` and `currsize`.
     """
+    return _RESULT_CACHE.info()
+
+
+def _selectors(identity: RuntimeIdentity) -> tuple[str, str, str, str]:
+    """Return the identity's selectors in `DIMENSIONS` order."""
+    return (
+        str(identity.environment),
+        str(identity.machine),
+        str(identity.substrate),
+        str(identity.role),
+    )
+
+
+def _layer_fingerprints(app_root: Path) -> LayerFingerprints:
+    """Return stat fingerprints of all layer files in `LAYER_FILES` order."""
+    return tuple(_fingerprint(app_root / name) for name in LAYER_FILES)
+
+
+def _app_root_and_fingerprints(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path,
+) -> tuple[Path, LayerFingerprints]:
+    """Return the validated app root and its layer fingerprints."""
     app_root = _app_config_root(identity=identity, store_root=store_root)
+    return app_root, _layer_fingerprints(app_root)
+
+
+def _merge_batch(
+    identities: Iterable[RuntimeIdentity],
+    apps: Mapping[str, _AppLayers | Exception],
+    *,
+    overrides: Mapping[str, Any] | None,
+    backend: Backend,
+    resolution: Resolution,
+) -> ConfigBatch:
+    """Merge every identity against its app's layers, collecting failures."""
+    configs: dict[RuntimeIdentity, MXMConfig] = {}
+    errors: dict[RuntimeIdentity, Exception] = {}
+
+    for identity in identities:
+        app_layers = apps[str(identity.app)]
+        if isinstance(app_layers, Exception):
+            errors[identity] = app_layers
+            continue
+
+        try:
+            merged = _merge_identity(
+                app_layers,
+                identity,
+                overrides=overrides,
+                resolve=resolution == "eager",
+            )
+        except Exception as exc:
+            errors[identity] = exc
+            continue
+
+        result = _as_result(merged, resolution)
+        configs[identity] = (
+            FrozenConfig(to_config_data(result)) if backend == "frozen" else result
+        )
+
+    return ConfigBatch(configs, errors)
+
+
+@dataclass(frozen=True, slots=True)
+class _AppLayers:
+    """Parsed layer files of one application snapshot and its merged prefixes.
+
+    Parsed files are shared through the layer cache and must not be mutated.
+    """
+
+    app_root: Path
+    fingerprints: LayerFingerprints
+    default: LayerData
+    dimensions: tuple[_DimensionFile | None, ...]
+    """Dimension files in `DIMENSIONS` order; `None` if absent."""
+    prefixes: _PrefixNode
+    """Root of the merged-prefix trie; holds `default.yaml` itself."""
 
-    layers: list[Layer] = []
 
-    default_cfg = _load_required_yaml(app_root / "default.yaml")
-    layers.append(default_cfg)
+class _PrefixNode:
+    """Node of the merged-prefix trie.
 
-    environment_cfg = _load_selected_block(
-        path=app_root / "environment.yaml",
-        selector=str(identity.environment),
-        dimension="environment",
+    A node at depth `d` holds the merge of `default.yaml` with the selected
+    blocks of the first `d` dimensions. Children are keyed by the next
+    dimension's selector, or `None` when that dimension's file is absent, so
+    identities sharing leading selectors share their prefix merges. The last
+    dimension is not stored: its merge is done per identity together with the
+    overrides.
+    """
+
+    __slots__ = ("children", "merged")
+
+    def __init__(self, merged: LayerData) -> None:
+        self.merged = merged
+        self.children: dict[str | None, _PrefixNode] = {}
+
+
+def _get_app_layers(
+    *,
+    app_root: Path,
+    fingerprints: LayerFingerprints,
+    report: LoadReport | None = None,
+) -> _AppLayers:
+    """Return the cached snapshot for `app_root`, reading it if needed."""
+    key: AppKey = (str(app_root), fingerprints)
+    cached = _APP_CACHE.get(key)
+    if cached is not None:
+        _count_layer_hits(fingerprints)
+        if report is not None:
+            for name, fingerprint in zip(LAYER_FILES, fingerprints, strict=True):
+                if fingerprint is not None:
+                    report.layer(app_root / name).cached = True
+        return cached
+
+    app_layers = _read_app_layers(
+        app_root=app_root, fingerprints=fingerprints, report=report
+    )
+    _APP_CACHE.put(key, app_layers)
+    return app_layers
+
+
+def _count_layer_hits(fingerprints: LayerFingerprints) -> None:
+    """Count the present layer files of a reused snapshot as layer cache hits."""
+    _LAYER_CACHE.count_hits(
+        sum(fingerprint is not None for fingerprint in fingerprints)
+    )
+
+
+def _read_app_layers(
+    *,
+    app_root: Path,
+    fingerprints: LayerFingerprints,
+    report: LoadReport | None = None,
+) -> _AppLayers:
+    """Parse `default.yaml` and index all present dimension files of an app.
+
+    Parameters
+    ----------
+    app_root
+        App-specific configuration directory.
+    fingerprints
+        Stat fingerprints of the layer files in `LAYER_FILES` order.
+    report
+        Optional report to record per-file timings into.
+
+    Returns
+    -------
+    _AppLayers
+        Parsed layer files with an empty merged-prefix trie.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `default.yaml` is missing.
+    TypeError
+        If a layer file's root is not a mapping.
+    """
+    default = _load_required_yaml(
+        app_root / LAYER_FILES[0], fingerprints[0], report=report
+    )
+    dimensions = tuple(
+        _load_dimension_file(app_root / name, dimension, fingerprint, report=report)
+        for dimension, name, fingerprint in zip(
+            DIMENSIONS, LAYER_FILES[1:], fingerprints[1:], strict=True
+        )
     )
-    if environment_cfg is not None:
-        layers.append(environment_cfg)
 
-    machine_cfg = _load_selected_block(
-        path=app_root / "machine.yaml",
-        selector=str(identity.machine),
-        dimension="machine",
+    return _AppLayers(
+        app_root=app_root,
+        fingerprints=fingerprints,
+        default=default,
+        dimensions=dimensions,
+        prefixes=_PrefixNode(default),
     )
-    if machine_cfg is not None:
-        layers.append(machine_cfg)
 
-    substrate_cfg = _load_selected_block(
-        path=app_root / "substrate.yaml",
-        selector=str(identity.substrate),
-        dimension="substrate",
+
+async def _aget_app_layers(
+    *,
+    app_root: Path,
+    fingerprints: LayerFingerprints,
+    selectors: Iterable[tuple[str, ...]],
+) -> _AppLayers:
+    """Asynchronous `_get_app_layers` that also parses the selected blocks.
+
+    Layer files are parsed concurrently in worker threads. The blocks named by
+    `selectors` are then parsed in worker threads as well, so that the merge
+    on the event loop does not parse YAML.
+    """
+    import asyncio
+
+    key: AppKey = (str(app_root), fingerprints)
+    app_layers = _APP_CACHE.get(key)
+    if app_layers is None:
+        app_layers = await _aread_app_layers(
+            app_root=app_root, fingerprints=fingerprints
+        )
+        _APP_CACHE.put(key, app_layers)
+    else:
+        _count_layer_hits(fingerprints)
+
+    pending = {
+        (dimension_file, selector)
+        for identity_selectors in selectors
+        for dimension_file, selector in zip(
+            app_layers.dimensions, identity_selectors, strict=True
+        )
+        if dimension_file is not None and not dimension_file.is_selected(selector)
+    }
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(dimension_file.prefetch, selector)
+            for dimension_file, selector in pending
+        )
     )
-    if substrate_cfg is not None:
-        layers.append(substrate_cfg)
+    return app_layers
+
+
+async def _aread_app_layers(
+    *,
+    app_root: Path,
+    fingerprints: LayerFingerprints,
+) -> _AppLayers:
+    """Asynchronous `_read_app_layers` parsing all layer files concurrently.
 
-    role_cfg = _load_selected_block(
-        path=app_root / "role.yaml",
-        selector=str(identity.role),
-        dimension="role",
+    If several layer files fail, the error of the first one in precedence
+    order is raised, as with the synchronous reader.
+    """
+    import asyncio
+
+    results = await asyncio.gather(
+        asyncio.to_thread(
+            _load_required_yaml, app_root / LAYER_FILES[0], fingerprints[0]
+        ),
+        *(
+            asyncio.to_thread(
+                _load_dimension_file, app_root / name, dimension, fingerprint
+            )
+            for dimension, name, fingerprint in zip(
+                DIMENSIONS, LAYER_FILES[1:], fingerprints[1:], strict=True
+            )
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    default = cast(LayerData, results[0])
+    return _AppLayers(
+        app_root=app_root,
+        fingerprints=fingerprints,
+        default=default,
+        dimensions=tuple(cast("_DimensionFile | None", r) for r in results[1:]),
+        prefixes=_PrefixNode(default),
     )
-    if role_cfg is not None:
-        layers.append(role_cfg)
 
+
+def _merge_identity(
+    app_layers: _AppLayers,
+    identity: RuntimeIdentity,
+    *,
+    overrides: Mapping[str, Any] | None,
+    resolve: bool = True,
+    report: LoadReport | None = None,
+    provenance: Provenance | None = None,
+) -> DictConfig:
+    """Merge an identity's layers and overrides into a resolved read-only config.
+
+    Parameters
+    ----------
+    app_layers
+        Parsed layer files of the identity's application.
+    identity
+        Runtime identity providing the dimension selectors.
+    overrides
+        Optional explicit override mapping applied after all store layers.
+    resolve
+        If False, leave interpolations unresolved for on-access resolution.
+    report
+        Optional report to record stage timings into.
+    provenance
+        Optional record to fill in with the layer of every merged leaf.
+
+    Returns
+    -------
+    DictConfig
+        Freshly merged, read-only configuration, resolved if `resolve`. The
+        layers are merged as plain data and wrapped into a `DictConfig` once.
+
+    Raises
+    ------
+    KeyError
+        If a dimension file exists but does not contain the selector.
+    TypeError
+        If a selected block is not a mapping.
+    """
+    from omegaconf import OmegaConf
+
+    selectors = _selectors(identity)
+    node = app_layers.prefixes
+
+    for index in range(len(DIMENSIONS) - 1):
+        dimension_file = app_layers.dimensions[index]
+        key = selectors[index] if dimension_file is not None else None
+        child = node.children.get(key)
+        if child is None:
+            if dimension_file is None:
+                child = _PrefixNode(node.merged)
+            else:
+                block = dimension_file.select(selectors[index], report=report)
+                with stage_timer(report, "merge"):
+                    child = _PrefixNode(merge_data([node.merged, block]))
+            node.children[key] = child
+        node = child
+
+    layers = [node.merged]
+    last_file = app_layers.dimensions[-1]
+    if last_file is not None:
+        layers.append(last_file.select(selectors[-1], report=report))
+
+    with stage_timer(report, "merge"):
+        if overrides is not None:
+            layers.append(_overrides_data(overrides))
+        data = merge_data(layers)
+        if provenance is not None:
+            provenance.record(
+                data,
+                _provenance_layers(
+                    app_layers,
+                    selectors,
+                    overrides=layers[-1] if overrides is not None else None,
+                ),
+            )
+        merged: DictConfig = OmegaConf.create(data)
+    if resolve:
+        with stage_timer(report, "resolve"):
+            OmegaConf.resolve(merged)
+    with stage_timer(report, "readonly"):
+        OmegaConf.set_readonly(merged, True)
+
+    return merged
+
+
+def _provenance_layers(
+    app_layers: _AppLayers,
+    selectors: tuple[str, ...],
+    *,
+    overrides: LayerData | None,
+) -> list[tuple[int, LayerData]]:
+    """Return the individual layers of a merge, paired with their `LAYERS` index.
+
+    Selected blocks are memoized by their dimension files, so this parses
+    nothing.
+    """
+    sources: list[tuple[int, LayerData]] = [(0, app_layers.default)]
+    for index, (dimension_file, selector) in enumerate(
+        zip(app_layers.dimensions, selectors, strict=True), start=1
+    ):
+        if dimension_file is not None:
+            sources.append((index, dimension_file.select(selector)))
     if overrides is not None:
-        overrides_cfg: DictConfig = OmegaConf.create(dict(overrides))
-        layers.append(overrides_cfg)
+        sources.append((len(LAYERS) - 1, overrides))
+    return sources
+
 
-    merged: DictConfig = OmegaConf.merge(
-        *layers
-    )  # pyright: ignore[reportAssignmentType]
-    OmegaConf.resolve(merged)
-    OmegaConf.set_readonly(merged, True)
+def _overrides_data(overrides: Mapping[str, Any]) -> LayerData:
+    """Return `overrides` as plain data for `merge_data`.
 
+    The mapping goes through `OmegaConf.create` as before, so nested
+    `DictConfig` values, structured configs and invalid values are handled
+    exactly as in an `OmegaConf.merge` of the overrides.
+    """
+    from omegaconf import OmegaConf
+
+    cfg = OmegaConf.create(dict(overrides))
+    return cast(LayerData, OmegaConf.to_container(cfg, resolve=False))
+
+
+def _result_cache_key(
+    *,
+    app_root: Path,
+    identity: RuntimeIdentity,
+    fingerprints: LayerFingerprints,
+    overrides: Mapping[str, Any] | None,
+    backend: Backend,
+    resolution: Resolution,
+) -> ResultKey | None:
+    """Build the resolved config cache key, or `None` if uncacheable.
+
+    Overrides are reduced to their Merkle digest (see `fingerprint`), which
+    keeps the types of keys and values apart, so `{1: x}` and `{"1": x}` get
+    different keys. Overrides that cannot be hashed make the call uncacheable.
+    """
+    if overrides is None:
+        overrides_digest = ""
+    else:
+        try:
+            overrides_digest = digest(overrides, None).hex()
+        except (TypeError, ValueError, RecursionError):
+            return None
+
+    return (
+        str(app_root),
+        f"{backend}:{resolution}",
+        _selectors(identity),
+        fingerprints,
+        overrides_digest,
+    )
+
+
+def _check_backend(backend: str) -> None:
+    """Raise `ValueError` if `backend` is not one of `BACKENDS`."""
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown config backend {backend!r}. Expected one of: "
+            + ", ".join(BACKENDS)
+        )
+
+
+def _check_resolution(
+    resolution: str,
+    *,
+    backend: Backend,
+    snapshots: SnapshotCache | None = None,
+) -> None:
+    """Raise `ValueError` for unknown or incompatible resolution modes."""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Unknown resolution mode {resolution!r}. Expected one of: "
+            + ", ".join(RESOLUTIONS)
+        )
+    if resolution == "lazy" and backend == "frozen":
+        raise ValueError(
+            "resolution='lazy' cannot be combined with backend='frozen', "
+            "which requires fully resolved data."
+        )
+    if resolution == "lazy" and snapshots is not None:
+        raise ValueError(
+            "resolution='lazy' cannot be combined with snapshots, which store "
+            "fully resolved data."
+        )
+
+
+def _as_result(merged: DictConfig, resolution: Resolution) -> MXMConfig:
+    """Return the merged tree as the config object for `resolution`."""
+    if resolution == "lazy":
+        return LazyConfig(merged)
     return cast(MXMConfig, merged)
 
 
@@ -165,18 +1153,28 @@ def _app_config_root(*, identity: RuntimeIdentity, store_root: Path) -> Path:
     return app_root
 
 
-def _load_required_yaml(path: Path) -> DictConfig:
-    """Load a required YAML file as an OmegaConf DictConfig.
+def _load_required_yaml(
+    path: Path,
+    fingerprint: FileFingerprint | None,
+    *,
+    report: LoadReport | None = None,
+) -> LayerData:
+    """Load a required YAML mapping file as plain data.
 
     Parameters
     ----------
     path
         YAML file path.
+    fingerprint
+        Stat fingerprint of `path`, or `None` if it does not exist.
+    report
+        Optional report to record read and parse timings into.
 
     Returns
     -------
-    DictConfig
-        Loaded YAML configuration.
+    LayerData
+        Loaded YAML configuration. The object may be shared through the
+        parsed layer cache and must not be mutated.
 
     Raises
     ------
@@ -185,57 +1183,328 @@ def _load_required_yaml(path: Path) -> DictConfig:
     TypeError
         If the YAML root is not a mapping.
     """
-    if not path.is_file():
+    if fingerprint is None or not path.is_file():
         raise FileNotFoundError(f"Required configuration file not found: {path}")
 
-    cfg = OmegaConf.load(path)
-    if not isinstance(cfg, DictConfig):
-        raise TypeError(f"Configuration file must contain a mapping: {path}")
-
-    return cfg
+    return _load_yaml_cached(path, fingerprint, report=report)
 
 
-def _load_optional_yaml(path: Path) -> DictConfig | None:
-    """Load an optional YAML mapping file if present.
+def _load_dimension_file(
+    path: Path,
+    dimension: str,
+    fingerprint: FileFingerprint | None,
+    *,
+    report: LoadReport | None = None,
+) -> _DimensionFile | None:
+    """Return the indexed dimension file at `path` if present.
 
     Parameters
     ----------
     path
-        YAML file path.
+        Dimension YAML file path.
+    dimension
+        Human-readable dimension name used in error messages.
+    fingerprint
+        Stat fingerprint of `path`, or `None` if it does not exist.
+    report
+        Optional report to record read and index timings into.
 
     Returns
     -------
-    DictConfig | None
-        Loaded mapping config, or `None` if the file does not exist.
+    _DimensionFile | None
+        Dimension file shared through the layer cache, or `None` if the file
+        does not exist.
 
     Raises
     ------
     TypeError
         If the YAML file exists but its root is not a mapping.
     """
-    if not path.exists():
+    if fingerprint is None:
         return None
 
-    cfg = OmegaConf.load(path)
-    if not isinstance(cfg, DictConfig):
-        raise TypeError(f"Configuration file must contain a mapping: {path}")
+    cached = _LAYER_CACHE.get(fingerprint)
+    if isinstance(cached, _DimensionFile):
+        if report is not None:
+            report.layer(path).cached = True
+        return cached
+
+    dimension_file = _DimensionFile(path, dimension, report=report)
+    _LAYER_CACHE.put(fingerprint, dimension_file)
+    return dimension_file
+
+
+class _DimensionFile:
+    """Dimension layer file whose selector blocks are parsed on demand.
+
+    On construction the file is read and its top-level keys are indexed from
+    the YAML event stream without building any nodes. `select` then parses
+    only the requested selector's lines and memoizes the block. Files that
+    cannot be indexed safely are parsed in full up front instead, and a file
+    is parsed in full on demand when a selected block is an interpolation,
+    such as `dev: ${prod}`, that may refer to other blocks.
+
+    Selected blocks are shared and must not be mutated.
+    """
+
+    __slots__ = ("_blocks", "_full", "_index", "dimension", "path")
+
+    def __init__(
+        self,
+        path: Path,
+        dimension: str,
+        *,
+        report: LoadReport | None = None,
+    ) -> None:
+        self.path = path
+        self.dimension = dimension
+        self._blocks: dict[str, LayerData] = {}
+        self._full: LayerData | None = None
+        text = _read_layer_text(path, report=report)
+        with stage_timer(report, "index", path):
+            self._index = index_top_level(text)
+        if self._index is None:
+            with stage_timer(report, "parse", path):
+                self._full = _parse_yaml_mapping(path, text)
+
+    def select(self, selector: str, *, report: LoadReport | None = None) -> LayerData:
+        """Return the block for `selector`.
+
+        Raises
+        ------
+        KeyError
+            If the file does not contain the selector.
+        TypeError
+            If the selected block is not a mapping.
+        """
+        block = self._blocks.get(selector)
+        if block is not None:
+            return block
+
+        if self._full is not None:
+            source = self._full
+        elif self._index is not None and selector in self._index.spans:
+            with stage_timer(report, "parse", self.path):
+                source = _parse_yaml_mapping(
+                    self.path, self._index.block_source(selector)
+                )
+                selected = source.get(selector)
+                if isinstance(selected, str) and "${" in selected:
+                    source = self._full = _parse_yaml_mapping(
+                        self.path, "\n".join(self._index.lines)
+                    )
+        else:
+            available = self._index.keys if self._index is not None else ()
+            raise _missing_selector_error(
+                path=self.path,
+                selector=selector,
+                dimension=self.dimension,
+                available=available,
+            )
+
+        with stage_timer(report, "select", self.path):
+            block = _select_block(
+                source,
+                path=self.path,
+                selector=selector,
+                dimension=self.dimension,
+            )
+        self._blocks[selector] = block
+        return block
+
+    @property
+    def selectors(self) -> tuple[str, ...]:
+        """Top-level keys of the file, in document order."""
+        if self._index is not None:
+            return self._index.keys
+        return tuple(self._full or {})
+
+    def is_selected(self, selector: str) -> bool:
+        """Return True if the block for `selector` is already parsed."""
+        return selector in self._blocks
+
+    def prefetch(self, selector: str) -> None:
+        """Parse the block for `selector` ahead of a merge, ignoring errors.
+
+        Selection errors are raised again, in precedence order, when the merge
+        calls `select`.
+        """
+        try:
+            self.select(selector)
+        except Exception:
+            pass
+
+
+def _fingerprint(path: Path) -> FileFingerprint | None:
+    """Return the stat fingerprint of `path`, or `None` if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
 
+
+def _load_yaml_cached(
+    path: Path,
+    fingerprint: FileFingerprint,
+    *,
+    report: LoadReport | None = None,
+) -> LayerData:
+    """Parse a YAML mapping file, reusing the cached parse if unchanged.
+
+    Parameters
+    ----------
+    path
+        YAML file path.
+    fingerprint
+        Stat fingerprint of `path` taken by the caller.
+    report
+        Optional report to record read and parse timings into.
+
+    Returns
+    -------
+    LayerData
+        Parsed mapping shared through the layer cache.
+
+    Raises
+    ------
+    TypeError
+        If the YAML root is not a mapping.
+    """
+    cached = _LAYER_CACHE.get(fingerprint)
+    if cached is not None and not isinstance(cached, _DimensionFile):
+        if report is not None:
+            report.layer(path).cached = True
+        return cached
+
+    text = _read_layer_text(path, report=report)
+    with stage_timer(report, "parse", path):
+        cfg = _parse_yaml_mapping(path, text)
+    _LAYER_CACHE.put(fingerprint, cfg)
     return cfg
 
 
-def _load_selected_block(
+def _read_layer_text(path: Path, *, report: LoadReport | None = None) -> str:
+    """Read a layer file as UTF-8 text, recording bytes read into `report`."""
+    with stage_timer(report, "read", path):
+        data = path.read_bytes()
+    if report is not None:
+        report.layer(path).bytes_read += len(data)
+    return data.decode("utf-8")
+
+
+def _parse_yaml_mapping(path: Path, source: str) -> LayerData:
+    """Parse a YAML mapping into plain data with `OmegaConf.load`'s YAML rules.
+
+    The loader applies the same resolver changes as `OmegaConf.load`, so
+    scalar resolution and duplicate key errors are unchanged; values are
+    validated when the merged result is wrapped into a `DictConfig`.
+
+    Parameters
+    ----------
+    path
+        YAML file path the source was read from; used in error messages.
+    source
+        YAML text to parse.
+
+    Returns
+    -------
+    LayerData
+        Parsed mapping; an empty mapping for an empty document.
+
+    Raises
+    ------
+    TypeError
+        If the YAML root is not a mapping.
+    """
+    import yaml
+
+    stream = io.StringIO(source)
+    stream.name = str(path)  # reported by PyYAML in syntax error locations
+    data: object = yaml.load(stream, Loader=_yaml_loader())
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise TypeError(f"Configuration file must contain a mapping: {path}")
+
+    return cast(LayerData, data)
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    """Return a YAML loader class that parses like `OmegaConf.load`.
+
+    This is PyYAML's safe loader with OmegaConf's changes: duplicate keys are
+    an error, floats such as `1e3` resolve as floats, timestamps stay
+    strings and `pathlib` path tags construct paths.
+    """
+    import yaml
+
+    base: Any = yaml.SafeLoader
+
+    def construct_mapping(loader: Any, node: Any, deep: bool = False) -> Any:
+        keys: set[str] = set()
+        for key_node, _ in node.value:
+            if key_node.tag != _STR_TAG:
+                continue
+            if key_node.value in keys:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    f"found duplicate key {key_node.value}",
+                    key_node.start_mark,
+                )
+            keys.add(key_node.value)
+        return base.construct_mapping(loader, node, deep=deep)
+
+    loader: Any = type("LayerLoader", (base,), {"construct_mapping": construct_mapping})
+    loader.add_implicit_resolver(
+        "tag:yaml.org,2002:float", _YAML_FLOAT, list("-+0123456789.")
+    )
+    loader.yaml_implicit_resolvers = {
+        first: [
+            (tag, regexp)
+            for tag, regexp in resolvers
+            if tag != "tag:yaml.org,2002:timestamp"
+        ]
+        for first, resolvers in loader.yaml_implicit_resolvers.items()
+    }
+    for path_type in (Path, PosixPath, WindowsPath):
+        loader.add_constructor(
+            f"tag:yaml.org,2002:python/object/apply:pathlib.{path_type.__name__}",
+            _path_constructor(path_type),
+        )
+    return loader
+
+
+def _path_constructor(path_type: type[Path]) -> Any:
+    """Return a YAML constructor building a `path_type` from a sequence node."""
+
+    def construct(loader: Any, node: Any) -> Path:
+        return path_type(*loader.construct_sequence(node))
+
+    return construct
+
+
+def _select_block(
+    cfg: LayerData,
     *,
     path: Path,
     selector: str,
     dimension: str,
-) -> DictConfig | None:
-    """Load a selected block from a dimension configuration file.
+) -> LayerData:
+    """Select an identity block from a parsed dimension configuration file.
 
-    Dimension files are optional. If the file is absent, the layer is skipped.
-
-    If a dimension file exists, it must contain a top-level key matching the
+    Dimension files are optional; callers skip absent files. If a dimension
+    file exists, it must contain a top-level key matching the
     selected identity value. The selected block must be a mapping.
 
+    A block that is an interpolation, such as `dev: ${prod}`, is resolved
+    against the file like `OmegaConf.load` of the file would, and the target
+    block is used. Interpolations inside the block are kept and resolve
+    against the merged config.
+
     Example
     -------
 
@@ -254,8 +1523,10 @@ def _load_selected_block(
 
     Parameters
     ----------
+    cfg
+        Parsed dimension file.
     path
-        Dimension YAML file path.
+        Dimension YAML file path, used in error messages.
     selector
         Selected RuntimeIdentity value for the dimension.
     dimension
@@ -263,32 +1534,56 @@ def _load_selected_block(
 
     Returns
     -------
-    DictConfig | None
-        Selected configuration block, or `None` if the file is absent.
+    LayerData
+        Selected configuration block.
 
     Raises
     ------
     KeyError
-        If the file exists but does not contain the selector.
+        If the file does not contain the selector.
     TypeError
-        If the file or selected block is not a mapping.
+        If the selected block is not a mapping.
     """
-    cfg = _load_optional_yaml(path)
-    if cfg is None:
-        return None
-
     if selector not in cfg:
-        available = ", ".join(str(key) for key in cfg.keys())
-        raise KeyError(
-            f"Selector {selector!r} for dimension {dimension!r} not found in "
-            f"{path}. Available selectors: {available}"
+        raise _missing_selector_error(
+            path=path,
+            selector=selector,
+            dimension=dimension,
+            available=cfg.keys(),
         )
 
     selected = cfg[selector]
-    if not isinstance(selected, DictConfig):
+    if isinstance(selected, str) and "${" in selected:
+        selected = _resolve_block(cfg, selector)
+    if not isinstance(selected, dict):
         raise TypeError(
             f"Selected block for dimension {dimension!r} and selector "
             f"{selector!r} in {path} must be a mapping."
         )
 
+    return cast(LayerData, selected)
+
+
+def _resolve_block(cfg: LayerData, selector: str) -> object:
+    """Return the interpolated block `selector` of `cfg`, resolved by OmegaConf."""
+    from omegaconf import DictConfig, OmegaConf
+
+    selected: object = OmegaConf.create(cfg)[selector]
+    if isinstance(selected, DictConfig):
+        return OmegaConf.to_container(selected, resolve=False)
     return selected
+
+
+def _missing_selector_error(
+    *,
+    path: Path,
+    selector: str,
+    dimension: str,
+    available: Iterable[object],
+) -> KeyError:
+    """Build the `KeyError` raised for a selector missing from a dimension file."""
+    listed = ", ".join(str(key) for key in available)
+    return KeyError(
+        f"Selector {selector!r} for dimension {dimension!r} not found in "
+        f"{path}. Available selectors: {listed}"
+    )
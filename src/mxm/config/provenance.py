@@ -0,0 +1,185 @@
+"""Per-leaf provenance of merged configurations.
+
+`load_config(..., provenance=Provenance())` records which layer supplied each
+leaf of the merged config: `default`, one of the dimension layers, or the
+explicit `overrides`. Provenance is recorded from the selected layer blocks
+during the merge, so no prefix of the layers has to be loaded again.
+
+Storage
+-------
+A `Provenance` does not mirror the config tree. It holds the dotted paths of
+the leaves in one list and the layer of each leaf in a parallel `bytearray`,
+one byte per leaf. A path-to-position dict is built on the first lookup by
+path only; iterating needs neither.
+
+Leaves are non-mapping values and empty mappings. Lists are leaves as a
+whole, since a list always replaces the lower value. Interpolations are
+attributed to the layer that wrote the interpolation, not its target.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, cast
+
+LAYERS = ("default", "environment", "machine", "substrate", "role", "overrides")
+"""Layer names in precedence order; a leaf's layer index points into this."""
+
+_MISSING = "???"
+
+
+class Provenance(Mapping[str, str]):
+    """Read-only mapping from dotted leaf path to the layer that supplied it.
+
+    Pass an instance to `load_config(..., provenance=...)`; it is cleared and
+    filled in by the load. Paths are in the key order of the merged config.
+    """
+
+    __slots__ = ("_index", "_layers", "_paths")
+
+    def __init__(self) -> None:
+        self._paths: list[str] = []
+        self._layers = bytearray()
+        self._index: dict[str, int] | None = None
+
+    def clear(self) -> None:
+        """Forget all recorded leaves."""
+        self._paths = []
+        self._layers = bytearray()
+        self._index = None
+
+    def record(
+        self,
+        merged: Mapping[Any, Any],
+        layers: Sequence[tuple[int, Mapping[Any, Any]]],
+    ) -> None:
+        """Record the provenance of every leaf of `merged`.
+
+        Called by the loader during the merge.
+
+        Parameters
+        ----------
+        merged
+            Result of merging `layers`.
+        layers
+            `(layer index, data)` pairs in precedence order, lowest first,
+            where the index points into `LAYERS`.
+        """
+        self.clear()
+        if layers:
+            self._walk(merged, layers, "", layers[0][0])
+
+    def layer_index(self, path: str) -> int:
+        """Return the index into `LAYERS` of the layer that supplied `path`.
+
+        Raises
+        ------
+        KeyError
+            If `path` is not a leaf of the config.
+        """
+        if self._index is None:
+            self._index = {path: position for position, path in enumerate(self._paths)}
+        return self._layers[self._index[path]]
+
+    def __getitem__(self, path: str) -> str:
+        return LAYERS[self.layer_index(path)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"<Provenance leaves={len(self._paths)}>"
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the record, including its path strings."""
+        size = (
+            sys.getsizeof(self._paths)
+            + sum(sys.getsizeof(path) for path in self._paths)
+            + sys.getsizeof(self._layers)
+        )
+        if self._index is not None:
+            size += sys.getsizeof(self._index)
+        return size
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of leaves supplied by each layer, in `LAYERS` order."""
+        return {
+            name: self._layers.count(index)
+            for index, name in enumerate(LAYERS)
+            if index in self._layers
+        }
+
+    def to_dict(self, path: str | None = None) -> dict[str, str]:
+        """Return a plain `{leaf path: layer name}` dict.
+
+        Parameters
+        ----------
+        path
+            If given, only include the leaves below this dotted path.
+        """
+        prefix = None if path is None else path + "."
+        return {
+            leaf: LAYERS[layer]
+            for leaf, layer in zip(self._paths, self._layers, strict=True)
+            if prefix is None or leaf.startswith(prefix)
+        }
+
+    def format(self, path: str | None = None) -> str:
+        """Return one `leaf  layer` line per leaf, with aligned columns.
+
+        Parameters
+        ----------
+        path
+            If given, only include the leaves below this dotted path.
+        """
+        rows = self.to_dict(path)
+        width = max(map(len, rows), default=0)
+        return "\n".join(f"{leaf:<{width}}  {layer}" for leaf, layer in rows.items())
+
+    def _walk(
+        self,
+        node: Mapping[Any, Any],
+        sources: Sequence[tuple[int, Mapping[Any, Any]]],
+        prefix: str,
+        inherited: int,
+    ) -> None:
+        """Record the leaves below `node` from the layers' matching mappings.
+
+        `inherited` is the layer of `node` itself, used for values that no
+        layer holds at their own path (OmegaConf merges of a mapping into an
+        interpolation).
+        """
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            found = [(index, source[key]) for index, source in sources if key in source]
+            if isinstance(value, Mapping) and value:
+                self._walk(
+                    cast(Mapping[Any, Any], value),
+                    [
+                        (i, cast(Mapping[Any, Any], v))
+                        for i, v in found
+                        if isinstance(v, Mapping)
+                    ],
+                    path,
+                    found[-1][0] if found else inherited,
+                )
+            else:
+                self._paths.append(path)
+                self._layers.append(_origin(found, inherited))
+
+
+def _origin(found: Sequence[tuple[int, Any]], inherited: int) -> int:
+    """Return the layer of a leaf from the layers holding its path.
+
+    The last layer with a set value wins. A `"???"` value does not replace a
+    lower value, so it only counts if no layer sets one.
+    """
+    for index, value in reversed(found):
+        if not (isinstance(value, str) and value == _MISSING):
+            return index
+    return found[0][0] if found else inherited
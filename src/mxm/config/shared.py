@@ -0,0 +1,578 @@
+"""Resolved configurations shared between processes through shared memory.
+
+Worker processes on one host that each call `load_config` for the same
+identity each parse, merge and hold their own copy of the same tree.
+`load_shared_config` lets one of them publish the resolved config into a
+`multiprocessing.shared_memory` segment named after its content key (the
+`SnapshotCache` key: layer file contents, selectors and overrides); every
+other process attaches to the segment instead of loading.
+
+The segment holds a compact binary encoding of the resolved data. Attached
+processes get a `SharedConfig`, a read-only mapping that decodes nodes from
+the segment on first access and memoizes them, so startup costs one
+`shm_open` and memory grows only with what a process actually reads.
+
+Segment layout (little endian)::
+
+    header   magic "MXMCFG\\0<version>", u64 payload size, u64 root offset,
+             8 reserved bytes
+    records  tag byte followed by its body, children before their parents:
+             N / T / F                    None / True / False
+             I  i64                       int
+             J  u32 size, ascii digits    int outside the i64 range
+             D  f64                       float
+             S  u32 size, utf-8 bytes     str
+             L  u32 count, u32 offsets    sequence
+             M  u32 count, (u32 key offset, u32 value offset) pairs
+                                          mapping, in insertion order
+
+Equal scalars and strings are stored once. The magic is written last, so a
+segment that is still empty or whose magic is not yet set is still being
+published. `load_shared_config` replaces a segment that stays unpublished
+for its whole timeout, as left behind by a publisher that crashed.
+
+Notes
+-----
+- `SharedConfig` is read-only and holds resolved data only; sequences are
+  returned as tuples, as with `FrozenConfig`.
+- Segments published by a process are unlinked when it exits. Processes
+  already attached keep their mapping; later processes publish a new one.
+- A `SharedConfig` pickles as a `FrozenConfig` copy. To hand a config to
+  another process on the same host, pass its `segment_name` and
+  `attach_config` it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import struct
+import time
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+from mxm.config.frozen import FrozenConfig
+
+if TYPE_CHECKING:
+    # multiprocessing.shared_memory is imported on first use; it costs more
+    # to import than the rest of the package.
+    from multiprocessing.shared_memory import SharedMemory
+
+    from mxm.config.types import MXMConfig
+    from mxm.types import JSONMap, JSONValue, RuntimeIdentity
+
+SHARED_FORMAT_VERSION = 1
+"""Version of the segment layout; part of the magic."""
+
+SEGMENT_PREFIX = "mxmcfg_"
+"""Prefix of the segment names used by `load_shared_config`."""
+
+_MAGIC = b"MXMCFG\0" + bytes([SHARED_FORMAT_VERSION])
+_HEADER = struct.Struct("<8sQQ8x")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_PAIR = struct.Struct("<II")
+_MAX_OFFSET = 0xFFFFFFFF
+_POLL_SECONDS = 0.001
+
+_OWNED: dict[str, SharedMemory] = {}
+"""Segments published by this process, unlinked at exit."""
+
+
+class _Segment:
+    """Buffer holding an encoded config, and the shared memory it lives in."""
+
+    __slots__ = ("buf", "name", "shm")
+
+    def __init__(
+        self,
+        buf: memoryview,
+        *,
+        name: str | None = None,
+        shm: SharedMemory | None = None,
+    ) -> None:
+        self.buf = buf
+        self.name = name
+        self.shm = shm
+
+
+class SharedConfig(Mapping[str, Any]):
+    """Read-only configuration mapping decoded lazily from shared memory.
+
+    Supports both access styles of `MXMConfig`:
+
+    - attribute access: `cfg.paths.data`
+    - item access:      `cfg["paths"]["data"]`
+
+    Instances are returned by `share_config`, `attach_config` and
+    `load_shared_config`; they are not constructed directly.
+    """
+
+    __slots__ = ("__weakref__", "_keys", "_offset", "_segment", "_values")
+
+    _segment: _Segment
+    _offset: int
+    _keys: dict[str, int] | None
+    _values: dict[str, Any]
+
+    def __init__(self, segment: _Segment, offset: int) -> None:
+        object.__setattr__(self, "_segment", segment)
+        object.__setattr__(self, "_offset", offset)
+        object.__setattr__(self, "_keys", None)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(f"Config has no key {key!r}") from None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        value = _decode(self._segment, self._key_offsets()[key])
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_offsets()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_offsets())
+
+    def __len__(self) -> int:
+        return _U32.unpack_from(self._segment.buf, self._offset + 1)[0]
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise AttributeError("SharedConfig is immutable.")
+
+    def __delattr__(self, key: str) -> NoReturn:
+        raise AttributeError("SharedConfig is immutable.")
+
+    def __reduce__(self) -> tuple[type[FrozenConfig], tuple[JSONMap]]:
+        return (FrozenConfig, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"SharedConfig({self.to_dict()!r})"
+
+    def to_dict(self) -> JSONMap:
+        """Return a fresh plain nested `dict`/`list` copy of the config."""
+        return cast("JSONMap", _decode_plain(self._segment.buf, self._offset))
+
+    def _key_offsets(self) -> dict[str, int]:
+        """Return the value offset of each key, decoding the keys once."""
+        keys = self._keys
+        if keys is None:
+            buf = self._segment.buf
+            count = _U32.unpack_from(buf, self._offset + 1)[0]
+            start = self._offset + 5
+            keys = {}
+            for index in range(count):
+                key_offset, value_offset = _PAIR.unpack_from(buf, start + 8 * index)
+                keys[_decode_str(buf, key_offset)] = value_offset
+            object.__setattr__(self, "_keys", keys)
+        return keys
+
+
+def share_config(cfg: MXMConfig, *, name: str | None = None) -> SharedConfig:
+    """Publish a resolved config into a new shared memory segment.
+
+    Parameters
+    ----------
+    cfg
+        Configuration object produced by mxm-config. Interpolations are
+        resolved before publishing.
+    name
+        Segment name. If omitted, a unique name is chosen.
+
+    Returns
+    -------
+    SharedConfig
+        Config backed by the new segment. Other processes attach to it by its
+        `segment_name`.
+
+    Raises
+    ------
+    FileExistsError
+        If a segment called `name` already exists.
+    TypeError
+        If the config holds values other than JSON-like scalars.
+    ValueError
+        If the encoded config exceeds 4 GiB.
+
+    Notes
+    -----
+    - The segment is unlinked when this process exits, or earlier with
+      `unlink_shared_config`.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    from mxm.config.helpers import to_config_data
+
+    payload = _encode(to_config_data(cfg, immutable=True))
+    shm = SharedMemory(name=name, create=True, size=len(payload))
+    buf = cast(memoryview, shm.buf)
+    # Publish the body first and the magic last: attaching processes wait for
+    # the magic before reading anything else.
+    buf[len(_MAGIC) : len(payload)] = payload[len(_MAGIC) :]
+    buf[: len(_MAGIC)] = _MAGIC
+    _OWNED[shm.name] = shm
+    return SharedConfig(_Segment(buf, name=shm.name, shm=shm), _root_offset(buf))
+
+
+def attach_config(name: str, *, timeout: float = 5.0) -> SharedConfig:
+    """Attach read-only to a config published with `share_config`.
+
+    Parameters
+    ----------
+    name
+        Segment name of the published config.
+    timeout
+        Seconds to wait for a segment that is still being published.
+
+    Returns
+    -------
+    SharedConfig
+        Config decoding its nodes from the segment on access.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no segment called `name` exists.
+    TimeoutError
+        If the segment is not completely published within `timeout`.
+    ValueError
+        If the segment does not hold an mxm-config snapshot of this format.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            shm = SharedMemory(name=name, track=False)
+            break
+        except ValueError:
+            # The publisher has created the segment but not sized it yet.
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Shared config {name!r} was not published in time."
+                ) from None
+            time.sleep(_POLL_SECONDS)
+
+    buf = cast(memoryview, shm.buf)
+    while (magic := bytes(buf[: len(_MAGIC)])) != _MAGIC:
+        if time.monotonic() >= deadline:
+            shm.close()
+            if any(magic):
+                raise ValueError(
+                    f"Shared memory {name!r} is not an mxm-config snapshot "
+                    f"of format version {SHARED_FORMAT_VERSION}."
+                )
+            raise TimeoutError(f"Shared config {name!r} was not published in time.")
+        time.sleep(_POLL_SECONDS)
+
+    return SharedConfig(_Segment(buf, name=name, shm=shm), _root_offset(buf))
+
+
+def load_shared_config(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path | None = None,
+    overrides: Mapping[str, Any] | None = None,
+    timeout: float = 5.0,
+) -> SharedConfig:
+    """Load a config once per host and share it between processes.
+
+    The first process to ask for a given identity, layer file contents and
+    overrides loads the config and publishes it; later processes attach to
+    the published segment without reading any layer file.
+
+    Parameters
+    ----------
+    identity
+        Runtime identity selecting the application and identity-specific layers.
+    store_root
+        Root directory of the configuration store. Defaults to
+        `~/mxm-config-store`.
+    overrides
+        Optional explicit override mapping applied after all store layers.
+    timeout
+        Seconds to wait for a segment another process is still publishing.
+        A segment still unpublished after `timeout` is taken to be left by a
+        crashed publisher: it is unlinked and the config is published again.
+        If that times out as well, the config is loaded into a private buffer.
+
+    Returns
+    -------
+    SharedConfig
+        Shared config, or a private one (its `segment_name` is `None`) if the
+        load cannot be keyed or the publisher did not finish in time. Loads
+        whose layer files or overrides use a resolver interpolation, such as
+        `${oc.env:...}`, cannot be keyed (see `SnapshotCache`), so each
+        process resolves them in its own environment.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the application configuration root or `default.yaml` is missing.
+    KeyError
+        If a dimension file does not contain the selected identity value.
+    """
+    from mxm.config.loader import (
+        DEFAULT_CONFIG_STORE_ROOT,
+        LAYER_FILES,
+        _app_config_root,
+        _selectors,
+        load_config,
+    )
+    from mxm.config.snapshot import snapshot_key
+
+    store_root = DEFAULT_CONFIG_STORE_ROOT if store_root is None else store_root
+    app_root = _app_config_root(identity=identity, store_root=store_root)
+    key = snapshot_key(
+        layer_paths=[app_root / name for name in LAYER_FILES],
+        selectors=_selectors(identity),
+        overrides=overrides,
+    )
+
+    def _load() -> MXMConfig:
+        return load_config(
+            identity=identity,
+            store_root=store_root,
+            overrides=overrides,
+            backend="frozen",
+        )
+
+    if key is None:
+        return _private_config(_load())
+
+    name = f"{SEGMENT_PREFIX}{key[:22]}"
+    try:
+        return _attach_or_share(name, _load, timeout=timeout)
+    except TimeoutError:
+        unlink_shared_config(name)
+    try:
+        return _attach_or_share(name, _load, timeout=timeout)
+    except TimeoutError:
+        return _private_config(_load())
+
+
+def _attach_or_share(
+    name: str, load: Callable[[], MXMConfig], *, timeout: float
+) -> SharedConfig:
+    """Attach to segment `name`, or publish `load()` under it if it is absent."""
+    try:
+        return attach_config(name, timeout=timeout)
+    except FileNotFoundError:
+        pass
+    try:
+        return share_config(load(), name=name)
+    except FileExistsError:
+        return attach_config(name, timeout=timeout)
+
+
+def segment_name(cfg: SharedConfig) -> str | None:
+    """Return the name of the segment backing `cfg`.
+
+    This is a function rather than an attribute so that it cannot shadow a
+    config key called `name`.
+
+    Returns
+    -------
+    str or None
+        Segment name to pass to `attach_config`, or `None` if `cfg` lives in
+        a process-private buffer.
+    """
+    return cfg._segment.name  # pyright: ignore[reportPrivateUsage]
+
+
+def unlink_shared_config(name: str) -> None:
+    """Remove a published segment so that no new process can attach to it.
+
+    Processes already attached keep their mapping until they exit. Unknown
+    names are ignored.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = _OWNED.pop(name, None)
+    if shm is None:
+        try:
+            shm = SharedMemory(name=name, track=False)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            # An empty segment cannot be mapped; unlink it by name.
+            import _posixshmem
+
+            try:
+                _posixshmem.shm_unlink(  # pyright: ignore[reportUnknownMemberType]
+                    f"/{name}"
+                )
+            except FileNotFoundError:
+                pass
+            return
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _unlink_owned() -> None:
+    """Unlink all segments published by this process."""
+    for name in list(_OWNED):
+        unlink_shared_config(name)
+
+
+atexit.register(_unlink_owned)
+
+
+def _private_config(cfg: MXMConfig) -> SharedConfig:
+    """Encode `cfg` into a process-private buffer."""
+    from mxm.config.helpers import to_config_data
+
+    buf = memoryview(_encode(to_config_data(cfg, immutable=True)))
+    return SharedConfig(_Segment(buf), _root_offset(buf))
+
+
+def _root_offset(buf: memoryview) -> int:
+    """Return the offset of the root mapping record."""
+    return _HEADER.unpack_from(buf, 0)[2]
+
+
+class _Encoder:
+    """Append-only writer of the record layout."""
+
+    __slots__ = ("buf", "memo")
+
+    def __init__(self) -> None:
+        self.buf = bytearray(_HEADER.size)
+        self.memo: dict[tuple[type[object], str], int] = {}
+
+    def value(self, value: Any) -> int:
+        """Write `value` and return the offset of its record."""
+        if isinstance(value, Mapping):
+            return self.mapping(cast(Mapping[Any, Any], value))
+        if isinstance(value, list | tuple):
+            items = [self.value(item) for item in cast(tuple[Any, ...], value)]
+            return self.record(
+                b"L", _U32.pack(len(items)) + b"".join(map(_U32.pack, items))
+            )
+        if value is not None and not isinstance(value, bool | int | float | str):
+            raise TypeError(
+                f"Cannot share config value of type {type(value).__name__}."
+            )
+
+        memo_key: tuple[type[object], str] = (type(value), repr(value))
+        offset = self.memo.get(memo_key)
+        if offset is None:
+            offset = self.memo[memo_key] = self.record(*_scalar_record(value))
+        return offset
+
+    def mapping(self, value: Mapping[Any, Any]) -> int:
+        pairs: list[bytes] = []
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Cannot share config key {key!r}: keys must be str.")
+            pairs.append(_PAIR.pack(self.value(key), self.value(item)))
+        return self.record(b"M", _U32.pack(len(pairs)) + b"".join(pairs))
+
+    def record(self, tag: bytes, body: bytes = b"") -> int:
+        offset = len(self.buf)
+        if offset + 1 + len(body) > _MAX_OFFSET:
+            raise ValueError("Config is too large to share (more than 4 GiB).")
+        self.buf += tag
+        self.buf += body
+        return offset
+
+
+def _scalar_record(value: object) -> tuple[bytes, bytes]:
+    """Return the tag and body of a scalar record."""
+    if value is None:
+        return b"N", b""
+    if isinstance(value, bool):
+        return (b"T" if value else b"F"), b""
+    if isinstance(value, int):
+        if -(2**63) <= value < 2**63:
+            return b"I", _I64.pack(value)
+        digits = str(value).encode("ascii")
+        return b"J", _U32.pack(len(digits)) + digits
+    if isinstance(value, float):
+        return b"D", _F64.pack(value)
+    encoded = str(value).encode("utf-8")
+    return b"S", _U32.pack(len(encoded)) + encoded
+
+
+def _encode(data: Mapping[str, Any]) -> bytes:
+    """Encode resolved config data into a complete segment payload.
+
+    The header carries zero bytes instead of the magic; the publisher writes
+    the magic once the payload is in place.
+    """
+    encoder = _Encoder()
+    root = encoder.mapping(data)
+    buf = encoder.buf
+    _HEADER.pack_into(buf, 0, bytes(len(_MAGIC)), len(buf), root)
+    return bytes(buf)
+
+
+def _decode(segment: _Segment, offset: int) -> Any:
+    """Decode the record at `offset`, wrapping mappings as `SharedConfig`."""
+    buf = segment.buf
+    tag = buf[offset]
+    if tag == ord("M"):
+        return SharedConfig(segment, offset)
+    if tag == ord("L"):
+        count = _U32.unpack_from(buf, offset + 1)[0]
+        return tuple(
+            _decode(segment, _U32.unpack_from(buf, offset + 5 + 4 * index)[0])
+            for index in range(count)
+        )
+    return _decode_scalar(buf, offset)
+
+
+def _decode_plain(buf: memoryview, offset: int) -> JSONValue:
+    """Decode the record at `offset` into plain `dict`/`list` data."""
+    tag = buf[offset]
+    if tag == ord("M"):
+        count = _U32.unpack_from(buf, offset + 1)[0]
+        data: dict[str, JSONValue] = {}
+        for index in range(count):
+            key_offset, value_offset = _PAIR.unpack_from(buf, offset + 5 + 8 * index)
+            data[_decode_str(buf, key_offset)] = _decode_plain(buf, value_offset)
+        return data
+    if tag == ord("L"):
+        count = _U32.unpack_from(buf, offset + 1)[0]
+        return [
+            _decode_plain(buf, _U32.unpack_from(buf, offset + 5 + 4 * index)[0])
+            for index in range(count)
+        ]
+    return cast("JSONValue", _decode_scalar(buf, offset))
+
+
+def _decode_scalar(buf: memoryview, offset: int) -> object:
+    """Decode the scalar record at `offset`."""
+    tag = chr(buf[offset])
+    if tag == "S":
+        return _decode_str(buf, offset)
+    if tag == "I":
+        return _I64.unpack_from(buf, offset + 1)[0]
+    if tag == "D":
+        return _F64.unpack_from(buf, offset + 1)[0]
+    if tag == "N":
+        return None
+    if tag in "TF":
+        return tag == "T"
+    if tag == "J":
+        size = _U32.unpack_from(buf, offset + 1)[0]
+        return int(bytes(buf[offset + 5 : offset + 5 + size]))
+    raise ValueError(f"Corrupt shared config record at offset {offset}.")
+
+
+def _decode_str(buf: memoryview, offset: int) -> str:
+    """Decode the string record at `offset`."""
+    size = _U32.unpack_from(buf, offset + 1)[0]
+    return str(buf[offset + 5 : offset + 5 + size], "utf-8")
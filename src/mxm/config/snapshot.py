@@ -0,0 +1,311 @@
+"""Persistent on-disk snapshots of resolved configurations.
+
+Short-lived processes (cron tasks, CLI invocations) pay for YAML parsing and
+OmegaConf merging on every start. A `SnapshotCache` stores the resolved,
+plain-data output of `load_config` per identity so that later processes can
+skip parsing, merging and interpolation resolution entirely.
+
+Snapshots are keyed by the *content* of the layer files they were built from,
+together with the identity selectors, the overrides and the package version.
+Editing any layer file therefore changes the key; old snapshots are pruned
+once the cache exceeds its size bound.
+
+A resolver interpolation such as `${oc.env:DB_HOST}` depends on inputs the key
+cannot see, such as the environment. Loads whose layer files or overrides
+contain one are never snapshotted, so a snapshot is not returned after the
+environment changes.
+
+Layout
+------
+The default location follows the XDG base directory convention:
+
+```text
+$XDG_CACHE_HOME/mxm-config/        (or ~/.cache/mxm-config/)
+└── <key>.snap
+```
+
+Each snapshot file holds a short header followed by a `marshal` payload of
+plain dicts, lists and scalars. Writers publish snapshots with an atomic
+rename, so concurrent readers and writers never observe partial files.
+
+Usage
+-----
+    from mxm.config import SnapshotCache, load_config
+
+    cfg = load_config(identity=identity, snapshots=SnapshotCache())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from mxm.config._version import __version__
+
+if TYPE_CHECKING:
+    from mxm.types import JSONMap
+
+SNAPSHOT_FORMAT_VERSION = 1
+"""Version of the on-disk snapshot layout; part of every snapshot key."""
+
+DEFAULT_SNAPSHOT_MAX_BYTES = 64 * 1024 * 1024
+"""Default upper bound on the total size of a snapshot directory."""
+
+_MAGIC = b"MXMC"
+_HEADER = _MAGIC + SNAPSHOT_FORMAT_VERSION.to_bytes(1, "big")
+_SUFFIX = ".snap"
+
+_RESOLVER_CALL = re.compile(rb"\$\{\s*[A-Za-z_][\w.-]*\s*:")
+"""Start of a resolver interpolation such as `${oc.env:NAME}`."""
+
+
+def default_snapshot_dir() -> Path:
+    """Return the default snapshot directory.
+
+    Returns
+    -------
+    Path
+        `$XDG_CACHE_HOME/mxm-config` if `XDG_CACHE_HOME` is set, otherwise
+        `~/.cache/mxm-config`.
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "mxm-config"
+
+
+class SnapshotCache:
+    """Size-bounded directory of resolved configuration snapshots.
+
+    Parameters
+    ----------
+    directory
+        Snapshot directory. Defaults to `default_snapshot_dir()`. Created on
+        first write.
+    max_bytes
+        Upper bound on the total size of snapshot files. When exceeded after a
+        write, the least recently used snapshots are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_SNAPSHOT_MAX_BYTES,
+    ) -> None:
+        self.directory = (
+            directory if directory is not None else default_snapshot_dir()
+        ).expanduser()
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        *,
+        layer_paths: Sequence[Path],
+        selectors: Sequence[str],
+        overrides: Mapping[str, Any] | None,
+    ) -> str | None:
+        """Return the snapshot key for a load, or `None` if it is uncacheable.
+
+        Parameters
+        ----------
+        layer_paths
+            Layer file paths in precedence order. Absent files are allowed.
+        selectors
+            Identity selectors for the dimension layers.
+        overrides
+            Explicit overrides passed to the load.
+
+        Returns
+        -------
+        str | None
+            Hex digest over the layer file contents, selectors, overrides and
+            package version, or `None` if `overrides` cannot be encoded or
+            the layer files or overrides contain a resolver interpolation.
+        """
+        return snapshot_key(
+            layer_paths=layer_paths, selectors=selectors, overrides=overrides
+        )
+
+    def get(self, key: str) -> JSONMap | None:
+        """Return the snapshot stored under `key`, or `None` on a miss.
+
+        Unreadable or corrupt snapshot files are treated as misses.
+        """
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+
+        if not payload.startswith(_HEADER):
+            return None
+        try:
+            data = marshal.loads(payload[len(_HEADER) :])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return cast("JSONMap", data)
+
+    def put(self, key: str, data: JSONMap) -> bool:
+        """Store `data` under `key` using an atomic rename.
+
+        Parameters
+        ----------
+        key
+            Snapshot key from `key()`.
+        data
+            Resolved plain configuration data.
+
+        Returns
+        -------
+        bool
+            True if the snapshot was written. Data that cannot be restored
+            faithfully (unsupported types, or strings containing `${` that
+            would be re-read as interpolations) is not stored.
+        """
+        if _contains_interpolation_marker(data):
+            return False
+        try:
+            payload = _HEADER + marshal.dumps(data)
+        except ValueError:
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.directory, prefix=".tmp-", suffix=_SUFFIX
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self.prune()
+        return True
+
+    def prune(self) -> None:
+        """Remove least recently used snapshots until within `max_bytes`."""
+        entries: list[tuple[int, int, Path]] = []
+        total = 0
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all snapshots from the directory."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+
+def snapshot_key(
+    *,
+    layer_paths: Sequence[Path],
+    selectors: Sequence[str],
+    overrides: Mapping[str, Any] | None,
+) -> str | None:
+    """Return the content key of a load, or `None` if it is uncacheable.
+
+    See `SnapshotCache.key`. Also used to name shared-memory snapshots.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{SNAPSHOT_FORMAT_VERSION}:{__version__}\0".encode())
+
+    for path in layer_paths:
+        digest.update(str(path).encode("utf-8") + b"\0")
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            digest.update(b"-\0")
+            continue
+        if _RESOLVER_CALL.search(content):
+            return None
+        digest.update(len(content).to_bytes(8, "big"))
+        digest.update(content)
+
+    digest.update("\0".join(selectors).encode("utf-8") + b"\0")
+
+    if overrides is not None:
+        try:
+            encoded = json.dumps(
+                dict(overrides),
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        if _RESOLVER_CALL.search(encoded.encode("utf-8")):
+            return None
+        digest.update(encoded.encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def uses_resolvers(
+    *, layer_paths: Sequence[Path], overrides: Mapping[str, Any] | None
+) -> bool:
+    """Return True if a layer file or the overrides call a resolver.
+
+    Resolver interpolations such as `${oc.env:NAME}` depend on the process
+    that resolves them, not only on the layer files. Absent files are
+    skipped.
+    """
+    for path in layer_paths:
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        if _RESOLVER_CALL.search(content):
+            return True
+    if overrides is None:
+        return False
+    encoded = json.dumps(dict(overrides), default=str)
+    return _RESOLVER_CALL.search(encoded.encode("utf-8")) is not None
+
+
+def _contains_interpolation_marker(value: object) -> bool:
+    """Return True if any string in `value` contains `${`."""
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        items = cast(dict[object, object], value)
+        return any(
+            _contains_interpolation_marker(key) or _contains_interpolation_marker(v)
+            for key, v in items.items()
+        )
+    if isinstance(value, list):
+        return any(
+            _contains_interpolation_marker(item) for item in cast(list[object], value)
+        )
+    return False
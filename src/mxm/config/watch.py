@@ -0,0 +1,464 @@
+"""Hot reload of resolved configurations for long-running services.
+
+`watch_config` loads the configuration for an identity and returns a
+`ConfigHandle` whose `config` attribute always refers to the most recent
+successfully resolved, read-only configuration. A background thread watches the
+application's layer files and reloads when one of them changes.
+
+Change detection
+----------------
+On Linux the app directory is watched with inotify (through `ctypes`, no
+third-party dependency). Elsewhere, or if inotify is unavailable, the layer
+files' stat fingerprints are polled. Watching the directory rather than the
+files themselves means that editors and `git` replacing files by rename are
+picked up as well.
+
+Bursts of writes (for example a `git pull` touching several layer files) are
+debounced: a reload runs once no further change has been seen for `debounce`
+seconds.
+
+Reloads
+-------
+A reload goes through `load_config`, whose layer cache is keyed by file stat
+fingerprint. Only the files that changed are parsed again; unchanged layers are
+reused from the cache and merged and resolved with the new ones. The new config
+replaces the old one in a single reference swap, so readers never observe a
+partially updated config.
+
+If a reload fails (for example because a file is mid-edit and not valid YAML),
+the previous config stays in place and the error is kept in
+`ConfigHandle.last_error`. The next change triggers another attempt.
+
+Usage
+-----
+    from mxm.config import watch_config
+
+    handle = watch_config(identity=identity, callback=on_config_change)
+    ...
+    cfg = handle.config
+    ...
+    handle.close()
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+from mxm.config.loader import (
+    DEFAULT_CONFIG_STORE_ROOT,
+    LAYER_FILES,
+    Backend,
+    LayerFingerprints,
+    _app_config_root,
+    _check_backend,
+    _layer_fingerprints,
+    load_config,
+)
+from mxm.config.types import MXMConfig
+
+if TYPE_CHECKING:
+    from mxm.types import RuntimeIdentity
+
+type WatchMethod = Literal["auto", "inotify", "poll"]
+
+DEFAULT_DEBOUNCE = 0.2
+"""Default quiet period in seconds before a burst of changes is reloaded."""
+
+DEFAULT_POLL_INTERVAL = 1.0
+"""Default interval in seconds between fingerprint checks when polling."""
+
+# inotify event masks, from <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_GONE_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def watch_config(
+    *,
+    identity: RuntimeIdentity,
+    store_root: Path = DEFAULT_CONFIG_STORE_ROOT,
+    callback: Callable[[MXMConfig], None] | None = None,
+    overrides: Mapping[str, Any] | None = None,
+    backend: Backend = "omegaconf",
+    method: WatchMethod = "auto",
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> ConfigHandle:
+    """Load a configuration and keep it up to date as layer files change.
+
+    Parameters
+    ----------
+    identity
+        Runtime identity used to select configuration layers.
+    store_root
+        Root directory of the external configuration store.
+    callback
+        Optional function called from the watcher thread with each newly
+        loaded config. Exceptions it raises are stored in `last_error`.
+    overrides
+        Optional explicit overrides, applied on every reload.
+    backend
+        Config representation, as for `load_config`.
+    method
+        `"inotify"`, `"poll"`, or `"auto"` to use inotify when available and
+        fall back to polling otherwise.
+    debounce
+        Quiet period in seconds after the last change before reloading.
+    poll_interval
+        Interval in seconds between fingerprint checks when polling.
+
+    Returns
+    -------
+    ConfigHandle
+        Running handle holding the initial config. Close it when done, or use
+        it as a context manager.
+
+    Raises
+    ------
+    FileNotFoundError, KeyError, TypeError
+        If the initial load fails, as for `load_config`.
+    ValueError
+        If `backend` or `method` is not supported.
+    OSError
+        If `method="inotify"` is requested but inotify is unavailable.
+    """
+    handle = ConfigHandle(
+        identity=identity,
+        store_root=store_root,
+        callback=callback,
+        overrides=overrides,
+        backend=backend,
+        debounce=debounce,
+        poll_interval=poll_interval,
+    )
+    handle._start(method)
+    return handle
+
+
+class ConfigHandle:
+    """Reference to the current configuration of a watched identity.
+
+    Create instances with `watch_config`. The handle is safe to read from any
+    thread; `config` is replaced atomically by the watcher thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        identity: RuntimeIdentity,
+        store_root: Path,
+        callback: Callable[[MXMConfig], None] | None,
+        overrides: Mapping[str, Any] | None,
+        backend: Backend,
+        debounce: float,
+        poll_interval: float,
+    ) -> None:
+        _check_backend(backend)
+        self.identity = identity
+        self.store_root = store_root
+        self.app_root = _app_config_root(identity=identity, store_root=store_root)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.method: Literal["inotify", "poll"] | None = None
+        """Change detection method in use, or `None` before start."""
+        self.last_error: BaseException | None = None
+        """Error from the most recent failed reload or callback, if any."""
+        self._callback = callback
+        self._overrides = dict(overrides) if overrides is not None else None
+        self._backend: Backend = backend
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify_fd: int | None = None
+        self._wake_r = -1
+        self._wake_w = -1
+        self._release_on_exit = False
+
+        self._fingerprints = _layer_fingerprints(self.app_root)
+        self._config = self._load()
+
+    @property
+    def config(self) -> MXMConfig:
+        """Most recent successfully loaded configuration."""
+        return self._config
+
+    @property
+    def closed(self) -> bool:
+        """True once `close()` has been called."""
+        return self._stop.is_set()
+
+    def reload(self, *, force: bool = False) -> bool:
+        """Reload the configuration now if any layer file changed.
+
+        Parameters
+        ----------
+        force
+            Reload even if the layer file fingerprints are unchanged.
+
+        Returns
+        -------
+        bool
+            True if a new config was swapped in. Failures leave the current
+            config in place and are recorded in `last_error`.
+        """
+        with self._lock:
+            fingerprints = _layer_fingerprints(self.app_root)
+            if not force and fingerprints == self._fingerprints:
+                return False
+            try:
+                config = self._load()
+            except Exception as exc:
+                self.last_error = exc
+                return False
+            self._config = config
+            self._fingerprints = fingerprints
+            self.last_error = None
+
+        if self._callback is not None:
+            try:
+                self._callback(config)
+            except Exception as exc:
+                self.last_error = exc
+        return True
+
+    def close(self) -> None:
+        """Stop watching and release the watcher's resources.
+
+        May be called from `callback`; the watcher thread then releases its
+        resources itself once it has stopped.
+        """
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread is None:
+            return
+        os.write(self._wake_w, b"\0")
+        if self._thread is threading.current_thread():
+            self._release_on_exit = True
+            return
+        self._thread.join()
+        self._release()
+
+    def __enter__(self) -> ConfigHandle:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ConfigHandle(app_root={str(self.app_root)!r}, method={self.method!r}, "
+            f"closed={self.closed})"
+        )
+
+    def _release(self) -> None:
+        """Close the inotify descriptor and the wake-up pipe."""
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _load(self) -> MXMConfig:
+        return load_config(
+            identity=self.identity,
+            store_root=self.store_root,
+            overrides=self._overrides,
+            backend=self._backend,
+        )
+
+    def _start(self, method: WatchMethod) -> None:
+        if method not in ("auto", "inotify", "poll"):
+            raise ValueError(
+                f"Unknown watch method {method!r}. "
+                "Expected one of: 'auto', 'inotify', 'poll'."
+            )
+
+        fd = _open_inotify(self.app_root) if method != "poll" else None
+        if fd is None and method == "inotify":
+            raise OSError(f"inotify is not available for {self.app_root}")
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._inotify_fd = fd
+        self.method = "inotify" if fd is not None else "poll"
+        thread = threading.Thread(target=self._run, args=(fd,))
+        thread.name = f"mxm-config-watch:{self.app_root.name}"
+        thread.daemon = True
+        self._thread = thread
+        thread.start()
+
+    def _run(self, fd: int | None) -> None:
+        try:
+            if fd is not None:
+                self._run_inotify(fd)
+            else:
+                self._run_poll()
+        finally:
+            if self._release_on_exit:
+                self._release()
+
+    def _run_inotify(self, fd: int) -> None:
+        while True:
+            if not self._wait_readable(fd, None):
+                return
+            changed, gone = _drain_inotify(fd)
+            if not (changed or gone):
+                continue
+
+            while not gone and self._wait_readable(fd, self.debounce):
+                _, gone = _drain_inotify(fd)
+            if gone:
+                # The app directory was removed or replaced; inotify cannot
+                # follow it, so continue by polling.
+                self.method = "poll"
+                self._reload_after_quiet_period()
+                self._run_poll()
+                return
+            if self._stop.is_set():
+                return
+            self.reload()
+
+    def _run_poll(self) -> None:
+        last = self._fingerprints
+        while not self._stop.wait(self.poll_interval):
+            current = _poll_fingerprints(self.app_root)
+            if current == last:
+                continue
+            if self._reload_after_quiet_period():
+                last = self._fingerprints
+            else:
+                last = current
+
+    def _reload_after_quiet_period(self) -> bool:
+        """Wait until the fingerprints are stable for `debounce`, then reload."""
+        current = _poll_fingerprints(self.app_root)
+        while not self._stop.wait(self.debounce):
+            latest = _poll_fingerprints(self.app_root)
+            if latest == current:
+                return self.reload()
+            current = latest
+        return False
+
+    def _wait_readable(self, fd: int, timeout: float | None) -> bool:
+        """Return True if `fd` became readable, False on timeout or close."""
+        if self._stop.is_set():
+            return False
+        readable, _, _ = select.select([fd, self._wake_r], [], [], timeout)
+        if self._wake_r in readable or self._stop.is_set():
+            return False
+        return fd in readable
+
+
+def _poll_fingerprints(app_root: Path) -> LayerFingerprints | None:
+    """Return the layer fingerprints, or `None` if the app root is unreadable."""
+    try:
+        return _layer_fingerprints(app_root)
+    except OSError:
+        return None
+
+
+def _open_inotify(directory: Path) -> int | None:
+    """Return a non-blocking inotify descriptor watching `directory`.
+
+    Returns `None` if inotify is unavailable on this platform.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+
+    inotify_init1.argtypes = [ctypes.c_int]
+    inotify_init1.restype = ctypes.c_int
+    inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    inotify_add_watch.restype = ctypes.c_int
+
+    fd: int = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    wd: int = inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK)
+    if wd < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _drain_inotify(fd: int) -> tuple[bool, bool]:
+    """Read all pending inotify events.
+
+    Returns
+    -------
+    tuple[bool, bool]
+        `(changed, gone)`: whether a layer file changed (or events were lost),
+        and whether the watched directory itself went away.
+    """
+    changed = False
+    gone = False
+    while True:
+        try:
+            buffer = os.read(fd, _READ_SIZE)
+        except OSError as exc:
+            if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return changed, gone
+            raise
+        if not buffer:
+            return changed, gone
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            start = offset + _EVENT_HEADER.size
+            name = (
+                buffer[start : start + length]
+                .rstrip(b"\0")
+                .decode("utf-8", errors="replace")
+            )
+            offset = start + length
+
+            if mask & _IN_Q_OVERFLOW or name in LAYER_FILES:
+                changed = True
+            if mask & _GONE_MASK:
+                gone = True
@@ -0,0 +1,17 @@
+"""Fixtures shared by the test modules."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from mxm.config.loader import clear_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Iterator[None]:
+    """Run every test against empty in-process loader caches."""
+    clear_cache()
+    yield
+    clear_cache()
@@ -0,0 +1,26 @@
+"""Helpers shared by the test modules."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from mxm.types import RuntimeIdentity
+
+
+def make_identity(**fields: str) -> RuntimeIdentity:
+    """Return the `mxm-moneymachine` test identity with `fields` replaced."""
+    identity = RuntimeIdentity(
+        app="mxm-moneymachine",
+        environment="dev",
+        machine="bridge",
+        substrate="local-process",
+        role="marketdata",
+    )
+    return replace(identity, **fields)
+
+
+def write_file(path: Path, text: str) -> None:
+    """Write `text` to `path`, creating missing parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
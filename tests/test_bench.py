@@ -0,0 +1,110 @@
+"""Tests for load benchmarks against a configuration store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from mxm.config.bench import ANY_SELECTOR, BenchMode, discover_identities, run_bench
+from mxm.types import RuntimeIdentity
+from tests.support import write_file
+
+
+def _store(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "a:\n  x: 1\n  y: ${a.x}\nb: [1, 2]\n")
+    write_file(app_root / "environment.yaml", "dev:\n  a:\n    x: 2\nprod: {}\n")
+    write_file(app_root / "role.yaml", "marketdata: {}\nexecution:\n  b: [3]\nbad: 1\n")
+
+
+def test_discover_identities(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    identities = discover_identities(app="mxm-moneymachine", store_root=tmp_path)
+
+    assert [(i.environment, i.role) for i in identities] == [
+        ("dev", "marketdata"),
+        ("dev", "execution"),
+        ("dev", "bad"),
+        ("prod", "marketdata"),
+        ("prod", "execution"),
+        ("prod", "bad"),
+    ]
+    assert {(i.machine, i.substrate) for i in identities} == {
+        (ANY_SELECTOR, ANY_SELECTOR)
+    }
+
+
+def test_discover_identities_with_fixed_selectors(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    identities = discover_identities(
+        app="mxm-moneymachine",
+        store_root=tmp_path,
+        selectors=("prod", "bridge", None, "execution"),
+    )
+
+    assert identities == [
+        RuntimeIdentity(
+            app="mxm-moneymachine",
+            environment="prod",
+            machine="bridge",
+            substrate=ANY_SELECTOR,
+            role="execution",
+        )
+    ]
+
+
+def test_run_bench_summarises_loads(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identities = discover_identities(app="mxm-moneymachine", store_root=tmp_path)
+
+    result = run_bench(identities, store_root=tmp_path, repeat=3)
+
+    cold, warm = result.modes
+    assert (cold.mode, warm.mode) == ("cold", "warm")
+    for stats in result.modes:
+        assert stats.loads == 4 * 3
+        assert stats.errors == 2
+        assert stats.first_error is not None and "TypeError" in stats.first_error
+        assert stats.min_ms is not None
+        assert stats.median_ms is not None and stats.p99_ms is not None
+        assert 0 < stats.min_ms <= stats.median_ms <= stats.p99_ms
+        assert (stats.nodes_min, stats.nodes_max) == (6, 7)
+        assert "merge" in stats.stages_ms
+    assert "parse" in cold.stages_ms
+    assert "parse" not in warm.stages_ms
+    assert result.peak_rss_kib is not None and result.peak_rss_kib > 0
+    assert json.loads(json.dumps(result.to_dict()))["identities"] == 6
+    assert "p99 ms" in result.format()
+
+
+def test_run_bench_without_successful_loads(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identity = RuntimeIdentity(
+        app="mxm-moneymachine",
+        environment="qa",
+        machine="bridge",
+        substrate="local-process",
+        role="marketdata",
+    )
+
+    result = run_bench([identity], store_root=tmp_path, modes=["warm"])
+    (stats,) = result.modes
+
+    assert stats.loads == 0
+    assert stats.errors == 1
+    assert stats.median_ms is None
+    data = json.loads(json.dumps(result.to_dict(), allow_nan=False))
+    assert data["modes"][0]["min_ms"] is None
+    assert "n/a" in result.format()
+
+
+def test_run_bench_validates_arguments(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="repeat"):
+        run_bench([], store_root=tmp_path, repeat=0)
+    with pytest.raises(ValueError, match="Unknown bench mode"):
+        run_bench([], store_root=tmp_path, modes=[cast(BenchMode, "hot")])
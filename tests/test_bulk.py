@@ -0,0 +1,120 @@
+"""Tests for resolving many identities in worker processes."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mxm.config import load_config, to_config_data
+from mxm.config.bulk import resolve_many
+from mxm.types import RuntimeIdentity
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: ${env}\nenv: none\nroles: []\n")
+    write_file(
+        app_root / "environment.yaml",
+        "".join(f"env{i}:\n  env: env{i}\n" for i in range(5)),
+    )
+    write_file(
+        app_root / "role.yaml",
+        "".join(f"role{i}:\n  roles: [role{i}]\n" for i in range(4)),
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_resolve_many_matches_load_config(tmp_path: Path, workers: int) -> None:
+    _store(tmp_path)
+    identities = [
+        make_identity(environment=f"env{e}", role=f"role{r}")
+        for e in range(5)
+        for r in range(4)
+    ]
+
+    records = list(
+        resolve_many(
+            [*identities, *identities],
+            store_root=tmp_path,
+            workers=workers,
+            chunk_size=3,
+        )
+    )
+
+    assert len(records) == len(identities)
+    assert all(record.ok for record in records)
+    for record in map(lambda record: json.loads(record.line), records):
+        identity = RuntimeIdentity(**record["identity"])
+        assert record["config"] == to_config_data(
+            load_config(identity=identity, store_root=tmp_path)
+        )
+
+
+def test_resolve_many_reports_failures_per_identity(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identities = [
+        make_identity(environment="env0", role="role0"),
+        make_identity(environment="qa", role="role0"),
+        RuntimeIdentity(
+            app="missing",
+            environment="env0",
+            machine="bridge",
+            substrate="local-process",
+            role="role0",
+        ),
+    ]
+
+    records = [
+        json.loads(record.line)
+        for record in resolve_many(
+            identities, store_root=tmp_path, workers=2, chunk_size=1
+        )
+    ]
+
+    outcomes = {
+        (record["identity"]["app"], record["identity"]["environment"]): (
+            record["ok"],
+            record.get("error", {}).get("type"),
+        )
+        for record in records
+    }
+    assert outcomes == {
+        ("mxm-moneymachine", "env0"): (True, None),
+        ("mxm-moneymachine", "qa"): (False, "KeyError"),
+        ("missing", "env0"): (False, "FileNotFoundError"),
+    }
+
+
+def test_resolve_many_reports_unencodable_configs_per_identity(
+    tmp_path: Path,
+) -> None:
+    _store(tmp_path)
+    write_file(
+        tmp_path / "apps" / "mxm-moneymachine" / "role.yaml",
+        "role0:\n  data: !!python/object/apply:pathlib.Path [/srv]\n"
+        "role1:\n  ratio: .nan\n",
+    )
+    identities = [make_identity(environment="env0", role=f"role{r}") for r in (0, 1)]
+
+    records = {
+        record["identity"]["role"]: record
+        for record in (
+            json.loads(record.line)
+            for record in resolve_many(identities, store_root=tmp_path, workers=1)
+        )
+    }
+
+    assert records["role0"]["ok"] is True
+    assert records["role0"]["config"]["data"] == "/srv"
+    assert records["role1"]["ok"] is False
+    assert records["role1"]["error"]["type"] == "ValueError"
+
+
+def test_resolve_many_validates_arguments() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(resolve_many([], chunk_size=0))
+    with pytest.raises(ValueError, match="workers"):
+        list(resolve_many([], workers=0))
@@ -0,0 +1,71 @@
+"""Tests for store-wide resolution checks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mxm.config.check import CheckFailure, check_store, discover_apps
+from tests.support import write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    good = tmp_path / "apps" / "good"
+    write_file(good / "default.yaml", "a:\n  x: 1\n  y: ${a.x}\n")
+    write_file(good / "environment.yaml", "dev: {}\nprod:\n  a:\n    x: 2\n")
+    write_file(good / "role.yaml", "marketdata: {}\nexecution: {}\n")
+
+    bad = tmp_path / "apps" / "bad"
+    write_file(bad / "default.yaml", "a: 1\n")
+    write_file(bad / "role.yaml", "ok: {}\nscalar: 3\nbroken:\n  b: ${missing.key}\n")
+
+    write_file(tmp_path / "apps" / "empty" / "default.yaml", "a: 1\n")
+    write_file(tmp_path / "apps" / "empty" / "role.yaml", "")
+    (tmp_path / "apps" / "nodefault").mkdir()
+    return tmp_path
+
+
+def test_check_store_passes_for_a_clean_store(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    result = check_store(store, apps=["good"], workers=1)
+
+    assert result.ok
+    assert result.apps == 1
+    assert result.identities == 4
+    assert result.format().endswith(": ok")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_check_store_collects_every_failure(tmp_path: Path, workers: int) -> None:
+    store = _store(tmp_path)
+
+    result = check_store(store, workers=workers, chunk_size=1)
+
+    assert not result.ok
+    assert result.apps == 4
+    assert result.identities == 4 + 3
+    assert [
+        (failure.app, failure.selectors, failure.error_type)
+        for failure in result.failures
+    ] == [
+        ("bad", ("-", "-", "-", "broken"), "InterpolationKeyError"),
+        ("bad", ("-", "-", "-", "scalar"), "TypeError"),
+        ("empty", None, "ValueError"),
+        ("nodefault", None, "FileNotFoundError"),
+    ]
+    assert result.format().endswith("4 failed")
+
+
+def test_check_failure_format() -> None:
+    failure = CheckFailure("app", ("dev", "-", "-", "x"), "KeyError", "missing")
+
+    assert failure.format() == "app[dev/-/-/x]: KeyError: missing"
+
+
+def test_discover_apps(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="apps directory"):
+        discover_apps(tmp_path)
+
+    assert discover_apps(_store(tmp_path)) == ["bad", "empty", "good", "nodefault"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -137,3 +138,332 @@ def test_cli_show_config_fails_cleanly_for_missing_selector(tmp_path: Path) -> N
     assert result.exit_code == 1
     assert "Selector" in result.output
     assert "dev" in result.output
+
+
+def _resolve_many_store(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    _write(app_root / "default.yaml", "value: default\nrole: none\n")
+    _write(app_root / "environment.yaml", "dev:\n  value: dev\nprod:\n  value: prod\n")
+    _write(
+        app_root / "role.yaml",
+        "marketdata:\n  role: marketdata\nexecution:\n  role: execution\n",
+    )
+
+
+def test_cli_resolve_many_streams_identity_matrix(tmp_path: Path) -> None:
+    _resolve_many_store(tmp_path)
+
+    result = runner.invoke(
+        app,
+        [
+            "resolve-many",
+            "--app",
+            "mxm-moneymachine",
+            "--environment",
+            "dev,prod",
+            "--machine",
+            "bridge",
+            "--substrate",
+            "local-process",
+            "--role",
+            "marketdata",
+            "--role",
+            "execution",
+            "--store-root",
+            str(tmp_path),
+            "--workers",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert len(records) == 4
+    assert all(record["ok"] for record in records)
+    by_identity = {
+        (record["identity"]["environment"], record["identity"]["role"]): record[
+            "config"
+        ]
+        for record in records
+    }
+    assert by_identity[("prod", "execution")] == {"value": "prod", "role": "execution"}
+    assert by_identity[("dev", "marketdata")] == {"value": "dev", "role": "marketdata"}
+
+
+def test_cli_resolve_many_reads_identities_and_reports_errors(tmp_path: Path) -> None:
+    _resolve_many_store(tmp_path)
+    identity = {
+        "app": "mxm-moneymachine",
+        "environment": "dev",
+        "machine": "bridge",
+        "substrate": "local-process",
+        "role": "marketdata",
+    }
+    lines = [json.dumps(identity), "", json.dumps({**identity, "environment": "qa"})]
+
+    result = runner.invoke(
+        app,
+        ["resolve-many", "--identities", "-", "--store-root", str(tmp_path)],
+        input="\n".join(lines),
+    )
+
+    assert result.exit_code == 1
+    records = {
+        record["identity"]["environment"]: record
+        for record in map(json.loads, result.output.splitlines())
+    }
+    assert records["dev"]["ok"] is True
+    assert records["qa"]["ok"] is False
+    assert records["qa"]["error"]["type"] == "KeyError"
+    assert "qa" in records["qa"]["error"]["message"]
+
+
+def test_cli_resolve_many_rejects_invalid_input(tmp_path: Path) -> None:
+    identities = tmp_path / "identities.jsonl"
+    _write(identities, '{"app": "mxm-moneymachine"}\n')
+
+    missing = runner.invoke(app, ["resolve-many", "--app", "mxm-moneymachine"])
+    invalid = runner.invoke(app, ["resolve-many", "--identities", str(identities)])
+
+    assert missing.exit_code == 2
+    assert "missing --environment" in missing.output
+    assert invalid.exit_code == 2
+    assert "identities.jsonl:1" in invalid.output
+
+
+def test_cli_bench_reports_and_writes_json(tmp_path: Path) -> None:
+    app_root = tmp_path / "store" / "apps" / "mxm-moneymachine"
+    _write(app_root / "default.yaml", "value: default\n")
+    _write(app_root / "role.yaml", "marketdata:\n  value: a\nexecution:\n  value: b\n")
+    output = tmp_path / "bench.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "--app",
+            "mxm-moneymachine",
+            "--store-root",
+            str(tmp_path / "store"),
+            "--repeat",
+            "2",
+            "--json",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "identities=2 repeat=2" in result.output
+    assert "p99 ms" in result.output
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert [mode["mode"] for mode in data["modes"]] == ["cold", "warm"]
+    assert data["modes"][0]["loads"] == 4
+
+
+def test_cli_bench_fails_cleanly_for_missing_app_root(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["bench", "--app", "mxm-moneymachine", "--store-root", str(tmp_path)]
+    )
+
+    assert result.exit_code == 1
+    assert "Application configuration root" in result.output
+
+
+def _show_config(store_root: Path, *options: str) -> list[str]:
+    return [
+        "show-config",
+        "--app",
+        "mxm-moneymachine",
+        "--environment",
+        "dev",
+        "--machine",
+        "bridge",
+        "--substrate",
+        "local-process",
+        "--role",
+        "marketdata",
+        "--store-root",
+        str(store_root),
+        *options,
+    ]
+
+
+def _json_store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    _write(
+        app_root / "default.yaml",
+        "db:\n  host: localhost\n  port: 5432\n  url: ${db.host}:${db.port}\n"
+        "tags: [a, b]\n",
+    )
+    _write(app_root / "role.yaml", "marketdata:\n  db:\n    port: 6543\n")
+    return tmp_path
+
+
+def test_cli_show_config_json(tmp_path: Path) -> None:
+    result = runner.invoke(app, _show_config(_json_store(tmp_path), "--format", "json"))
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {
+        "db": {"host": "localhost", "port": 6543, "url": "localhost:6543"},
+        "tags": ["a", "b"],
+    }
+
+
+def test_cli_show_config_json_encodes_paths_and_rejects_nan(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    _write(
+        app_root / "default.yaml",
+        "data: !!python/object/apply:pathlib.Path [/srv, data]\nratio: 1.5\n",
+    )
+    _write(app_root / "role.yaml", "marketdata: {}\nexecution:\n  ratio: .nan\n")
+
+    paths = runner.invoke(app, _show_config(tmp_path, "--format", "jsonl"))
+    nan = runner.invoke(
+        app, _show_config(tmp_path, "--format", "json", "--role", "execution")
+    )
+
+    assert paths.exit_code == 0
+    assert json.loads(paths.output) == {"data": "/srv/data", "ratio": 1.5}
+    assert nan.exit_code == 1
+    assert "cannot encode the configuration as JSON" in nan.output
+    assert "Traceback" not in nan.output
+
+
+def test_cli_show_config_jsonl_path(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, _show_config(_json_store(tmp_path), "--format", "jsonl", "--path", "db")
+    )
+
+    assert result.exit_code == 0
+    assert result.output == (
+        '{"host":"localhost","port":6543,"url":"localhost:6543"}\n'
+    )
+
+
+def test_cli_show_config_yaml_path(tmp_path: Path) -> None:
+    result = runner.invoke(app, _show_config(_json_store(tmp_path), "--path", "db"))
+
+    assert result.exit_code == 0
+    assert "url: localhost:6543" in result.output
+    assert "tags" not in result.output
+
+
+def test_cli_show_config_rejects_bad_output_options(tmp_path: Path) -> None:
+    store = _json_store(tmp_path)
+
+    unknown = runner.invoke(app, _show_config(store, "--format", "toml"))
+    unresolved = runner.invoke(
+        app, _show_config(store, "--format", "json", "--no-resolve")
+    )
+    missing = runner.invoke(app, _show_config(store, "--format", "json", "--path", "x"))
+    leaf = runner.invoke(app, _show_config(store, "--path", "db.port"))
+
+    assert unknown.exit_code == 2
+    assert "unknown format 'toml'" in unknown.output
+    assert unresolved.exit_code == 2
+    assert missing.exit_code == 1
+    assert "x" in missing.output
+    assert leaf.exit_code == 1
+    assert "mapping" in leaf.output
+
+
+def test_cli_check(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    _write(app_root / "default.yaml", "value: ${other}\nother: 1\n")
+    _write(app_root / "role.yaml", "marketdata: {}\nexecution: []\n")
+
+    failed = runner.invoke(
+        app, ["check", "--store-root", str(tmp_path), "--app", "mxm-moneymachine"]
+    )
+    _write(app_root / "role.yaml", "marketdata: {}\n")
+    fixed = runner.invoke(app, ["check", "--store-root", str(tmp_path)])
+    missing = runner.invoke(app, ["check", "--store-root", str(tmp_path / "none")])
+
+    assert failed.exit_code == 1
+    assert "FAIL mxm-moneymachine[-/-/-/execution]: TypeError" in failed.output
+    assert fixed.exit_code == 0
+    assert "checked 1 identities of 1 apps" in fixed.output
+    assert missing.exit_code == 2
+    assert "apps directory" in missing.output
+
+
+def test_cli_show_config_provenance(tmp_path: Path) -> None:
+    store = _json_store(tmp_path)
+
+    table = runner.invoke(app, _show_config(store, "--provenance"))
+    subtree = runner.invoke(
+        app, _show_config(store, "--provenance", "--format", "json", "--path", "db")
+    )
+
+    assert table.exit_code == 0
+    assert table.output.splitlines() == [
+        "db.host  default",
+        "db.port  role",
+        "db.url   default",
+        "tags     default",
+    ]
+    assert subtree.exit_code == 0
+    assert json.loads(subtree.output) == {
+        "db.host": "default",
+        "db.port": "role",
+        "db.url": "default",
+    }
+
+
+def test_cli_diff(tmp_path: Path) -> None:
+    store = _json_store(tmp_path)
+    _write(
+        store / "apps" / "mxm-moneymachine" / "role.yaml",
+        "marketdata:\n  db:\n    port: 6543\n"
+        "execution:\n  db:\n    host: exec\n  orders: true\n",
+    )
+    diff = ["diff", *_show_config(store)[1:]]
+
+    text = runner.invoke(app, [*diff, "--to-role", "execution"])
+    jsonl = runner.invoke(
+        app, [*diff, "--to-role", "execution", "--path", "db", "--format", "jsonl"]
+    )
+    same = runner.invoke(app, [*diff, "--format", "json"])
+    missing = runner.invoke(app, [*diff, "--to-role", "risk"])
+
+    assert text.exit_code == 1
+    assert text.output.splitlines() == [
+        '~ db.host: "localhost" -> "exec"',
+        "~ db.port: 6543 -> 5432",
+        '~ db.url: "localhost:6543" -> "exec:5432"',
+        "+ orders: true",
+    ]
+    assert jsonl.exit_code == 1
+    assert json.loads(jsonl.output.splitlines()[1]) == {
+        "kind": "changed",
+        "path": "db.port",
+        "old": 6543,
+        "new": 5432,
+    }
+    assert same.exit_code == 0
+    assert json.loads(same.output) == []
+    assert missing.exit_code == 2
+    assert "risk" in missing.output
+
+
+def test_cli_diff_encodes_path_leaves(tmp_path: Path) -> None:
+    store = _json_store(tmp_path)
+    _write(
+        store / "apps" / "mxm-moneymachine" / "role.yaml",
+        "marketdata:\n  data: !!python/object/apply:pathlib.Path [/srv/a]\n"
+        "execution:\n  data: !!python/object/apply:pathlib.Path [/srv/b]\n",
+    )
+    diff = ["diff", *_show_config(store)[1:], "--to-role", "execution"]
+
+    text = runner.invoke(app, diff)
+    jsonl = runner.invoke(app, [*diff, "--format", "jsonl"])
+
+    assert text.exit_code == 1
+    assert text.output.splitlines() == ['~ data: "/srv/a" -> "/srv/b"']
+    assert jsonl.exit_code == 1
+    assert json.loads(jsonl.output) == {
+        "kind": "changed",
+        "path": "data",
+        "old": "/srv/a",
+        "new": "/srv/b",
+    }
@@ -0,0 +1,325 @@
+"""Tests for the local config daemon and its client."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mxm.config import FrozenConfig, fetch_config, load_config, to_config_data
+from mxm.config.daemon import ConfigServer, default_socket_path
+from tests.support import make_identity, write_file
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+
+def _store(tmp_path: Path) -> Path:
+    store = tmp_path / "store"
+    app_root = store / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "a:\n  x: 1\n  y: ${a.x}\nb: [1, 2]\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  a:\n    x: 2\n")
+    return store
+
+
+def _request(store: Path) -> bytes:
+    identity = dataclasses.asdict(make_identity())
+    request = {"v": 1, "identity": identity, "store_root": str(store)}
+    return json.dumps(request).encode("utf-8") + b"\n"
+
+
+def _exchange(path: Path, data: bytes, *, count: int = 1) -> list[bytes]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(data)
+        with sock.makefile("rb") as stream:
+            return [stream.readline() for _ in range(count)]
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[ConfigServer]:
+    server = ConfigServer(tmp_path / "daemon.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.close()
+
+
+def test_fetch_config_is_served_by_the_daemon(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    store = _store(tmp_path)
+
+    cfg = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    assert isinstance(cfg, FrozenConfig)
+    assert server.requests == 1
+    assert to_config_data(cfg) == to_config_data(
+        load_config(identity=make_identity(), store_root=store)
+    )
+    assert cfg.a.y == 2
+
+
+def test_daemon_applies_overrides(tmp_path: Path, server: ConfigServer) -> None:
+    store = _store(tmp_path)
+
+    cfg = fetch_config(
+        identity=make_identity(),
+        store_root=store,
+        overrides={"b": [3], "c": {"d": None}},
+        socket_path=server.socket_path,
+    )
+
+    assert server.requests == 1
+    assert cfg.b == (3,)
+    assert cfg.c.d is None
+
+
+def test_daemon_picks_up_edited_layer_files(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    store = _store(tmp_path)
+    role_file = store / "apps" / "mxm-moneymachine" / "role.yaml"
+
+    first = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+    write_file(role_file, "marketdata:\n  a:\n    x: 30\n")
+    second = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    assert server.requests == 2
+    assert first.a.x == 2
+    assert second.a.x == 30
+
+
+def test_daemon_errors_are_raised_by_the_local_fallback(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    store = _store(tmp_path)
+
+    with pytest.raises(KeyError, match="Selector"):
+        fetch_config(
+            identity=make_identity(role="execution"),
+            store_root=store,
+            socket_path=server.socket_path,
+        )
+
+    assert server.requests == 1
+
+
+def test_fetch_config_falls_back_without_daemon(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    cfg = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=tmp_path / "none.sock"
+    )
+
+    assert isinstance(cfg, FrozenConfig)
+    assert cfg.a.x == 2
+
+
+def test_fetch_config_falls_back_on_timeout(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    path = tmp_path / "silent.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+        silent.bind(str(path))
+        silent.listen()
+
+        cfg = fetch_config(
+            identity=make_identity(), store_root=store, socket_path=path, timeout=0.05
+        )
+
+    assert cfg.a.x == 2
+
+
+def test_connection_carries_several_requests(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    request = _request(_store(tmp_path))
+
+    lines = _exchange(server.socket_path, request + b"[]\n" + request, count=3)
+
+    assert lines[0] == lines[2]
+    assert lines[0].startswith(b'{"ok":true')
+    assert b'"ok": false' in lines[1]
+
+
+def test_socket_is_private_and_removed_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "daemon.sock"
+
+    with ConfigServer(path):
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    assert not path.exists()
+
+
+def test_refuses_to_replace_a_live_daemon(server: ConfigServer) -> None:
+    with pytest.raises(FileExistsError, match="already listening"):
+        ConfigServer(server.socket_path)
+
+
+def test_replaces_a_stale_socket(tmp_path: Path) -> None:
+    path = tmp_path / "daemon.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(path))
+
+    with ConfigServer(path) as server:
+        assert server.socket_path == path
+
+
+def test_default_socket_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+
+    assert default_socket_path() == Path("/run/user/1000/mxm-config.sock")
+
+
+def test_fallback_socket_dir_is_private(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    directory = tmp_path / f"mxm-config-{os.getuid()}"
+
+    with ConfigServer() as server:
+        assert server.socket_path == directory / "mxm-config.sock"
+        assert directory.stat().st_mode & 0o777 == 0o700
+
+    directory.chmod(0o755)
+    with pytest.raises(PermissionError, match="mode 0700"):
+        ConfigServer()
+
+
+def test_fetch_config_ignores_a_daemon_of_another_user(
+    tmp_path: Path, server: ConfigServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+    cfg = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    assert server.requests == 0
+    assert cfg.a.x == 2
+
+
+def test_fetch_config_checks_the_socket_file_without_peer_credentials(
+    tmp_path: Path, server: ConfigServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    monkeypatch.delattr(socket, "SO_PEERCRED", raising=False)
+
+    server.socket_path.chmod(0o666)
+    fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+    requests_while_shared = server.requests
+    server.socket_path.chmod(0o600)
+    fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    assert requests_while_shared == 0
+    assert server.requests == 1
+
+
+def test_configs_with_non_string_keys_are_loaded_locally(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    store = _store(tmp_path)
+    write_file(
+        store / "apps" / "mxm-moneymachine" / "default.yaml", "ports:\n  80: http\n"
+    )
+
+    cfg = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    # JSON would have turned the key into "80"; the daemon declines instead.
+    assert server.requests == 1
+    assert to_config_data(cfg) == {"ports": {80: "http"}, "a": {"x": 2}}
+
+
+def test_overrides_with_non_string_keys_are_loaded_locally(
+    tmp_path: Path, server: ConfigServer
+) -> None:
+    store = _store(tmp_path)
+
+    cfg = fetch_config(
+        identity=make_identity(),
+        store_root=store,
+        overrides={"ports": {80: "http"}},
+        socket_path=server.socket_path,
+    )
+
+    assert server.requests == 0
+    assert to_config_data(cfg)["ports"] == {80: "http"}
+
+
+def test_configs_with_resolvers_are_loaded_locally(
+    tmp_path: Path, server: ConfigServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    write_file(
+        store / "apps" / "mxm-moneymachine" / "default.yaml",
+        "host: ${oc.env:MXM_DAEMON_TEST_HOST}\n",
+    )
+    monkeypatch.setenv("MXM_DAEMON_TEST_HOST", "caller")
+
+    reply = json.loads(_exchange(server.socket_path, _request(store))[0])
+    cfg = fetch_config(
+        identity=make_identity(), store_root=store, socket_path=server.socket_path
+    )
+
+    # The daemon would resolve the variable in its own environment.
+    assert reply["ok"] is False
+    assert "resolver" in reply["error"]
+    assert server.requests == 2
+    assert cfg.host == "caller"
+
+
+def test_serve_command(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    path = tmp_path / "cli.sock"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mxm.config.cli", "serve", "--socket", str(path)],
+        env={**os.environ, "PYTHONPATH": str(SRC_ROOT)},
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            assert process.poll() is None, process.communicate()[1]
+            assert time.monotonic() < deadline
+            try:
+                (response,) = _exchange(path, _request(store))
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                # The socket file exists between bind and listen.
+                time.sleep(0.01)
+        assert json.loads(response)["config"]["a"]["x"] == 2
+    finally:
+        process.send_signal(signal.SIGTERM)
+        _, stderr = process.communicate(timeout=30)
+
+    assert process.returncode == 0
+    assert f"serving on {path}" in stderr
+    assert not path.exists()
@@ -0,0 +1,138 @@
+"""Tests for the structural diff of resolved configs."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import OmegaConf
+
+from mxm.config import (
+    ConfigChange,
+    FrozenConfig,
+    LazyConfig,
+    diff as diff_module,
+    diff_configs,
+    fingerprint,
+    make_view,
+)
+
+OLD: dict[str, Any] = {
+    "db": {"host": "localhost", "port": 5432},
+    "cache": {"ttl": 60, "nested": {"size": 1}},
+    "tags": ["a", "b"],
+    "legacy": {"enabled": True},
+}
+NEW: dict[str, Any] = {
+    "db": {"host": "db.prod", "port": 5432},
+    "cache": {"ttl": 60, "nested": {"size": 1}},
+    "tags": ["a", "c"],
+    "workers": 8,
+}
+
+
+def _readonly(data: dict[str, Any]) -> Any:
+    cfg = OmegaConf.create(data)
+    OmegaConf.set_readonly(cfg, True)
+    return cfg
+
+
+def test_diff_reports_added_removed_and_changed_paths() -> None:
+    changes = list(diff_configs(FrozenConfig(OLD), FrozenConfig(NEW)))
+
+    assert changes == [
+        ConfigChange("changed", "db.host", "localhost", "db.prod"),
+        ConfigChange("changed", "tags", ["a", "b"], ["a", "c"]),
+        ConfigChange("removed", "legacy", old={"enabled": True}),
+        ConfigChange("added", "workers", new=8),
+    ]
+    assert [change.to_dict() for change in changes[1:]] == [
+        {"kind": "changed", "path": "tags", "old": ["a", "b"], "new": ["a", "c"]},
+        {"kind": "removed", "path": "legacy", "value": {"enabled": True}},
+        {"kind": "added", "path": "workers", "value": 8},
+    ]
+
+
+def test_diff_of_equal_configs_is_empty_across_backends() -> None:
+    configs = [
+        _readonly(OLD),
+        OmegaConf.create(OLD),
+        FrozenConfig(OLD),
+        LazyConfig(_readonly(OLD)),
+    ]
+
+    for a in configs:
+        for b in configs:
+            assert list(diff_configs(a, b)) == []
+
+
+def test_diff_mixed_backends_and_views() -> None:
+    changes = list(
+        diff_configs(
+            make_view(_readonly(OLD), "db"), make_view(FrozenConfig(NEW), "db")
+        )
+    )
+
+    assert changes == [ConfigChange("changed", "host", "localhost", "db.prod")]
+
+
+def test_diff_skips_identical_subtrees(monkeypatch: pytest.MonkeyPatch) -> None:
+    a = FrozenConfig(OLD)
+    b = FrozenConfig(NEW)
+    fingerprint(a)
+    fingerprint(b)
+    walked: list[str] = []
+    diff_mappings = diff_module._diff_mappings  # pyright: ignore[reportPrivateUsage]
+
+    def spy(*args: Any) -> Any:
+        walked.append(args[4])
+        return diff_mappings(*args)
+
+    monkeypatch.setattr(diff_module, "_diff_mappings", spy)
+    list(diff_configs(a, b))
+
+    assert walked == ["", "db"]
+
+
+def test_diff_distinguishes_value_types() -> None:
+    a = FrozenConfig({"x": 1, "y": 1, "z": {"k": 1}})
+    b = FrozenConfig({"x": 1.0, "y": True, "z": 1})
+
+    assert list(diff_configs(a, b)) == [
+        ConfigChange("changed", "x", 1, 1.0),
+        ConfigChange("changed", "y", 1, True),
+        ConfigChange("changed", "z", {"k": 1}, 1),
+    ]
+
+
+def test_diff_compares_nan_leaves_by_value() -> None:
+    a = FrozenConfig({"x": math.nan, "y": [math.nan], "z": 0.0})
+    b = FrozenConfig({"x": math.nan, "y": [math.nan], "z": math.nan})
+
+    assert list(diff_configs(a, b)) == [ConfigChange("changed", "z", 0.0, math.nan)]
+
+
+def test_diff_compares_path_and_bytes_leaves() -> None:
+    a = FrozenConfig({"root": Path("/srv/a"), "raw": b"x", "home": Path("/home")})
+    b = FrozenConfig({"root": Path("/srv/b"), "raw": b"x", "home": "/home"})
+
+    assert list(diff_configs(a, b)) == [
+        ConfigChange("changed", "root", Path("/srv/a"), Path("/srv/b")),
+        ConfigChange("changed", "home", Path("/home"), "/home"),
+    ]
+
+
+def test_diff_supports_mixed_key_types() -> None:
+    a = _readonly({"ports": {80: "http", "name": "web"}, "tls": {443: "https"}})
+    b = FrozenConfig({"ports": {"name": "web", 80: "http2"}, "tls": {443: "https"}})
+
+    assert list(diff_configs(a, b)) == [
+        ConfigChange("changed", "ports.80", "http", "http2")
+    ]
+
+
+def test_diff_rejects_non_configs() -> None:
+    with pytest.raises(TypeError, match="diff_configs expects"):
+        list(diff_configs({"a": 1}, FrozenConfig(OLD)))  # type: ignore[arg-type]
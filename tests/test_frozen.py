@@ -0,0 +1,147 @@
+"""Tests for the compact `FrozenConfig` backend."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from mxm.config import (
+    FrozenConfig,
+    MXMConfig,
+    load_config,
+    load_configs,
+    make_view,
+    to_config_data,
+)
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(
+        app_root / "default.yaml",
+        """
+base: /srv
+parameters:
+  refresh_interval: 5min
+  symbols: [AAA, BBB]
+services:
+  database:
+    path: ${base}/db.sqlite
+    pools:
+      - {name: primary, size: 4}
+""",
+    )
+    write_file(app_root / "role.yaml", "marketdata:\n  parameters:\n    depth: 10\n")
+    return tmp_path
+
+
+def _frozen() -> FrozenConfig:
+    return FrozenConfig(
+        {
+            "a": {"b": {"c": 1}},
+            "items": [{"name": "x"}, 2],
+            "leaf": "v",
+        }
+    )
+
+
+def test_load_config_frozen_backend_matches_omegaconf(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    frozen = load_config(identity=make_identity(), store_root=store, backend="frozen")
+    omega = load_config(identity=make_identity(), store_root=store)
+
+    assert isinstance(frozen, FrozenConfig)
+    assert isinstance(frozen, MXMConfig)
+    assert to_config_data(frozen) == to_config_data(omega)
+    assert frozen.services.database.path == "/srv/db.sqlite"
+    assert frozen["parameters"]["depth"] == 10
+    assert frozen.parameters.symbols == ("AAA", "BBB")
+    assert frozen.services.database.pools[0].name == "primary"
+
+
+def test_load_configs_frozen_backend(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    batch = load_configs([make_identity()], store_root=store, backend="frozen")
+
+    assert isinstance(batch[make_identity()], FrozenConfig)
+
+
+def test_load_config_rejects_unknown_backend(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    with pytest.raises(ValueError, match="Unknown config backend"):
+        load_config(
+            identity=make_identity(),
+            store_root=store,
+            backend=cast(Any, "yaml"),
+        )
+
+
+def test_frozen_config_is_immutable() -> None:
+    cfg = _frozen()
+
+    with pytest.raises(AttributeError):
+        cfg.leaf = "other"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        cast(Any, cfg)["leaf"] = "other"
+    with pytest.raises(AttributeError):
+        del cfg.leaf  # type: ignore[misc]
+
+
+def test_frozen_config_missing_keys() -> None:
+    cfg = _frozen()
+
+    with pytest.raises(AttributeError):
+        _ = cfg.missing
+    with pytest.raises(KeyError):
+        _ = cfg["missing"]
+    assert "missing" not in cfg
+    assert cfg.get("missing") is None
+
+
+def test_frozen_config_round_trips_and_pickles() -> None:
+    cfg = _frozen()
+    data = cfg.to_dict()
+
+    assert data == {"a": {"b": {"c": 1}}, "items": [{"name": "x"}, 2], "leaf": "v"}
+    assert pickle.loads(pickle.dumps(cfg)) == cfg
+
+
+def test_make_view_on_frozen_config() -> None:
+    cfg = _frozen()
+
+    view = make_view(cfg, "a.b")
+    assert isinstance(view, FrozenConfig)
+    assert view.c == 1
+    assert view is cfg.a.b
+    assert make_view(cfg, "items.0").name == "x"
+
+
+def test_make_view_on_frozen_config_errors() -> None:
+    cfg = _frozen()
+
+    with pytest.raises(KeyError):
+        make_view(cfg, "a.missing")
+    with pytest.raises(KeyError):
+        make_view(cfg, "items.5")
+    with pytest.raises(TypeError):
+        make_view(cfg, "leaf")
+    with pytest.raises(TypeError):
+        make_view(cfg, "items")
+    with pytest.raises(ValueError):
+        make_view(cfg, "a", readonly=False)
+
+
+def test_to_config_data_on_frozen_view_returns_fresh_copy() -> None:
+    cfg = _frozen()
+
+    data = cast(dict[str, Any], to_config_data(make_view(cfg, "a")))
+    data["b"]["c"] = 2
+
+    assert cfg.a.b.c == 1
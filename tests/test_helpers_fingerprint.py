@@ -0,0 +1,170 @@
+"""Tests for Merkle fingerprints of resolved configs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path, PosixPath
+from typing import Any, cast
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from mxm.config import (
+    FrozenConfig,
+    LazyConfig,
+    MXMConfig,
+    _tree,
+    fingerprint,
+    load_config,
+    make_view,
+    share_config,
+)
+from mxm.config.shared import segment_name, unlink_shared_config
+from tests.support import make_identity, write_file
+
+DATA: dict[str, Any] = {
+    "services": {
+        "db": {"host": "localhost", "port": 5432, "url": "pg://localhost"},
+        "hosts": ["a", {"name": "b"}],
+    },
+    "ratio": 0.5,
+    "flag": False,
+    "empty": None,
+}
+
+
+def _mk_cfg(*, readonly: bool = True) -> DictConfig:
+    data = {**DATA, "services": {**DATA["services"]}}
+    data["services"]["db"] = {**DATA["services"]["db"], "url": "pg://${.host}"}
+    cfg = OmegaConf.create(data)
+    OmegaConf.set_readonly(cfg, readonly)
+    return cfg
+
+
+@pytest.fixture
+def shared_names() -> Iterator[list[str]]:
+    names: list[str] = []
+    yield names
+    for name in names:
+        unlink_shared_config(name)
+
+
+def test_equal_data_has_equal_fingerprints_across_backends(
+    shared_names: list[str],
+) -> None:
+    shared = share_config(FrozenConfig(DATA))
+    shared_names.append(cast(str, segment_name(shared)))
+
+    configs: list[object] = [
+        _mk_cfg(),
+        _mk_cfg(readonly=False),
+        FrozenConfig(DATA),
+        LazyConfig(_mk_cfg()),
+        shared,
+    ]
+
+    expected = fingerprint(cast(MXMConfig, configs[0]))
+    assert len(expected) == 40
+    assert {fingerprint(cast(MXMConfig, cfg)) for cfg in configs} == {expected}
+
+
+def test_fingerprint_ignores_key_order_only() -> None:
+    reordered = FrozenConfig(dict(reversed(list(DATA.items()))))
+
+    assert fingerprint(reordered) == fingerprint(FrozenConfig(DATA))
+
+
+def test_fingerprint_supports_mixed_key_types() -> None:
+    cfg = cast(
+        DictConfig, OmegaConf.create("ports: {80: http, name: web, 1.5: x, true: y}")
+    )
+    OmegaConf.set_readonly(cfg, True)
+    reordered = {"name": "web", True: "y", 1.5: "x", 80: "http"}
+    stringified = {"80": "http", "name": "web", 1.5: "x", True: "y"}
+
+    assert fingerprint(cfg) == fingerprint(FrozenConfig({"ports": reordered}))
+    assert fingerprint(cfg) != fingerprint(FrozenConfig({"ports": stringified}))
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"value": "1"},
+        {"value": 1.0},
+        {"value": True},
+        {"value": None},
+        {"value": [1]},
+        {"value": {"1": 1}},
+        {"valu": 1},
+    ],
+)
+def test_fingerprint_distinguishes_types_and_structure(other: dict[str, Any]) -> None:
+    assert fingerprint(FrozenConfig(other)) != fingerprint(FrozenConfig({"value": 1}))
+
+
+def test_fingerprint_distinguishes_concatenated_strings() -> None:
+    first = FrozenConfig({"a": ["ab", "c"]})
+    second = FrozenConfig({"a": ["a", "bc"]})
+
+    assert fingerprint(first) != fingerprint(second)
+
+
+def test_views_are_cached_by_the_root_fingerprint() -> None:
+    cfg = _mk_cfg()
+    view = make_view(cfg, "services.db")
+    cache = _tree.FINGERPRINTS
+    assert cache.get(view) is None
+
+    fingerprint(cfg)
+
+    assert cache.get(view) is not None
+    assert fingerprint(view) == fingerprint(FrozenConfig(DATA["services"]["db"]))
+
+
+def test_mapping_config_views_are_cached() -> None:
+    cfg = FrozenConfig(DATA)
+    cache = _tree.FINGERPRINTS
+
+    fingerprint(cfg)
+
+    assert cache.get(make_view(cfg, "services.hosts.1")) is not None
+
+
+def test_writable_configs_are_hashed_on_every_call() -> None:
+    cfg = _mk_cfg(readonly=False)
+    before = fingerprint(cfg)
+
+    cfg.services.db.port = 6543
+
+    assert fingerprint(cfg) != before
+    assert _tree.FINGERPRINTS.get(cfg) is None
+
+
+def test_fingerprint_rejects_unsupported_inputs() -> None:
+    with pytest.raises(TypeError, match="fingerprint expects"):
+        fingerprint(cast(MXMConfig, {"a": 1}))
+
+
+def test_fingerprint_encodes_paths_bytes_and_other_scalars(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(
+        app_root / "default.yaml",
+        "root: !!python/object/apply:pathlib.PosixPath [/srv, data]\n"
+        "raw: !!binary aGVsbG8=\n",
+    )
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert fingerprint(cfg) == fingerprint(
+        FrozenConfig({"root": PosixPath("/srv/data"), "raw": b"hello"})
+    )
+    distinct = [
+        {"root": "/srv/data", "raw": b"hello"},
+        {"root": PosixPath("/srv/other"), "raw": b"hello"},
+        {"root": PosixPath("/srv/data"), "raw": "hello"},
+        {"root": PosixPath("/srv/data"), "raw": b"hello", "day": date(2024, 1, 2)},
+        {"root": PosixPath("/srv/data"), "raw": b"hello", "day": "2024-01-02"},
+    ]
+    fingerprints = {fingerprint(FrozenConfig(data)) for data in distinct}
+    assert len(fingerprints) == len(distinct)
+    assert fingerprint(cfg) not in fingerprints
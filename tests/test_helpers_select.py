@@ -0,0 +1,136 @@
+"""Tests for dotted-path lookups with `select` and the path index."""
+
+from __future__ import annotations
+
+import gc
+from typing import Any, cast
+
+import pytest
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+from mxm.config import FrozenConfig, LazyConfig, MXMConfig, make_view, select
+from mxm.config.helpers import path_index_info
+
+
+def _mk_cfg(*, readonly: bool = True) -> DictConfig:
+    cfg = OmegaConf.create(
+        {
+            "services": {
+                "db": {"host": "localhost", "port": 5432, "url": "pg://${.host}"},
+                "hosts": ["a", {"name": "b"}],
+                "empty": None,
+                "required": "???",
+            },
+            "alias": "${services.db}",
+            "flag": False,
+        }
+    )
+    OmegaConf.set_readonly(cfg, readonly)
+    return cfg
+
+
+def _paths(value: Any, prefix: str = "") -> list[str]:
+    if isinstance(value, dict):
+        items = cast(dict[str, Any], value).items()
+    elif isinstance(value, list):
+        items = ((str(i), item) for i, item in enumerate(cast(list[Any], value)))
+    else:
+        return []
+    paths: list[str] = []
+    for key, item in items:
+        path = f"{prefix}.{key}" if prefix else key
+        paths += [path, *_paths(item, path)]
+    return paths
+
+
+def test_select_matches_omegaconf_select() -> None:
+    cfg = _mk_cfg()
+    plain = OmegaConf.to_container(cfg, resolve=False)
+    paths = [*_paths(plain), "alias.host", "services.hosts[1].name", "nope.x"]
+
+    for path in paths:
+        expected = OmegaConf.select(cfg, path, default="<missing>")
+        assert select(cfg, path, default="<missing>") == expected, path
+        # Second lookup is served from the index.
+        assert select(cfg, path, default="<missing>") == expected, path
+
+
+def test_select_returns_nodes_and_leaves() -> None:
+    cfg = _mk_cfg()
+
+    assert select(cfg, "services.db") is cfg.services.db
+    assert isinstance(select(cfg, "services.hosts"), ListConfig)
+    assert select(cfg, "services.hosts.1.name") == "b"
+    assert select(cfg, "services.db.url") == "pg://localhost"
+    assert select(cfg, "services.empty") is None
+    assert select(cfg, "flag") is False
+
+
+def test_missing_paths() -> None:
+    cfg = _mk_cfg()
+
+    assert select(cfg, "services.required", default=1) == 1
+    assert select(cfg, "services.hosts.5", default=None) is None
+    with pytest.raises(KeyError, match=r"services\.nope"):
+        select(cfg, "services.nope")
+
+
+def test_read_only_lookups_do_not_walk_the_tree(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cfg = _mk_cfg()
+
+    def _fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("OmegaConf.select called")
+
+    monkeypatch.setattr(OmegaConf, "select", _fail)
+
+    assert select(cfg, "services.db.port") == 5432
+    assert make_view(cfg, "services.db") is cfg.services.db
+
+
+def test_writable_configs_are_not_indexed() -> None:
+    cfg = _mk_cfg()
+    assert select(cfg, "services.db.port") == 5432
+
+    OmegaConf.set_readonly(cfg, False)
+    cfg.services.db.port = 6543
+
+    assert select(cfg, "services.db.port") == 6543
+    assert make_view(cfg, "services.db").port == 6543
+
+
+def test_frozen_and_lazy_configs() -> None:
+    data = {"a": {"b": [1, {"c": 2}]}}
+    frozen = FrozenConfig(data)
+    lazy = LazyConfig(OmegaConf.create(data))
+
+    for cfg in (cast(MXMConfig, frozen), cast(MXMConfig, lazy)):
+        assert select(cfg, "a.b.1.c") == 2
+        assert select(cfg, "a.x", default=0) == 0
+        with pytest.raises(KeyError):
+            select(cfg, "a.b.2")
+
+
+def test_rejects_other_objects() -> None:
+    with pytest.raises(TypeError, match="select expects"):
+        select(cast(MXMConfig, object()), "a")
+
+
+def test_path_index_memory_accounting() -> None:
+    gc.collect()
+    before = path_index_info()
+    cfg = _mk_cfg()
+
+    select(cfg, "services.db.host")
+    info = path_index_info()
+
+    assert info.configs == before.configs + 1
+    # Root, services, db, hosts, hosts.1 and the memoized leaf.
+    assert info.entries == before.entries + 6
+    assert info.nbytes > before.nbytes
+
+    del cfg
+    gc.collect()
+
+    assert path_index_info() == before
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from typing import cast
+import gc
+from types import MappingProxyType
+from typing import Any, cast
 
 import pytest
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 
-from mxm.config import MXMConfig, make_subconfig, to_config_data
+from mxm.config import (
+    FrozenConfig,
+    MXMConfig,
+    helpers,
+    make_subconfig,
+    make_view,
+    to_config_data,
+)
 
 
 def test_to_config_data_returns_plain_mapping() -> None:
@@ -73,3 +82,92 @@ def test_to_config_data_rejects_non_dictconfig() -> None:
 
     with pytest.raises(TypeError, match="OmegaConf DictConfig"):
         to_config_data(cfg)
+
+
+def _count_conversions(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = OmegaConf.to_container
+
+    def _counting(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(OmegaConf, "to_container", _counting)
+    return calls
+
+
+def test_read_only_conversion_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Read-only configs are converted once; callers get independent copies."""
+    cfg = make_subconfig({"outer": {"values": [1, 2]}, "ref": "${outer.values}"})
+    calls = _count_conversions(monkeypatch)
+
+    first: Any = to_config_data(cfg)
+    first["outer"]["values"].append(3)
+    second = to_config_data(cfg)
+
+    assert second == {"outer": {"values": [1, 2]}, "ref": [1, 2]}
+    assert second is not first
+    assert len(calls) == 1
+
+
+def test_immutable_result_is_shared_and_read_only() -> None:
+    """immutable=True returns one shared read-only structure."""
+    cfg = make_subconfig({"outer": {"values": [1, 2]}})
+
+    data = to_config_data(cfg, immutable=True)
+
+    assert to_config_data(cfg, immutable=True) is data
+    assert isinstance(data, MappingProxyType)
+    assert isinstance(data["outer"], MappingProxyType)
+    assert data["outer"]["values"] == (1, 2)
+    with pytest.raises(TypeError):
+        data["outer"]["x"] = 1  # type: ignore[index]
+
+
+def test_lifting_readonly_invalidates_memoized_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Writable configs are converted on every call."""
+    cfg = cast(DictConfig, make_subconfig({"value": 1}))
+    assert to_config_data(cfg) == {"value": 1}
+
+    OmegaConf.set_readonly(cfg, False)
+    cfg.value = 2
+    calls = _count_conversions(monkeypatch)
+
+    assert to_config_data(cfg) == {"value": 2}
+    assert to_config_data(cfg, immutable=True) == {"value": 2}
+    assert len(calls) == 2
+
+
+def test_views_are_memoized_per_node(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Read-only views are memoized independently of their root."""
+    cfg = make_subconfig({"a": {"b": {"c": 1}}, "d": 2})
+    calls = _count_conversions(monkeypatch)
+
+    for _ in range(3):
+        assert to_config_data(make_view(cfg, "a.b")) == {"c": 1}
+        assert to_config_data(cfg)["d"] == 2
+
+    assert len(calls) == 2
+
+
+def test_memoized_data_is_dropped_with_config() -> None:
+    """Cache entries do not keep configs alive."""
+    cfg = make_subconfig({"value": 1})
+    to_config_data(cfg)
+    key = id(cfg)
+    assert key in helpers._DATA_CACHE._entries
+
+    del cfg
+    gc.collect()
+
+    assert key not in helpers._DATA_CACHE._entries
+
+
+def test_immutable_frozen_config() -> None:
+    """immutable=True also applies to FrozenConfig."""
+    data = to_config_data(FrozenConfig({"a": {"b": [1]}}), immutable=True)
+
+    assert isinstance(data["a"], MappingProxyType)
+    assert data["a"]["b"] == (1,)
@@ -0,0 +1,93 @@
+"""Import-time regression tests for mxm-config.
+
+These run `python -X importtime` in a subprocess and check which modules are
+pulled in, so heavy dependencies stay deferred until first use.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from mxm.config import SnapshotCache, load_config
+from mxm.types import RuntimeIdentity
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+HEAVY_MODULES = ("omegaconf", "yaml", "antlr4", "typer", "click", "pandas")
+
+IMPORT_BUDGET_US = 100_000
+"""Generous cumulative budget for `import mxm.config`, in microseconds."""
+
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Run `code` under `-X importtime` and map module name to cumulative µs."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _heavy(modules: dict[str, int]) -> list[str]:
+    return sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+def test_import_mxm_config_is_lightweight() -> None:
+    modules = _imported_modules(
+        "import mxm.config\nfrom mxm.config import MXMConfig, FrozenConfig"
+    )
+
+    assert _heavy(modules) == []
+    assert modules["mxm.config"] < IMPORT_BUDGET_US
+
+
+def test_frozen_snapshot_hit_does_not_import_omegaconf(tmp_path: Path) -> None:
+    app_root = tmp_path / "store" / "apps" / "mxm-moneymachine"
+    app_root.mkdir(parents=True)
+    (app_root / "default.yaml").write_text("value: default\n", encoding="utf-8")
+    identity = RuntimeIdentity(
+        app="mxm-moneymachine",
+        environment="dev",
+        machine="bridge",
+        substrate="local-process",
+        role="marketdata",
+    )
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    load_config(identity=identity, store_root=tmp_path / "store", snapshots=snapshots)
+
+    code = f"""
+from pathlib import Path
+from mxm.config import SnapshotCache, load_config
+from mxm.types import RuntimeIdentity
+
+cfg = load_config(
+    identity={identity!r},
+    store_root=Path({str(tmp_path / "store")!r}),
+    snapshots=SnapshotCache(Path({str(snapshots.directory)!r})),
+    backend="frozen",
+)
+assert cfg.value == "default"
+"""
+    modules = _imported_modules(code)
+
+    assert "omegaconf" not in modules
+    assert "yaml" not in modules
@@ -0,0 +1,203 @@
+"""Tests for on-access interpolation resolution (`resolution="lazy"`)."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationKeyError, InterpolationResolutionError
+
+from mxm.config.helpers import make_view, to_config_data
+from mxm.config.lazy import LazyConfig
+from mxm.config.loader import load_config, load_configs
+from mxm.config.report import LoadReport
+from mxm.config.snapshot import SnapshotCache
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path, default_yaml: str | None = None) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(
+        app_root / "default.yaml",
+        default_yaml
+        or (
+            "paths:\n"
+            "  root: /data\n"
+            "  cache: ${paths.root}/cache\n"
+            "services:\n"
+            "  db:\n"
+            "    url: postgres://${services.db.host}/x\n"
+            "    host: localhost\n"
+            "  hosts: ['${services.db.host}', backup]\n"
+            "alias: ${services.db}\n"
+        ),
+    )
+    write_file(app_root / "environment.yaml", "dev:\n  paths:\n    root: /dev\n")
+    return app_root
+
+
+def _lazy(tmp_path: Path) -> LazyConfig:
+    cfg = load_config(identity=make_identity(), store_root=tmp_path, resolution="lazy")
+    assert isinstance(cfg, LazyConfig)
+    return cfg
+
+
+def test_lazy_values_match_eager(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    eager = load_config(identity=make_identity(), store_root=tmp_path)
+    lazy = _lazy(tmp_path)
+
+    assert lazy.paths.cache == "/dev/cache"
+    assert lazy["services"]["db"]["url"] == "postgres://localhost/x"
+    assert lazy.services.hosts == ("localhost", "backup")
+    assert lazy.alias.host == "localhost"
+    assert to_config_data(lazy) == to_config_data(eager)
+
+
+def test_lazy_load_does_not_resolve_eagerly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _store(tmp_path)
+
+    def _fail(cfg: Any) -> None:
+        raise AssertionError("OmegaConf.resolve called")
+
+    monkeypatch.setattr(OmegaConf, "resolve", _fail)
+
+    assert _lazy(tmp_path).paths.root == "/dev"
+
+
+def test_errors_surface_on_access_with_eager_messages(tmp_path: Path) -> None:
+    _store(tmp_path, "ok: 1\nbroken: ${missing.key}\n")
+
+    with pytest.raises(InterpolationKeyError) as eager_error:
+        load_config(identity=make_identity(), store_root=tmp_path)
+    lazy = _lazy(tmp_path)
+
+    assert lazy.ok == 1
+    with pytest.raises(InterpolationKeyError) as lazy_error:
+        _ = lazy.broken
+    assert str(lazy_error.value).startswith(str(eager_error.value))
+    assert "full_key" in str(lazy_error.value)
+
+
+def test_cycles_are_detected(tmp_path: Path) -> None:
+    _store(tmp_path, "a: ${b}\nb: ${a}\nok: 1\n")
+
+    with pytest.raises(InterpolationResolutionError) as eager_error:
+        load_config(identity=make_identity(), store_root=tmp_path)
+    lazy = _lazy(tmp_path)
+
+    assert lazy.ok == 1
+    with pytest.raises(InterpolationResolutionError) as lazy_error:
+        _ = lazy.a
+    assert str(lazy_error.value).startswith(str(eager_error.value))
+    assert "full_key" in str(lazy_error.value)
+
+
+def test_values_are_memoized(tmp_path: Path) -> None:
+    _store(tmp_path, "counted: ${mxm_test_count:}\nnested:\n  x: 1\n")
+    calls: list[int] = []
+
+    def _count() -> int:
+        calls.append(1)
+        return len(calls)
+
+    OmegaConf.register_new_resolver("mxm_test_count", _count)
+    try:
+        lazy = _lazy(tmp_path)
+        assert calls == []
+
+        assert lazy.counted == 1
+        assert lazy["counted"] == 1
+        assert lazy.nested is lazy["nested"]
+        assert calls == [1]
+    finally:
+        OmegaConf.clear_resolver("mxm_test_count")
+
+
+def test_lazy_config_is_immutable_and_picklable(tmp_path: Path) -> None:
+    _store(tmp_path)
+    lazy = _lazy(tmp_path)
+
+    with pytest.raises(AttributeError, match="immutable"):
+        lazy.paths = {}  # type: ignore[misc]
+    with pytest.raises(AttributeError, match="no key"):
+        _ = lazy.missing
+
+    restored = pickle.loads(pickle.dumps(lazy))
+
+    assert isinstance(restored, LazyConfig)
+    assert restored.paths.cache == "/dev/cache"
+
+
+def test_make_view_on_lazy_config(tmp_path: Path) -> None:
+    _store(tmp_path)
+    lazy = _lazy(tmp_path)
+
+    view = make_view(lazy, "services.db")
+
+    assert isinstance(view, LazyConfig)
+    assert view.url == "postgres://localhost/x"
+    with pytest.raises(ValueError, match="read-only"):
+        make_view(lazy, "services", readonly=False)
+    with pytest.raises(TypeError, match="LazyConfig"):
+        make_view(lazy, "paths.root")
+
+
+def test_result_cache_separates_resolution_modes(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    eager = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+    lazy = load_config(
+        identity=make_identity(), store_root=tmp_path, cache=True, resolution="lazy"
+    )
+    again = load_config(
+        identity=make_identity(), store_root=tmp_path, cache=True, resolution="lazy"
+    )
+
+    assert not isinstance(eager, LazyConfig)
+    assert isinstance(lazy, LazyConfig)
+    assert again is lazy
+
+
+def test_load_configs_lazy(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    batch = load_configs([make_identity()], store_root=tmp_path, resolution="lazy")
+
+    assert isinstance(batch[make_identity()], LazyConfig)
+    assert batch[make_identity()].paths.cache == "/dev/cache"
+
+
+def test_report_does_not_force_resolution(tmp_path: Path) -> None:
+    _store(tmp_path, "ok: 1\nbroken: ${missing.key}\n")
+    report = LoadReport()
+
+    load_config(
+        identity=make_identity(), store_root=tmp_path, resolution="lazy", report=report
+    )
+
+    assert report.nodes == 5
+    assert "resolve" not in report.stages
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"resolution": "deferred"}, "Unknown resolution mode"),
+        ({"resolution": "lazy", "backend": "frozen"}, "backend='frozen'"),
+        ({"resolution": "lazy", "snapshots": SnapshotCache(Path("unused"))}, "snap"),
+    ],
+)
+def test_invalid_resolution_options(
+    tmp_path: Path, kwargs: dict[str, Any], match: str
+) -> None:
+    _store(tmp_path)
+
+    with pytest.raises(ValueError, match=match):
+        load_config(identity=make_identity(), store_root=tmp_path, **kwargs)
@@ -0,0 +1,135 @@
+"""Tests for `LoadReport` instrumentation of `load_config`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mxm.config.helpers import to_config_data
+from mxm.config.loader import clear_cache, load_config
+from mxm.config.report import LoadReport, count_nodes
+from mxm.config.snapshot import SnapshotCache
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\nshared: ${value}\n")
+    write_file(app_root / "environment.yaml", "dev:\n  value: environment\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  items: [1, 2, 3]\n")
+    return app_root
+
+
+def test_cold_load_records_stages_files_and_nodes(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+    report = LoadReport()
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path, report=report)
+
+    assert report.source == "merge"
+    for stage in ("stat", "read", "index", "parse", "select", "merge", "resolve"):
+        assert report.stages[stage] >= 0.0
+    assert "readonly" in report.stages
+    assert list(report.layers) == ["default.yaml", "environment.yaml", "role.yaml"]
+    assert report.bytes_read == sum(
+        (app_root / name).stat().st_size for name in report.layers
+    )
+    assert not any(layer.cached for layer in report.layers.values())
+    assert set(report.layers["environment.yaml"].stages) == {
+        "read",
+        "index",
+        "parse",
+        "select",
+    }
+    assert report.nodes == count_nodes(to_config_data(cfg)) == 7
+    assert report.total_seconds >= sum(report.stages.values())
+
+
+def test_warm_load_reports_cached_layers(tmp_path: Path) -> None:
+    _store(tmp_path)
+    load_config(identity=make_identity(), store_root=tmp_path)
+    report = LoadReport()
+
+    load_config(identity=make_identity(), store_root=tmp_path, report=report)
+
+    assert report.source == "merge"
+    assert all(layer.cached for layer in report.layers.values())
+    assert report.bytes_read == 0
+    assert "parse" not in report.stages
+    assert "read" not in report.stages
+
+
+def test_result_cache_hit_is_reported(tmp_path: Path) -> None:
+    _store(tmp_path)
+    load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+    report = LoadReport()
+
+    load_config(
+        identity=make_identity(), store_root=tmp_path, cache=True, report=report
+    )
+
+    assert report.source == "result-cache"
+    assert set(report.stages) == {"stat"}
+    assert report.nodes == 7
+
+
+def test_snapshot_hit_is_reported(tmp_path: Path) -> None:
+    _store(tmp_path / "store")
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    load_config(
+        identity=make_identity(), store_root=tmp_path / "store", snapshots=snapshots
+    )
+    clear_cache()
+    report = LoadReport()
+
+    load_config(
+        identity=make_identity(),
+        store_root=tmp_path / "store",
+        snapshots=snapshots,
+        report=report,
+    )
+
+    assert report.source == "snapshot"
+    assert {"stat", "snapshot", "convert"} <= set(report.stages)
+    assert "parse" not in report.stages
+
+
+def test_report_is_reset_between_loads(tmp_path: Path) -> None:
+    _store(tmp_path)
+    report = LoadReport()
+    load_config(identity=make_identity(), store_root=tmp_path, report=report)
+    bytes_read = report.bytes_read
+    clear_cache()
+
+    load_config(identity=make_identity(), store_root=tmp_path, report=report)
+
+    assert report.bytes_read == bytes_read
+
+
+def test_failed_load_keeps_partial_report(tmp_path: Path) -> None:
+    _store(tmp_path)
+    write_file(tmp_path / "apps" / "mxm-moneymachine" / "machine.yaml", "other: {}\n")
+    report = LoadReport()
+
+    with pytest.raises(KeyError):
+        load_config(identity=make_identity(), store_root=tmp_path, report=report)
+
+    assert report.source is None
+    assert report.total_seconds > 0.0
+    assert "machine.yaml" in report.layers
+
+
+def test_to_dict_and_format(tmp_path: Path) -> None:
+    _store(tmp_path)
+    report = LoadReport()
+    load_config(identity=make_identity(), store_root=tmp_path, report=report)
+
+    data = json.loads(json.dumps(report.to_dict()))
+    text = report.format()
+
+    assert data["source"] == "merge"
+    assert data["layers"]["default.yaml"]["bytes_read"] > 0
+    assert "resolve" in text
+    assert "default.yaml" in text
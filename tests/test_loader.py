@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 from omegaconf import DictConfig, OmegaConf
+from omegaconf.errors import InterpolationKeyError
 
 from mxm.config.loader import load_config
 from mxm.types import (
@@ -210,6 +211,25 @@ def test_load_config_missing_selector_in_existing_dimension_file_raises(
         load_config(identity=_identity(), store_root=tmp_path)
 
 
+def test_load_config_resolves_interpolated_blocks_against_their_file(
+    tmp_path: Path,
+) -> None:
+    app_root = _app_root(tmp_path)
+
+    _write(app_root / "default.yaml", "x: 0\ny: 0\n")
+    # A flow-style root is parsed in full rather than block by block.
+    _write(
+        app_root / "environment.yaml",
+        '{dev: "${prod}", qa: "${missing}", prod: {x: 1, y: "${x}"}}\n',
+    )
+
+    cfg = load_config(identity=_identity(), store_root=tmp_path)
+
+    assert OmegaConf.to_container(cfg) == {"x": 1, "y": 1}
+    with pytest.raises(InterpolationKeyError, match="missing"):
+        load_config(identity=_identity(environment="qa"), store_root=tmp_path)
+
+
 def test_load_config_absent_optional_dimension_files_are_skipped(
     tmp_path: Path,
 ) -> None:
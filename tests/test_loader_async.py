@@ -0,0 +1,172 @@
+"""Tests for the asyncio loaders `aload_config` and `aload_configs`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import OmegaConf
+
+from mxm.config import loader
+from mxm.config.frozen import FrozenConfig
+from mxm.config.loader import (
+    aload_config,
+    aload_configs,
+    clear_cache,
+    load_config,
+    load_configs,
+)
+from mxm.config.snapshot import SnapshotCache
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\nlayer: ${value}\n")
+    write_file(app_root / "environment.yaml", "dev:\n  value: environment\n")
+    write_file(app_root / "machine.yaml", "bridge:\n  machine: bridge\n")
+    write_file(app_root / "substrate.yaml", "local-process:\n  substrate: local\n")
+    write_file(
+        app_root / "role.yaml",
+        "marketdata:\n  value: marketdata\nexecution:\n  value: execution\n",
+    )
+    return app_root
+
+
+def _plain(cfg: Any) -> Any:
+    return OmegaConf.to_container(cfg, resolve=True)
+
+
+def test_aload_config_matches_load_config(tmp_path: Path) -> None:
+    _store(tmp_path)
+    overrides = {"extra": 1}
+
+    expected = load_config(
+        identity=make_identity(), store_root=tmp_path, overrides=overrides
+    )
+    clear_cache()
+    actual = asyncio.run(
+        aload_config(identity=make_identity(), store_root=tmp_path, overrides=overrides)
+    )
+
+    assert _plain(actual) == _plain(expected)
+    assert OmegaConf.is_readonly(actual)  # type: ignore[arg-type]
+
+
+def test_layer_files_are_parsed_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _store(tmp_path)
+    parse_threads: set[int] = set()
+    original = loader._parse_yaml_mapping  # pyright: ignore[reportPrivateUsage]
+
+    def _recording_parse(*args: Any, **kwargs: Any) -> Any:
+        parse_threads.add(threading.get_ident())
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "_parse_yaml_mapping", _recording_parse)
+
+    async def _run() -> int:
+        await aload_config(identity=make_identity(), store_root=tmp_path)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(_run())
+
+    assert parse_threads
+    assert loop_thread not in parse_threads
+
+
+def test_frozen_backend_and_result_cache(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    async def _run() -> tuple[Any, Any]:
+        first = await aload_config(
+            identity=make_identity(), store_root=tmp_path, backend="frozen", cache=True
+        )
+        second = await aload_config(
+            identity=make_identity(), store_root=tmp_path, backend="frozen", cache=True
+        )
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert isinstance(first, FrozenConfig)
+    assert first is second
+    assert first.layer == "marketdata"
+
+
+def test_snapshots_round_trip(tmp_path: Path) -> None:
+    _store(tmp_path / "store")
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+
+    first = asyncio.run(
+        aload_config(
+            identity=make_identity(), store_root=tmp_path / "store", snapshots=snapshots
+        )
+    )
+    clear_cache()
+    second = asyncio.run(
+        aload_config(
+            identity=make_identity(), store_root=tmp_path / "store", snapshots=snapshots
+        )
+    )
+
+    assert len(list((tmp_path / "snapshots").iterdir())) == 1
+    assert _plain(first) == _plain(second)
+
+
+@pytest.mark.parametrize(
+    ("setup", "error", "match"),
+    [
+        ("no-app", FileNotFoundError, "Application configuration root not found"),
+        ("no-default", FileNotFoundError, "default.yaml"),
+        ("bad-selector", KeyError, "Available selectors: bridge"),
+        ("bad-root", TypeError, "must contain a mapping"),
+    ],
+)
+def test_errors_match_load_config(
+    tmp_path: Path, setup: str, error: type[Exception], match: str
+) -> None:
+    if setup != "no-app":
+        app_root = _store(tmp_path)
+        if setup == "no-default":
+            (app_root / "default.yaml").unlink()
+            write_file(app_root / "role.yaml", "- not a mapping\n")
+        elif setup == "bad-root":
+            write_file(app_root / "role.yaml", "- not a mapping\n")
+    identity = (
+        make_identity(machine="other") if setup == "bad-selector" else make_identity()
+    )
+
+    with pytest.raises(error, match=match):
+        load_config(identity=identity, store_root=tmp_path)
+    clear_cache()
+    with pytest.raises(error, match=match):
+        asyncio.run(aload_config(identity=identity, store_root=tmp_path))
+
+
+def test_aload_configs_matches_load_configs(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identities = [
+        make_identity(),
+        make_identity(role="execution"),
+        make_identity(role="missing"),
+        make_identity(app="unknown-app"),
+        make_identity(),
+    ]
+
+    expected = load_configs(identities, store_root=tmp_path)
+    clear_cache()
+    actual = asyncio.run(aload_configs(identities, store_root=tmp_path))
+
+    assert list(actual) == list(expected)
+    assert {identity: _plain(cfg) for identity, cfg in actual.items()} == {
+        identity: _plain(cfg) for identity, cfg in expected.items()
+    }
+    assert list(actual.errors) == list(expected.errors)
+    for identity, exc in actual.errors.items():
+        assert type(exc) is type(expected.errors[identity])
+        assert str(exc) == str(expected.errors[identity])
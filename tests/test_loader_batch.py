@@ -0,0 +1,132 @@
+"""Tests for batch configuration loading with `load_configs`."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mxm.config import ConfigBatch, load_configs, loader
+from mxm.config.loader import cache_info, clear_cache, load_config
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\nlabel: ${value}\n")
+    write_file(
+        app_root / "environment.yaml",
+        "dev:\n  env: dev\nprod:\n  env: prod\n",
+    )
+    write_file(
+        app_root / "role.yaml",
+        "marketdata:\n  value: md\nexecution:\n  value: ex\n",
+    )
+
+
+def test_load_configs_matches_load_config(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identities = [
+        make_identity(environment=environment, role=role)
+        for environment in ("dev", "prod")
+        for role in ("marketdata", "execution")
+    ]
+
+    batch = load_configs(identities, store_root=tmp_path)
+
+    assert isinstance(batch, ConfigBatch)
+    assert list(batch) == identities
+    assert not batch.errors
+    for identity in identities:
+        single = load_config(identity=identity, store_root=tmp_path)
+        assert batch[identity].env == single.env
+        assert batch[identity].value == single.value
+        assert batch[identity].label == single.label
+
+
+def test_load_configs_parses_each_file_once(tmp_path: Path) -> None:
+    _store(tmp_path)
+    clear_cache()
+    identities = [make_identity(role=role) for role in ("marketdata", "execution")] * 3
+
+    batch = load_configs(identities, store_root=tmp_path)
+
+    assert len(batch) == 2
+    info = cache_info()
+    assert info.misses == 3
+    assert info.hits == 0
+
+
+def test_load_configs_collects_per_identity_errors(tmp_path: Path) -> None:
+    _store(tmp_path)
+    good = make_identity()
+    missing_role = make_identity(role="unknown")
+    missing_app = make_identity(app="mxm-unknown")
+
+    batch = load_configs([good, missing_role, missing_app], store_root=tmp_path)
+
+    assert list(batch) == [good]
+    assert isinstance(batch.errors[missing_role], KeyError)
+    assert isinstance(batch.errors[missing_app], FileNotFoundError)
+    with pytest.raises(KeyError):
+        _ = batch[missing_role]
+
+
+def test_load_configs_applies_overrides_to_every_identity(tmp_path: Path) -> None:
+    _store(tmp_path)
+    identities = [make_identity(role=role) for role in ("marketdata", "execution")]
+
+    batch = load_configs(
+        identities,
+        store_root=tmp_path,
+        overrides={"value": "override"},
+    )
+
+    assert [batch[identity].label for identity in identities] == [
+        "override",
+        "override",
+    ]
+
+
+def test_identities_sharing_leading_selectors_reuse_prefix_merges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\n")
+    write_file(app_root / "environment.yaml", "dev:\n  env: dev\n")
+    write_file(app_root / "machine.yaml", "bridge:\n  machine: bridge\n")
+    write_file(app_root / "substrate.yaml", "local-process:\n  substrate: local\n")
+    roles = ("marketdata", "execution", "risk")
+    write_file(
+        app_root / "role.yaml",
+        "".join(f"{role}:\n  value: {role}\n" for role in roles),
+    )
+    clear_cache()
+
+    merged_layers: list[int] = []
+    original_merge = loader.merge_data
+
+    def counting_merge(layers: Sequence[Any]) -> Any:
+        merged_layers.append(len(layers) - 1)
+        return original_merge(layers)
+
+    monkeypatch.setattr(loader, "merge_data", counting_merge)
+
+    batch = load_configs(
+        [make_identity(role=role) for role in roles],
+        store_root=tmp_path,
+    )
+
+    # Three prefix merges (environment, machine, substrate) shared by all roles,
+    # then one single-layer merge per role.
+    assert sum(merged_layers) == 3 + len(roles)
+    for role in roles:
+        cfg = batch[make_identity(role=role)]
+        assert (cfg.env, cfg.machine, cfg.substrate, cfg.value) == (
+            "dev",
+            "bridge",
+            "local",
+            role,
+        )
@@ -0,0 +1,187 @@
+"""Tests for the loader's in-process layer and resolved config caches."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import cast
+
+from omegaconf import DictConfig, OmegaConf
+
+from mxm.config.loader import (
+    cache_info,
+    clear_cache,
+    load_config,
+    result_cache_info,
+)
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\nshared: ${value}\n")
+    write_file(app_root / "environment.yaml", "dev:\n  value: environment\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  value: role\n")
+    return app_root
+
+
+def test_repeated_loads_parse_each_file_once(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    first = load_config(identity=make_identity(), store_root=tmp_path)
+    info = cache_info()
+    assert info.misses == 3
+    assert info.hits == 0
+    assert info.currsize == 3
+
+    second = load_config(identity=make_identity(), store_root=tmp_path)
+    info = cache_info()
+    assert info.misses == 3
+    assert info.hits == 3
+    assert info.currsize == 3
+
+    assert first.value == second.value == "role"
+    assert first.shared == second.shared == "role"
+
+
+def test_cached_layers_are_not_mutated_by_merge(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    load_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        overrides={"value": "override"},
+    )
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.value == "role"
+    assert cfg.shared == "role"
+
+
+def test_changed_file_is_reparsed(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+    load_config(identity=make_identity(), store_root=tmp_path)
+
+    role_path = app_root / "role.yaml"
+    write_file(role_path, "marketdata:\n  value: updated-role\n")
+    stat = role_path.stat()
+    os.utime(role_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.value == "updated-role"
+    assert cache_info().misses == 4
+
+
+def test_removed_optional_file_is_skipped(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+    load_config(identity=make_identity(), store_root=tmp_path)
+
+    (app_root / "role.yaml").unlink()
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.value == "environment"
+
+
+def test_clear_cache_resets_entries_and_counters(tmp_path: Path) -> None:
+    _store(tmp_path)
+    load_config(identity=make_identity(), store_root=tmp_path)
+
+    clear_cache()
+
+    info = cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_result_cache_returns_shared_readonly_object(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    first = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+    second = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+
+    assert first is second
+    assert OmegaConf.is_readonly(cast(DictConfig, first))
+    info = result_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_result_cache_is_opt_in(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    first = load_config(identity=make_identity(), store_root=tmp_path)
+    second = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert first is not second
+    assert result_cache_info().currsize == 0
+
+
+def test_result_cache_keys_on_overrides(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    plain = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+    overridden = load_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        overrides={"value": "override"},
+        cache=True,
+    )
+    again = load_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        overrides={"value": "override"},
+        cache=True,
+    )
+
+    assert plain.value == "role"
+    assert overridden.value == "override"
+    assert again is overridden
+
+
+def test_result_cache_keys_on_override_key_types(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    by_int = load_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        overrides={"ports": {1: "web"}},
+        cache=True,
+    )
+    by_str = load_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        overrides={"ports": {"1": "web"}},
+        cache=True,
+    )
+
+    assert by_str is not by_int
+    assert list(by_int.ports) == [1]
+    assert list(by_str.ports) == ["1"]
+
+
+def test_result_cache_keys_on_identity(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+    write_file(
+        app_root / "role.yaml", "marketdata:\n  value: md\nexecution:\n  value: ex\n"
+    )
+
+    marketdata = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+    execution = load_config(
+        identity=replace(make_identity(), role="execution"),
+        store_root=tmp_path,
+        cache=True,
+    )
+
+    assert marketdata.value == "md"
+    assert execution.value == "ex"
+
+
+def test_result_cache_invalidated_when_layer_changes(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+    first = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+
+    write_file(app_root / "machine.yaml", "bridge:\n  extra: 1\n")
+    second = load_config(identity=make_identity(), store_root=tmp_path, cache=True)
+
+    assert second is not first
+    assert second.extra == 1
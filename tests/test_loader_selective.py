@@ -0,0 +1,180 @@
+"""Tests for selective parsing of dimension files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+from yaml.constructor import ConstructorError
+
+from mxm.config import loader
+from mxm.config._selective import index_top_level
+from mxm.config.loader import load_config
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path, environment_yaml: str) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\n")
+    write_file(app_root / "environment.yaml", environment_yaml)
+    return app_root
+
+
+def _full_parse(tmp_path: Path, environment: str = "dev") -> dict[str, Any]:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    default = OmegaConf.load(app_root / "default.yaml")
+    layer = cast(DictConfig, OmegaConf.load(app_root / "environment.yaml"))
+    merged = OmegaConf.merge(default, layer[environment])
+    return cast(dict[str, Any], OmegaConf.to_container(merged, resolve=True))
+
+
+def test_only_selected_block_is_parsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _store(
+        tmp_path,
+        "dev:\n  value: dev\nprod:\n  value: prod\n",
+    )
+    sources: list[str] = []
+    original = loader._parse_yaml_mapping
+
+    def _recording_parse(path: Path, source: str) -> Any:
+        sources.append(source)
+        return original(path, source)
+
+    monkeypatch.setattr(loader, "_parse_yaml_mapping", _recording_parse)
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.value == "dev"
+    assert len(sources) == 2
+    assert "prod" not in sources[1]
+
+
+def test_missing_selector_lists_available_selectors(tmp_path: Path) -> None:
+    _store(tmp_path, "dev:\n  value: dev\nprod:\n  value: prod\n")
+
+    with pytest.raises(KeyError, match="Available selectors: dev, prod"):
+        load_config(identity=make_identity(environment="staging"), store_root=tmp_path)
+
+
+@pytest.mark.parametrize(
+    "environment_yaml",
+    [
+        # Comments, blank lines, quoted keys and block scalars.
+        (
+            "# leading comment\n"
+            "dev:\n"
+            "  value: dev  # trailing\n"
+            "  script: |\n"
+            "    line one\n"
+            "\n"
+            "    line two\n"
+            "\n"
+            "# between blocks\n"
+            "'prod':\n"
+            "  value: prod\n"
+        ),
+        # Anchors and merge keys fall back to a full parse.
+        (
+            "base: &base\n"
+            "  value: base\n"
+            "  extra: 1\n"
+            "dev:\n"
+            "  <<: *base\n"
+            "  value: dev\n"
+        ),
+        # Flow-style root falls back to a full parse.
+        "{dev: {value: dev}, prod: {value: prod}}\n",
+        # Explicit document markers.
+        "---\ndev:\n  value: dev\n...\n",
+        # A block that interpolates another block is resolved against the file.
+        "dev: ${prod}\nprod:\n  value: prod\n  label: ${value}\n",
+    ],
+)
+def test_selective_parse_matches_full_parse(
+    tmp_path: Path, environment_yaml: str
+) -> None:
+    _store(tmp_path, environment_yaml)
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert OmegaConf.to_container(cfg, resolve=True) == _full_parse(tmp_path)
+
+
+def test_scalars_parse_like_omegaconf(tmp_path: Path) -> None:
+    scalars = ["1e3", "1_000.5", ".5", "-.inf", "2001-12-14", "yes", "0x1F", "~"]
+    _store(
+        tmp_path,
+        "dev:\n" + "".join(f"  k{i}: {text}\n" for i, text in enumerate(scalars)),
+    )
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    # repr() also compares types, e.g. float 1000.0 against str "1e3".
+    assert repr(OmegaConf.to_container(cfg)) == repr(_full_parse(tmp_path))
+
+
+def test_duplicate_keys_raise_like_omegaconf(tmp_path: Path) -> None:
+    _store(tmp_path, "dev:\n  value: a\n  value: b\n")
+
+    with pytest.raises(ConstructorError, match="found duplicate key value"):
+        load_config(identity=make_identity(), store_root=tmp_path)
+    with pytest.raises(ConstructorError):
+        _full_parse(tmp_path)
+
+
+def test_errors_in_unselected_blocks_are_not_reported(tmp_path: Path) -> None:
+    _store(
+        tmp_path,
+        "dev:\n  value: dev\nprod:\n  value: a\n  value: b\nqa:\n  value: !unknown x\n",
+    )
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.value == "dev"
+    with pytest.raises(ConstructorError, match="found duplicate key value"):
+        load_config(identity=make_identity(environment="prod"), store_root=tmp_path)
+    with pytest.raises(ConstructorError, match="!unknown"):
+        load_config(identity=make_identity(environment="qa"), store_root=tmp_path)
+
+
+def test_non_mapping_block_raises_type_error(tmp_path: Path) -> None:
+    _store(tmp_path, "dev: 3\n")
+
+    with pytest.raises(TypeError, match="must be a mapping"):
+        load_config(identity=make_identity(), store_root=tmp_path)
+
+
+def test_non_mapping_root_raises_type_error(tmp_path: Path) -> None:
+    _store(tmp_path, "- dev\n- prod\n")
+
+    with pytest.raises(TypeError, match="must contain a mapping"):
+        load_config(identity=make_identity(), store_root=tmp_path)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1:\n  a: 1\n",
+        "true:\n  a: 1\n",
+        "a: &x 1\nb: *x\n",
+        "a: 1\n---\nb: 2\n",
+        "a: 1\r\nb: 2\r\n",
+        "a: 1\na: 2\n",
+        "a: [1,\n",
+    ],
+)
+def test_index_declines_unsplittable_documents(text: str) -> None:
+    assert index_top_level(text) is None
+
+
+def test_index_records_key_spans() -> None:
+    index = index_top_level("a:\n  x: 1\n\nb: 2\n")
+
+    assert index is not None
+    assert index.keys == ("a", "b")
+    assert index.block_source("a") == "a:\n  x: 1\n\n"
+    assert index.block_source("b") == "b: 2\n\n"
@@ -0,0 +1,148 @@
+"""Equivalence tests of the plain-data merge engine against `OmegaConf.merge`."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import OmegaConf
+from omegaconf.errors import ConfigTypeError
+
+from mxm.config._merge import merge_data
+from mxm.config.helpers import to_config_data
+from mxm.config.loader import load_config
+from tests.support import make_identity, write_file
+
+_KEYS = ("a", "b", "c", "d", "e")
+_SCALARS: tuple[Any, ...] = (0, 1, -2.5, True, False, "x", "", None, "???")
+
+
+def _random_value(rng: random.Random, depth: int, *, interpolations: bool) -> Any:
+    roll = rng.random()
+    if depth > 0 and roll < 0.35:
+        return _random_mapping(rng, depth - 1, interpolations=interpolations)
+    if roll < 0.5:
+        return [
+            _random_value(rng, depth - 1, interpolations=interpolations)
+            for _ in range(rng.randint(0, 3))
+        ]
+    if interpolations and roll < 0.6:
+        return rng.choice(("${a}", "${b.c}", "pre-${c}"))
+    return rng.choice(_SCALARS)
+
+
+def _random_mapping(
+    rng: random.Random, depth: int, *, interpolations: bool
+) -> dict[str, Any]:
+    keys = rng.sample(_KEYS, rng.randint(0, len(_KEYS)))
+    return {
+        key: _random_value(rng, depth, interpolations=interpolations) for key in keys
+    }
+
+
+def _omegaconf_merge(layers: list[dict[str, Any]]) -> Any:
+    merged = OmegaConf.merge(*(OmegaConf.create(layer) for layer in layers))
+    return OmegaConf.to_container(merged, resolve=False)
+
+
+def _outcome(func: Any, layers: list[dict[str, Any]]) -> tuple[str, str]:
+    """Return `("ok", repr(result))` or `("error", type and message)`."""
+    try:
+        return "ok", repr(func(layers))
+    except Exception as exc:
+        return "error", f"{type(exc).__name__}: {exc}"
+
+
+@pytest.mark.parametrize("interpolations", [False, True])
+@pytest.mark.parametrize("seed", range(150))
+def test_merge_matches_omegaconf(seed: int, interpolations: bool) -> None:
+    rng = random.Random(seed)
+    layers = [
+        _random_mapping(rng, depth=3, interpolations=interpolations)
+        for _ in range(rng.randint(1, 4))
+    ]
+
+    # repr() also compares key order.
+    assert _outcome(merge_data, layers) == _outcome(_omegaconf_merge, layers)
+
+
+@pytest.mark.parametrize(
+    ("lower", "upper", "expected"),
+    [
+        ({"a": {"x": 1}}, {"a": {"y": 2}}, {"a": {"x": 1, "y": 2}}),
+        ({"a": [1, 2]}, {"a": [3]}, {"a": [3]}),
+        ({"a": {"x": 1}}, {"a": None}, {"a": None}),
+        ({"a": None}, {"a": {"x": 1}}, {"a": {"x": 1}}),
+        ({"a": {"x": 1}}, {"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": "???"}, {"a": 1}),
+        ({"a": {"x": 1}}, {"a": {"y": "???"}}, {"a": {"x": 1, "y": "???"}}),
+        ({"a": "${b}", "b": {"x": 1}}, {"a": {"y": 2}}, None),
+    ],
+)
+def test_merge_semantics(
+    lower: dict[str, Any], upper: dict[str, Any], expected: dict[str, Any] | None
+) -> None:
+    merged = merge_data([lower, upper])
+
+    assert merged == (expected or _omegaconf_merge([lower, upper]))
+
+
+@pytest.mark.parametrize("target", [{"x": 1}, [1], 1, "???"])
+@pytest.mark.parametrize("upper", [{"y": 2}, [2], "???", 3, None])
+def test_merge_over_interpolation_matches_omegaconf(target: Any, upper: Any) -> None:
+    layers = [{"a": "${b}", "b": target}, {"a": upper}]
+
+    assert _outcome(merge_data, layers) == _outcome(_omegaconf_merge, layers)
+
+
+def test_merge_does_not_mutate_inputs() -> None:
+    lower: dict[str, Any] = {"a": {"x": 1, "y": [1]}, "b": 1}
+    upper: dict[str, Any] = {"a": {"x": 2}, "c": {"z": 3}}
+
+    merged = merge_data([lower, upper])
+
+    assert lower == {"a": {"x": 1, "y": [1]}, "b": 1}
+    assert upper == {"a": {"x": 2}, "c": {"z": 3}}
+    assert merged == {"a": {"x": 2, "y": [1]}, "b": 1, "c": {"z": 3}}
+
+
+def test_type_mismatch_raises_omegaconf_error() -> None:
+    with pytest.raises(
+        ConfigTypeError, match="Cannot merge DictConfig with ListConfig"
+    ):
+        merge_data([{"a": {"x": 1}}, {"a": [1]}])
+
+
+def test_loader_does_not_call_omegaconf_merge(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "a:\n  x: 1\n  y: ${a.x}\nb: [1, 2]\n")
+    write_file(app_root / "environment.yaml", "dev:\n  a:\n    x: 2\n  b: [3]\n")
+
+    def _fail(*configs: Any) -> None:
+        raise AssertionError("OmegaConf.merge called")
+
+    monkeypatch.setattr(OmegaConf, "merge", _fail)
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path, overrides={"c": 1})
+
+    assert to_config_data(cfg) == {
+        "a": {"x": 2, "y": 2},
+        "b": [3],
+        "c": 1,
+    }
+
+
+def test_loader_delegates_merge_into_interpolation(tmp_path: Path) -> None:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "base:\n  x: 1\nalias: ${base}\n")
+    write_file(app_root / "environment.yaml", "dev:\n  alias:\n    y: 2\n")
+
+    cfg = load_config(identity=make_identity(), store_root=tmp_path)
+
+    assert cfg.alias.x == 1
+    assert cfg.alias.y == 2
+    assert "y" not in cfg.base
@@ -0,0 +1,118 @@
+"""Tests for per-leaf provenance recorded by `load_config`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mxm.config import Provenance, SnapshotCache, load_config
+from tests.support import make_identity, write_file
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(
+        app_root / "default.yaml",
+        "a:\n  x: 1\n  y: 1\n  url: ${a.x}\nb: [1]\nc: 1\nd:\n  old: 1\n"
+        "required: ???\nempty: {}\n",
+    )
+    write_file(app_root / "environment.yaml", "dev:\n  a:\n    x: 2\n  d: null\n")
+    write_file(app_root / "machine.yaml", "bridge:\n  a:\n    z: 3\n  d:\n    new: 3\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  a:\n    y: ???\n  b: [5]\n")
+    return tmp_path
+
+
+def test_records_the_layer_of_every_leaf(tmp_path: Path) -> None:
+    provenance = Provenance()
+
+    cfg = load_config(
+        identity=make_identity(),
+        store_root=_store(tmp_path),
+        overrides={"c": 6},
+        provenance=provenance,
+    )
+
+    assert provenance.to_dict() == {
+        "a.x": "environment",
+        "a.y": "default",
+        "a.url": "default",
+        "a.z": "machine",
+        "b": "role",
+        "c": "overrides",
+        "d.new": "machine",
+        "required": "default",
+        "empty": "default",
+    }
+    assert cfg.a.url == 2
+    assert provenance["a.z"] == "machine"
+    assert provenance.layer_index("c") == 5
+    with pytest.raises(KeyError):
+        provenance["d.old"]
+
+
+def test_record_is_compact_and_summarised(tmp_path: Path) -> None:
+    provenance = Provenance()
+    load_config(
+        identity=make_identity(), store_root=_store(tmp_path), provenance=provenance
+    )
+
+    assert len(provenance) == 9
+    assert provenance.counts() == {
+        "default": 5,
+        "environment": 1,
+        "machine": 2,
+        "role": 1,
+    }
+    assert provenance.nbytes > 0
+    assert provenance.to_dict("a") == {
+        "a.x": "environment",
+        "a.y": "default",
+        "a.url": "default",
+        "a.z": "machine",
+    }
+    assert provenance.format("d") == "d.new  machine"
+
+
+def test_provenance_loads_bypass_caches(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    load_config(
+        identity=make_identity(), store_root=store, cache=True, snapshots=snapshots
+    )
+    provenance = Provenance()
+
+    load_config(
+        identity=make_identity(),
+        store_root=store,
+        cache=True,
+        snapshots=snapshots,
+        backend="frozen",
+        provenance=provenance,
+    )
+
+    assert provenance["a.x"] == "environment"
+
+
+def test_provenance_is_cleared_and_validated(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    provenance = Provenance()
+    load_config(identity=make_identity(), store_root=store, provenance=provenance)
+    write_file(store / "apps" / "mxm-moneymachine" / "machine.yaml", "bridge: {}\n")
+
+    load_config(
+        identity=make_identity(),
+        store_root=store,
+        resolution="lazy",
+        provenance=provenance,
+    )
+
+    assert "a.z" not in provenance
+    with pytest.raises(ValueError, match="lazy"):
+        load_config(
+            identity=make_identity(),
+            store_root=store,
+            resolution="lazy",
+            snapshots=SnapshotCache(tmp_path / "snapshots"),
+            provenance=provenance,
+        )
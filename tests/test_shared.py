@@ -0,0 +1,308 @@
+"""Tests for configs shared between processes through shared memory."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+import uuid
+from collections.abc import Callable, Iterator
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from omegaconf import OmegaConf
+
+from mxm.config import (
+    FrozenConfig,
+    MXMConfig,
+    SharedConfig,
+    attach_config,
+    load_config,
+    load_shared_config,
+    make_view,
+    select,
+    share_config,
+    shared as shared_module,
+    to_config_data,
+)
+from mxm.config.shared import segment_name, unlink_shared_config
+from tests.support import make_identity, write_file
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+DATA: dict[str, Any] = {
+    "name": "mxm",
+    "count": 3,
+    "big": 2**70,
+    "ratio": -0.5,
+    "flags": [True, False, None],
+    "services": {
+        "db": {"host": "localhost", "port": 5432},
+        "hosts": ["a", {"name": "b"}],
+        "empty": {},
+    },
+    "unicode": "grüße",
+}
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "a:\n  x: 1\n  y: ${a.x}\nb: [1, 2]\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  a:\n    x: 2\n")
+    return tmp_path
+
+
+def _name() -> str:
+    return f"mxmtest_{uuid.uuid4().hex[:16]}"
+
+
+@pytest.fixture(autouse=True)
+def unlink_owned_segments() -> Iterator[None]:
+    yield
+    for name in list(shared_module._OWNED):  # pyright: ignore[reportPrivateUsage]
+        unlink_shared_config(name)
+
+
+def _create_unpublished(name: str, size: int) -> None:
+    if size:
+        SharedMemory(name=name, create=True, size=size, track=False).close()
+        return
+    import _posixshmem
+
+    flags = os.O_CREAT | os.O_EXCL | os.O_RDWR
+    shm_open = cast(
+        Callable[..., int],
+        _posixshmem.shm_open,  # pyright: ignore[reportUnknownMemberType]
+    )
+    os.close(shm_open(f"/{name}", flags, mode=0o600))
+
+
+def test_round_trip() -> None:
+    cfg = share_config(FrozenConfig(DATA))
+
+    assert isinstance(cfg, SharedConfig)
+    assert cfg.to_dict() == DATA
+    assert cfg.services.db.port == 5432
+    assert cfg["services"]["hosts"][1].name == "b"
+    assert cfg.flags == (True, False, None)
+    assert type(cfg.ratio) is float
+    assert cfg.big == 2**70
+    assert len(cfg) == len(DATA)
+    assert list(cfg) == list(DATA)
+    assert "unicode" in cfg
+    assert "missing" not in cfg
+    assert cfg == FrozenConfig(DATA)
+
+
+def test_values_are_memoized() -> None:
+    cfg = share_config(FrozenConfig(DATA))
+
+    assert cfg.services is cfg.services
+    assert cfg.services.hosts is cfg["services"]["hosts"]
+
+
+def test_missing_keys_and_immutability() -> None:
+    cfg = share_config(FrozenConfig(DATA))
+
+    with pytest.raises(KeyError):
+        cfg["missing"]
+    with pytest.raises(AttributeError, match="missing"):
+        _ = cfg.missing
+    with pytest.raises(AttributeError, match="immutable"):
+        cfg.name = "other"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_equal_scalars_are_stored_once() -> None:
+    repeated = FrozenConfig({f"k{i}": "a long repeated value" for i in range(100)})
+    distinct = FrozenConfig({f"k{i}": f"a long distinct value {i}" for i in range(100)})
+
+    encode = shared_module._encode  # pyright: ignore[reportPrivateUsage]
+
+    assert len(encode(repeated)) < len(encode(distinct)) / 2
+
+
+def test_rejects_unsupported_values() -> None:
+    with pytest.raises(TypeError, match="bytes"):
+        share_config(FrozenConfig({"a": b"raw"}))
+
+
+def test_attach_in_another_process() -> None:
+    cfg = share_config(FrozenConfig(DATA), name=_name())
+    code = (
+        "import sys\n"
+        "from mxm.config import attach_config\n"
+        "cfg = attach_config(sys.argv[1])\n"
+        "print(cfg.services.db.host, cfg.services.hosts[1].name, cfg.big)\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code, cast(str, segment_name(cfg))],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_ROOT)},
+        text=True,
+    )
+
+    assert result.stdout.split() == ["localhost", "b", str(2**70)]
+    # The attaching process must not unlink the segment on exit.
+    assert attach_config(cast(str, segment_name(cfg))).to_dict() == DATA
+
+
+def test_attach_times_out_while_not_published() -> None:
+    shm = SharedMemory(name=_name(), create=True, size=64)
+    try:
+        with pytest.raises(TimeoutError):
+            attach_config(shm.name, timeout=0.01)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_attach_times_out_while_not_sized() -> None:
+    name = _name()
+    _create_unpublished(name, 0)
+    try:
+        with pytest.raises(TimeoutError):
+            attach_config(name, timeout=0.01)
+    finally:
+        unlink_shared_config(name)
+    with pytest.raises(FileNotFoundError):
+        attach_config(name, timeout=0.01)
+
+
+def test_attach_rejects_foreign_segments() -> None:
+    shm = SharedMemory(name=_name(), create=True, size=64)
+    try:
+        cast(memoryview, shm.buf)[:8] = b"NOTMXMCF"
+        with pytest.raises(ValueError, match="not an mxm-config snapshot"):
+            attach_config(shm.name, timeout=0.01)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_load_shared_config_publishes_then_attaches(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    first = load_shared_config(identity=make_identity(), store_root=store)
+    second = load_shared_config(identity=make_identity(), store_root=store)
+
+    name = segment_name(first)
+    assert name is not None
+    assert name.startswith(shared_module.SEGMENT_PREFIX)
+    assert segment_name(second) == segment_name(first)
+    assert second.to_dict() == to_config_data(
+        load_config(identity=make_identity(), store_root=store)
+    )
+    assert second.to_dict() == {"a": {"x": 2, "y": 2}, "b": [1, 2]}
+
+
+def test_load_shared_config_keys_on_contents_and_overrides(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    first = load_shared_config(identity=make_identity(), store_root=store)
+
+    overridden = load_shared_config(
+        identity=make_identity(), store_root=store, overrides={"b": [3]}
+    )
+    write_file(store / "apps" / "mxm-moneymachine" / "role.yaml", "marketdata: {}\n")
+    edited = load_shared_config(identity=make_identity(), store_root=store)
+
+    names = {segment_name(cfg) for cfg in (first, overridden, edited)}
+    assert len(names) == 3
+    assert overridden.b == (3,)
+    assert edited.a.x == 1
+
+
+@pytest.mark.parametrize("size", [0, 64])
+def test_load_shared_config_replaces_stalled_segments(
+    tmp_path: Path, size: int
+) -> None:
+    store = _store(tmp_path)
+    published = load_shared_config(identity=make_identity(), store_root=store)
+    expected = published.to_dict()
+    name = cast(str, segment_name(published))
+    unlink_shared_config(name)
+    # Simulate a publisher that crashed before sizing or finishing the segment.
+    _create_unpublished(name, size)
+
+    cfg = load_shared_config(identity=make_identity(), store_root=store, timeout=0.01)
+
+    assert segment_name(cfg) == name
+    assert cfg.to_dict() == expected
+    assert attach_config(name).to_dict() == expected
+
+
+def test_load_shared_config_falls_back_when_publisher_stalls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    published = load_shared_config(identity=make_identity(), store_root=store)
+    name = cast(str, segment_name(published))
+    unlink_shared_config(name)
+    stalled = SharedMemory(name=name, create=True, size=64)
+
+    # The stalled segment cannot be replaced, so both attempts time out.
+    def keep(name: str) -> None:
+        pass
+
+    monkeypatch.setattr(shared_module, "unlink_shared_config", keep)
+    try:
+        cfg = load_shared_config(
+            identity=make_identity(), store_root=store, timeout=0.01
+        )
+    finally:
+        stalled.close()
+        stalled.unlink()
+
+    assert segment_name(cfg) is None
+    assert cfg.to_dict() == published.to_dict()
+
+
+def test_load_shared_config_does_not_share_environment_dependent_configs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    write_file(
+        store / "apps" / "mxm-moneymachine" / "role.yaml",
+        "marketdata:\n  host: ${oc.env:DB_HOST}\n",
+    )
+
+    monkeypatch.setenv("DB_HOST", "alpha")
+    alpha = load_shared_config(identity=make_identity(), store_root=store)
+    monkeypatch.setenv("DB_HOST", "beta")
+    beta = load_shared_config(identity=make_identity(), store_root=store)
+
+    assert (alpha.host, beta.host) == ("alpha", "beta")
+    assert segment_name(alpha) is None and segment_name(beta) is None
+
+
+def test_helpers_accept_shared_configs() -> None:
+    cfg = cast(MXMConfig, share_config(FrozenConfig(DATA)))
+
+    view = make_view(cfg, "services.db")
+    assert isinstance(view, SharedConfig)
+    assert view.port == 5432
+    assert select(cfg, "services.hosts.1.name") == "b"
+    assert select(cfg, "services.nope", default=None) is None
+    assert to_config_data(cfg) == DATA
+    assert to_config_data(cfg, immutable=True)["services"]["db"]["port"] == 5432
+    with pytest.raises(ValueError, match="read-only"):
+        make_view(cfg, "services", readonly=False)
+
+
+def test_share_config_resolves_omegaconf_configs() -> None:
+    cfg = share_config(cast(MXMConfig, OmegaConf.create({"a": 1, "b": "${a}"})))
+
+    assert cfg.b == 1
+
+
+def test_pickles_as_frozen_config() -> None:
+    cfg = share_config(FrozenConfig(DATA))
+
+    restored = pickle.loads(pickle.dumps(cfg))
+
+    assert isinstance(restored, FrozenConfig)
+    assert restored.to_dict() == DATA
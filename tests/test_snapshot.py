@@ -0,0 +1,155 @@
+"""Tests for the persistent snapshot cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from mxm.config import SnapshotCache, load_config
+from mxm.config.loader import clear_cache
+from mxm.config.snapshot import default_snapshot_dir
+from mxm.types import JSONMap
+from tests.support import make_identity, write_file
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "store" / "apps" / "mxm-moneymachine"
+    write_file(
+        app_root / "default.yaml",
+        "base: /srv\npaths:\n  data: ${base}/data\nvalue: default\n",
+    )
+    write_file(
+        app_root / "role.yaml",
+        "marketdata:\n  value: md\nexecution:\n  value: ex\n",
+    )
+    return tmp_path / "store"
+
+
+def _forbid_yaml_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("YAML should not be parsed on a snapshot hit")
+
+    monkeypatch.setattr(OmegaConf, "load", fail)
+
+
+def test_snapshot_hit_skips_yaml_parsing(
+    store: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    first = load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+    assert len(list(snapshots.directory.glob("*.snap"))) == 1
+
+    clear_cache()
+    _forbid_yaml_parsing(monkeypatch)
+    second = load_config(
+        identity=make_identity(), store_root=store, snapshots=snapshots
+    )
+
+    assert second.paths.data == first.paths.data == "/srv/data"
+    assert second.value == "md"
+    assert OmegaConf.is_readonly(cast(DictConfig, second))
+
+
+def test_snapshot_invalidated_by_layer_content(store: Path, tmp_path: Path) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+
+    write_file(
+        store / "apps" / "mxm-moneymachine" / "role.yaml",
+        "marketdata:\n  value: changed\n",
+    )
+    cfg = load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+
+    assert cfg.value == "changed"
+
+
+def test_snapshot_keys_on_identity_and_overrides(store: Path, tmp_path: Path) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+
+    marketdata = load_config(
+        identity=make_identity(), store_root=store, snapshots=snapshots
+    )
+    execution = load_config(
+        identity=make_identity(role="execution"), store_root=store, snapshots=snapshots
+    )
+    overridden = load_config(
+        identity=make_identity(),
+        store_root=store,
+        overrides={"value": "override"},
+        snapshots=snapshots,
+    )
+
+    assert (marketdata.value, execution.value, overridden.value) == (
+        "md",
+        "ex",
+        "override",
+    )
+    assert len(list(snapshots.directory.glob("*.snap"))) == 3
+
+
+def test_resolver_interpolations_are_not_snapshotted(
+    store: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_file(
+        store / "apps" / "mxm-moneymachine" / "role.yaml",
+        "marketdata:\n  host: ${oc.env:DB_HOST}\nexecution:\n  host: db\n",
+    )
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+
+    monkeypatch.setenv("DB_HOST", "alpha")
+    alpha = load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+    monkeypatch.setenv("DB_HOST", "beta")
+    beta = load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+    overridden = load_config(
+        identity=make_identity(role="execution"),
+        store_root=store,
+        overrides={"host": "${oc.env:DB_HOST}"},
+        snapshots=snapshots,
+    )
+
+    assert (alpha.host, beta.host, overridden.host) == ("alpha", "beta", "beta")
+    assert not list(snapshots.directory.glob("*.snap"))
+
+
+def test_corrupt_snapshot_is_a_miss(store: Path, tmp_path: Path) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+    load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+    for path in snapshots.directory.glob("*.snap"):
+        path.write_bytes(b"MXMC\x01garbage")
+
+    cfg = load_config(identity=make_identity(), store_root=store, snapshots=snapshots)
+
+    assert cfg.value == "md"
+
+
+def test_prune_keeps_directory_within_max_bytes(tmp_path: Path) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots", max_bytes=600)
+    payload: JSONMap = {"blob": "x" * 200}
+
+    for index in range(5):
+        assert snapshots.put(f"key{index}", payload)
+
+    files = list(snapshots.directory.glob("*.snap"))
+    assert sum(path.stat().st_size for path in files) <= 600
+    assert snapshots.get("key4") == payload
+    assert snapshots.get("key0") is None
+
+
+def test_data_with_interpolation_markers_is_not_stored(tmp_path: Path) -> None:
+    snapshots = SnapshotCache(tmp_path / "snapshots")
+
+    assert not snapshots.put("key", {"literal": "${not.an.interpolation}"})
+    assert snapshots.get("key") is None
+
+
+def test_default_snapshot_dir_honours_xdg_cache_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_snapshot_dir() == tmp_path / "mxm-config"
+    assert SnapshotCache().directory == tmp_path / "mxm-config"
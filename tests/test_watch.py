@@ -0,0 +1,235 @@
+"""Tests for hot reload via `watch_config`."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from mxm.config import watch as watch_module
+from mxm.config.loader import cache_info
+from mxm.config.types import MXMConfig
+from mxm.config.watch import ConfigHandle, WatchMethod, _open_inotify, watch_config
+from tests.support import make_identity, write_file
+
+
+def _has_inotify() -> bool:
+    fd = _open_inotify(Path("."))
+    if fd is None:
+        return False
+    os.close(fd)
+    return True
+
+
+_HAS_INOTIFY = _has_inotify()
+
+METHODS = [
+    "poll",
+    pytest.param(
+        "inotify",
+        marks=pytest.mark.skipif(not _HAS_INOTIFY, reason="inotify unavailable"),
+    ),
+]
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _store(tmp_path: Path) -> Path:
+    app_root = tmp_path / "apps" / "mxm-moneymachine"
+    write_file(app_root / "default.yaml", "value: default\nshared: ${value}\n")
+    write_file(app_root / "environment.yaml", "dev:\n  value: environment\n")
+    write_file(app_root / "role.yaml", "marketdata:\n  other: role\n")
+    return app_root
+
+
+def _watch(
+    tmp_path: Path,
+    method: str,
+    callback: Callable[[MXMConfig], None] | None = None,
+) -> ConfigHandle:
+    return watch_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        callback=callback,
+        method=cast(WatchMethod, method),
+        debounce=0.05,
+        poll_interval=0.02,
+    )
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_change_is_picked_up(tmp_path: Path, method: str) -> None:
+    app_root = _store(tmp_path)
+
+    with _watch(tmp_path, method) as handle:
+        assert handle.method == method
+        assert handle.config.shared == "environment"
+
+        write_file(app_root / "environment.yaml", "dev:\n  value: updated\n")
+
+        assert _wait_for(lambda: handle.config.value == "updated")
+        assert handle.config.shared == "updated"
+
+    assert handle.closed
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_burst_of_writes_is_debounced(tmp_path: Path, method: str) -> None:
+    app_root = _store(tmp_path)
+    seen: list[MXMConfig] = []
+    marker_seen = threading.Event()
+
+    def _callback(cfg: MXMConfig) -> None:
+        seen.append(cfg)
+        if cfg.other == "marker":
+            marker_seen.set()
+
+    with _watch(tmp_path, method, callback=_callback):
+        write_file(app_root / "environment.yaml", "dev:\n  value: one\n")
+        write_file(app_root / "machine.yaml", "bridge:\n  value: two\n")
+        write_file(app_root / "role.yaml", "marketdata:\n  other: three\n")
+
+        assert _wait_for(lambda: len(seen) > 0)
+        # A later change is reloaded after any reload left over from the burst.
+        write_file(app_root / "role.yaml", "marketdata:\n  other: marker\n")
+        assert marker_seen.wait(5.0)
+
+    assert len(seen) == 2
+    assert seen[0].value == "two"
+    assert seen[0].other == "three"
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_close_from_callback(tmp_path: Path, method: str) -> None:
+    app_root = _store(tmp_path)
+    closed = threading.Event()
+    handle: ConfigHandle | None = None
+
+    def _callback(cfg: MXMConfig) -> None:
+        assert handle is not None
+        handle.close()
+        closed.set()
+
+    handle = _watch(tmp_path, method, callback=_callback)
+    thread = handle._thread  # pyright: ignore[reportPrivateUsage]
+    wake_r = handle._wake_r  # pyright: ignore[reportPrivateUsage]
+    write_file(app_root / "environment.yaml", "dev:\n  value: updated\n")
+
+    assert closed.wait(5.0)
+    assert thread is not None
+    thread.join(5.0)
+    assert not thread.is_alive()
+    assert handle.closed
+    assert handle.last_error is None
+    with pytest.raises(OSError):
+        os.fstat(wake_r)
+
+
+@pytest.mark.skipif(not _HAS_INOTIFY, reason="inotify unavailable")
+def test_directory_replaced_while_debouncing_switches_to_polling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_root = _store(tmp_path)
+    debouncing = threading.Event()
+    drain = watch_module._drain_inotify  # pyright: ignore[reportPrivateUsage]
+
+    def _drain(fd: int) -> tuple[bool, bool]:
+        result = drain(fd)
+        debouncing.set()
+        return result
+
+    monkeypatch.setattr(watch_module, "_drain_inotify", _drain)
+
+    with watch_config(
+        identity=make_identity(),
+        store_root=tmp_path,
+        method="inotify",
+        debounce=0.5,
+        poll_interval=0.02,
+    ) as handle:
+        write_file(app_root / "role.yaml", "marketdata:\n  other: changed\n")
+        assert debouncing.wait(5.0)
+        app_root.rename(app_root.with_name("old"))
+        _store(tmp_path)
+        write_file(app_root / "role.yaml", "marketdata:\n  other: replaced\n")
+
+        assert _wait_for(lambda: handle.config.other == "replaced")
+        assert handle.method == "poll"
+
+        write_file(app_root / "environment.yaml", "dev:\n  value: polled\n")
+        assert _wait_for(lambda: handle.config.value == "polled")
+
+
+def test_reload_reparses_only_changed_file(tmp_path: Path) -> None:
+    app_root = _store(tmp_path)
+
+    with _watch(tmp_path, "poll") as handle:
+        misses = cache_info().misses
+        write_file(app_root / "role.yaml", "marketdata:\n  other: updated\n")
+
+        assert _wait_for(lambda: handle.config.other == "updated")
+        assert cache_info().misses == misses + 1
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_failed_reload_keeps_previous_config(tmp_path: Path, method: str) -> None:
+    app_root = _store(tmp_path)
+
+    with _watch(tmp_path, method) as handle:
+        original = handle.config
+        write_file(app_root / "environment.yaml", "dev: [\n")
+
+        assert _wait_for(lambda: handle.last_error is not None)
+        assert handle.config is original
+
+        write_file(app_root / "environment.yaml", "dev:\n  value: fixed\n")
+
+        assert _wait_for(lambda: handle.config.value == "fixed")
+        assert handle.last_error is None
+
+
+def test_reload_without_changes_is_a_no_op(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    with _watch(tmp_path, "poll") as handle:
+        original = handle.config
+
+        assert handle.reload() is False
+        assert handle.config is original
+        assert handle.reload(force=True) is True
+        assert handle.config is not original
+
+
+def test_callback_errors_are_recorded(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    def _callback(cfg: MXMConfig) -> None:
+        raise RuntimeError("boom")
+
+    with _watch(tmp_path, "poll", callback=_callback) as handle:
+        assert handle.reload(force=True) is True
+        assert isinstance(handle.last_error, RuntimeError)
+
+
+def test_initial_load_errors_propagate(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        _watch(tmp_path, "poll")
+
+
+def test_unknown_method_is_rejected(tmp_path: Path) -> None:
+    _store(tmp_path)
+
+    with pytest.raises(ValueError, match="Unknown watch method"):
+        _watch(tmp_path, "fanotify")